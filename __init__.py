@@ -1,5 +1,18 @@
+from . import controllers
 from . import models
 from . import wizard
+from . import cli
+
+
+def post_init_hook(env):
+    """
+    Post-install hook for project_statistic module.
+
+    Builds the project contribution ledger (project.statistic.contribution) for all
+    projects with an analytic account, so the hook-driven recomputes can sum the
+    ledger right away.
+    """
+    env['project.statistic.contribution']._rebuild_all()
 
 
 def uninstall_hook(env):
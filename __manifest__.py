@@ -1,6 +1,6 @@
 {
     'name': 'Project Statistic',
-    'version': '18.0.1.2.1',
+    'version': '18.0.1.6.0',
     'category': 'Project',
     'summary': 'Enhanced project analytics with detailed invoice/bill breakdown',
     'description': """
@@ -30,8 +30,15 @@
     'license': 'LGPL-3',
     'data': [
         'security/ir.model.access.csv',
+        'security/project_statistic_security.xml',
         'data/ir_config_parameter.xml',
+        'data/ir_cron.xml',
         'wizard/refresh_financial_data_wizard_views.xml',
+        'wizard/project_statistic_export_wizard_views.xml',
+        'views/project_statistic_contribution_views.xml',
+        'views/project_statistic_refresh_job_views.xml',
+        'views/project_statistic_monthly_views.xml',
+        'views/project_statistic_report_views.xml',
         'views/hr_employee_views.xml',
         'views/project_analytics_views.xml',  # Must be loaded before menuitem.xml (defines actions)
         'data/menuitem.xml',  # Loaded last (references actions from views)
@@ -39,5 +46,6 @@
     'installable': True,
     'application': False,
     'auto_install': False,
+    'post_init_hook': 'post_init_hook',
     'uninstall_hook': 'uninstall_hook',
 }
@@ -0,0 +1 @@
+from . import project_statistic_rebuild
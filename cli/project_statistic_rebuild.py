@@ -0,0 +1,120 @@
+import logging
+import multiprocessing
+import optparse
+import sys
+import time
+from pathlib import Path
+
+from odoo import api, sql_db, SUPERUSER_ID
+from odoo.cli import Command
+from odoo.modules.registry import Registry
+from odoo.tools import config
+
+_logger = logging.getLogger(__name__)
+
+
+def _rebuild_chunk(dbname, project_ids):
+    """
+    Worker task: rebuild one chunk of projects (project.project _rebuild_chunk())
+    with its own registry and cursor, and commit it.
+
+    Returns:
+        tuple: (number of projects, number of ledger lines, seconds, error or None)
+    """
+    start = time.monotonic()
+    try:
+        registry = Registry(dbname)
+        with registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            line_count = env['project.project'].browse(project_ids)._rebuild_chunk()
+            # leaving the with block commits the chunk
+        return len(project_ids), line_count, time.monotonic() - start, None
+    except Exception as e:
+        _logger.error(f"Rebuild of projects {project_ids[0]}-{project_ids[-1]} failed: {e}", exc_info=True)
+        return len(project_ids), 0, time.monotonic() - start, str(e)
+
+
+class ProjectStatisticRebuild(Command):
+    """Rebuild the project statistics of all projects with a multi-process worker pool"""
+    name = 'project-statistic-rebuild'
+
+    def run(self, args):
+        """
+        odoo-bin project-statistic-rebuild -d <database> --workers N [--rebuild-chunk-size M]
+
+        Projects are partitioned into chunks; projects sharing an analytic
+        account always land in the same chunk, so no two processes rebuild the
+        contribution ledger of the same account concurrently. Each chunk is
+        recomputed in a separate process with its own registry and cursor and
+        committed on its own. --workers is Odoo's server option, reused here as
+        the pool size (0 = one process per CPU).
+        """
+        parser = config.parser
+        parser.prog = f'{Path(sys.argv[0]).name} {self.name}'
+        group = optparse.OptionGroup(parser, "Project Statistic Rebuild")
+        group.add_option(
+            '--rebuild-chunk-size', dest='rebuild_chunk_size', type='int', default=100,
+            help="Projects per chunk (one commit per chunk). Default: 100",
+        )
+        parser.add_option_group(group)
+        opt = config.parse_config(args, setup_logging=True)
+
+        dbname = config['db_name']
+        if isinstance(dbname, list):
+            dbname = dbname[0] if dbname else None
+        if not dbname:
+            sys.exit("Please specify the database with -d/--database")
+        workers = config['workers'] or multiprocessing.cpu_count()
+        chunk_size = max(1, opt.rebuild_chunk_size)
+
+        chunks = self._get_chunks(dbname, chunk_size)
+        total_projects = sum(len(chunk) for chunk in chunks)
+        print(f"Rebuilding {total_projects} project(s) in {len(chunks)} chunk(s) with {workers} worker(s)")
+
+        # Forked workers must not share the parent's database connections
+        sql_db.close_all()
+
+        start = time.monotonic()
+        done_projects = 0
+        done_lines = 0
+        failed = []
+        context = multiprocessing.get_context('fork')
+        with context.Pool(processes=workers) as pool:
+            tasks = [(dbname, chunk) for chunk in chunks]
+            for project_count, line_count, _seconds, error in pool.imap_unordered(_star_rebuild_chunk, tasks):
+                done_projects += project_count
+                done_lines += line_count
+                if error:
+                    failed.append(error)
+                elapsed = max(time.monotonic() - start, 1e-6)
+                print(
+                    f"  {done_projects}/{total_projects} projects "
+                    f"({done_projects / elapsed:.1f} projects/s, {done_lines / elapsed:.1f} lines/s)"
+                )
+
+        elapsed = time.monotonic() - start
+        print("=" * 80)
+        print("PROJECT STATISTIC REBUILD SUMMARY")
+        print("=" * 80)
+        print(f"Database:        {dbname}")
+        print(f"Workers:         {workers}")
+        print(f"Projects:        {done_projects} ({len(failed)} failed chunk(s))")
+        print(f"Ledger lines:    {done_lines}")
+        print(f"Elapsed:         {elapsed:.1f} s")
+        if elapsed:
+            print(f"Throughput:      {done_projects / elapsed:.1f} projects/s, {done_lines / elapsed:.1f} lines/s")
+        for error in failed:
+            print(f"  FAILED: {error}")
+        if failed:
+            sys.exit(1)
+
+    def _get_chunks(self, dbname, chunk_size):
+        """Partition all projects into chunks (project.project _get_rebuild_chunks())."""
+        with Registry(dbname).cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            return env['project.project']._get_rebuild_chunks(chunk_size)
+
+
+def _star_rebuild_chunk(task):
+    """imap_unordered() helper: unpack (dbname, project_ids)."""
+    return _rebuild_chunk(*task)
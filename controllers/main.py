@@ -0,0 +1,79 @@
+import tempfile
+
+from werkzeug.exceptions import BadRequest
+from werkzeug.wsgi import wrap_file
+
+from odoo import fields, http
+from odoo.http import content_disposition, request
+
+from ..metrics import METRICS
+from ..models.project_statistic_export import EXPORT_FORMATS
+
+
+class ProjectStatisticMetricsController(http.Controller):
+
+    @http.route('/project_statistic/metrics', type='http', auth='user', methods=['GET'])
+    def metrics(self, **kwargs):
+        """
+        Counters and phase timers of this worker process in the Prometheus text
+        exposition format. Restricted to administrators (Settings).
+        """
+        if not request.env.user.has_group('base.group_system'):
+            return request.not_found()
+        return request.make_response(
+            METRICS.to_prometheus(),
+            headers=[('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')],
+        )
+
+
+class ProjectStatisticExportController(http.Controller):
+
+    @http.route('/project_statistic/export/<string:file_format>', type='http', auth='user', methods=['GET'])
+    def export(self, file_format, date_from=None, date_to=None, company_ids=None, **kwargs):
+        """
+        Bulk export of the project statistic fields (see project.statistic.export).
+
+        The rows are written chunk by chunk to a temporary file and streamed
+        back from it, so neither the worker nor the response holds the whole
+        export in memory.
+
+        Query parameters:
+            date_from, date_to: Project runtime filter (YYYY-MM-DD, optional)
+            company_ids: Comma-separated company IDs (default: all companies of
+                         the user); restricted to the companies of the user
+        """
+        if file_format not in EXPORT_FORMATS:
+            return request.not_found()
+        try:
+            date_from = fields.Date.to_date(date_from) if date_from else None
+            date_to = fields.Date.to_date(date_to) if date_to else None
+            requested_company_ids = (
+                {int(company_id) for company_id in company_ids.split(',') if company_id}
+                if company_ids else set(request.env.user.company_ids.ids)
+            )
+        except ValueError:
+            raise BadRequest("Invalid date or company filter")
+        allowed_company_ids = sorted(requested_company_ids & set(request.env.user.company_ids.ids))
+
+        Export = request.env['project.statistic.export']
+        if allowed_company_ids:
+            # Record rules follow the allowed companies, not only the active ones
+            Export = Export.with_context(allowed_company_ids=allowed_company_ids)
+        fileobj = tempfile.TemporaryFile()
+        try:
+            Export._export(file_format, fileobj, Export._get_domain(date_from, date_to, allowed_company_ids))
+        except Exception:
+            fileobj.close()
+            raise
+        fileobj.seek(0)
+
+        extension, mimetype = EXPORT_FORMATS[file_format]
+        filename = f'project_statistic_{fields.Date.to_string(fields.Date.context_today(Export))}.{extension}'
+        # wrap_file streams the file in blocks and closes it when the response is done
+        return request.make_response(
+            wrap_file(request.httprequest.environ, fileobj),
+            headers=[
+                ('Content-Type', mimetype),
+                ('Content-Disposition', content_disposition(filename)),
+            ],
+        )
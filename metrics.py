@@ -0,0 +1,147 @@
+"""
+Low-overhead in-process metrics for the project statistic engine.
+
+Counters and phase timers are plain dict updates under a lock, cheap enough to
+stay enabled in production (unlike per-line logging). They are kept per worker
+process, like Odoo's own request statistics, and exposed:
+
+- as Prometheus text format on /project_statistic/metrics (controllers/main.py)
+- as a one-line summary per compute batch in the server log (format_summary())
+
+Per-line detail is only logged when the system parameter
+project_statistic.debug_metrics is set (see detail_enabled()).
+"""
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+PREFIX = 'project_statistic'
+
+# Help texts of the exposed metric families
+HELP = {
+    'phase_seconds': "Time spent per compute phase",
+    'lines_scanned_total': "Source lines read by the ledger statements",
+    'lines_matched_total': "Source lines that produced ledger rows",
+    'lines_skipped_total': "Source lines read but classified as excluded",
+    'ledger_rows_removed_total': "Ledger rows removed by hook syncs",
+    'hook_events_total': "Hook events by result (relevant or skipped)",
+    'hook_events_skipped_total': "Hook events dropped by the relevance filters, by reason",
+    'projects_computed_total': "Projects recomputed from the ledger",
+    'projects_without_account_total': "Projects skipped for lack of an analytic account on the Projects plan",
+    'projects_delta_updated_total': "Projects updated by ledger deltas",
+}
+
+
+class Metrics:
+    """Thread-safe counters and timers, keyed by (name, sorted labels)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)
+        self._timers = defaultdict(lambda: [0, 0.0])
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def increment(self, name, value=1, **labels):
+        """Add value to the counter name{labels}."""
+        if not value:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] += value
+
+    def observe(self, name, seconds, **labels):
+        """Record one duration for the timer name{labels}."""
+        key = self._key(name, labels)
+        with self._lock:
+            timer = self._timers[key]
+            timer[0] += 1
+            timer[1] += seconds
+
+    @contextmanager
+    def timer(self, phase, timings=None):
+        """
+        Time a block as phase_seconds{phase=...}.
+
+        Args:
+            phase: Phase label
+            timings: Optional dict collecting {phase: seconds} for a batch summary
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.observe('phase_seconds', seconds, phase=phase)
+            if timings is not None:
+                timings[phase] = timings.get(phase, 0.0) + seconds
+
+    def get_counter(self, name, **labels):
+        """Current value of a counter."""
+        with self._lock:
+            return self._counters.get(self._key(name, labels), 0.0)
+
+    def snapshot(self):
+        """
+        Returns:
+            tuple: ({(name, labels): value}, {(name, labels): (count, seconds)})
+        """
+        with self._lock:
+            return dict(self._counters), {key: tuple(value) for key, value in self._timers.items()}
+
+    def reset(self):
+        """Drop all values (tests)."""
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+    def to_prometheus(self):
+        """Render all metrics in the Prometheus text exposition format."""
+        counters, timers = self.snapshot()
+        lines = []
+        families = defaultdict(list)
+        for (name, labels), value in counters.items():
+            families[name].append((labels, value))
+        for name in sorted(families):
+            lines.append(f"# HELP {PREFIX}_{name} {HELP.get(name, name)}")
+            lines.append(f"# TYPE {PREFIX}_{name} counter")
+            for labels, value in sorted(families[name]):
+                lines.append(f"{PREFIX}_{name}{_format_labels(labels)} {value:g}")
+
+        timer_families = defaultdict(list)
+        for (name, labels), value in timers.items():
+            timer_families[name].append((labels, value))
+        for name in sorted(timer_families):
+            lines.append(f"# HELP {PREFIX}_{name} {HELP.get(name, name)}")
+            lines.append(f"# TYPE {PREFIX}_{name} summary")
+            for labels, (count, seconds) in sorted(timer_families[name]):
+                lines.append(f"{PREFIX}_{name}_count{_format_labels(labels)} {count}")
+                lines.append(f"{PREFIX}_{name}_sum{_format_labels(labels)} {seconds:.6f}")
+        return '\n'.join(lines) + '\n'
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    escaped = ','.join(
+        '{}="{}"'.format(key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in labels
+    )
+    return '{' + escaped + '}'
+
+
+def format_summary(timings):
+    """One-line batch summary: 'customer=1.2ms vendor=0.8ms ...'."""
+    return ' '.join(f"{phase}={seconds * 1000:.1f}ms" for phase, seconds in timings.items())
+
+
+def detail_enabled(env):
+    """True if per-line detail logging is switched on (project_statistic.debug_metrics)."""
+    value = env['project.statistic.cache']._get_settings()['debug_metrics']
+    return value.lower() in ('1', 'true', 'yes')
+
+
+METRICS = Metrics()
@@ -0,0 +1,12 @@
+from odoo import api, SUPERUSER_ID
+
+
+def migrate(cr, version):
+    """
+    Build the project contribution ledger introduced in 18.0.1.3.0 for all
+    existing projects.
+    """
+    if not version:
+        return
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    env['project.statistic.contribution']._rebuild_all()
@@ -0,0 +1,27 @@
+from odoo import api, SUPERUSER_ID
+
+
+def migrate(cr, version):
+    """
+    Since 18.0.1.5.0 foreign-currency invoices, bills and sales orders are
+    converted to the company currency. Rebuild the ledger of the analytic
+    accounts with foreign-currency journal items and recompute all projects
+    (sales orders are read at compute time).
+    """
+    if not version:
+        return
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    cr.execute("""
+        SELECT DISTINCT contribution.account_id
+          FROM project_statistic_contribution contribution
+          JOIN account_move_line line ON line.id = contribution.move_line_id
+         WHERE line.currency_id <> line.company_currency_id
+    """)
+    account_ids = [row[0] for row in cr.fetchall()]
+    env['project.statistic.contribution']._rebuild_for_accounts(account_ids)
+    projects = env['project.project'].search([])
+    env['project.statistic.monthly']._rebuild_for_projects(
+        env['project.project'].search([('account_id', 'in', account_ids)]).ids
+    )
+    projects.with_context(project_statistic_ledger_synced=True)._compute_financial_data()
+    env.flush_all()
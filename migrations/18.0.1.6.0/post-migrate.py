@@ -0,0 +1,12 @@
+from odoo import api, SUPERUSER_ID
+
+
+def migrate(cr, version):
+    """
+    Build the per-document breakdown introduced in 18.0.1.6.0 from the
+    existing contribution ledger.
+    """
+    if not version:
+        return
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    env['project.statistic.document']._rebuild_for_projects()
@@ -1,4 +1,19 @@
 from . import project_analytics
+from . import ir_config_parameter
 from . import account_move_line
 from . import account_analytic_line
-from . import hr_employee
\ No newline at end of file
+from . import account_move
+from . import hr_employee
+from . import project_statistic_contribution
+from . import project_statistic_recompute_queue
+from . import account_partial_reconcile
+from . import project_statistic_refresh_job
+from . import project_statistic_monthly
+from . import res_currency
+from . import project_statistic_report
+from . import project_statistic_cache
+from . import account_analytic_account
+from . import account_analytic_plan
+from . import project_statistic_document
+from . import project_statistic_export
+from . import account_account
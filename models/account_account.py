@@ -0,0 +1,37 @@
+from odoo import models, api
+
+from .project_statistic_contribution import CUSTOMER_SKONTO_PREFIXES, VENDOR_SKONTO_PREFIXES
+
+
+class AccountAccount(models.Model):
+    _inherit = 'account.account'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """
+        Override create to invalidate the cached Skonto accounts
+        (project.statistic.cache) when a Skonto account is created.
+        """
+        accounts = super().create(vals_list)
+        if any(account.code and account.code.startswith(CUSTOMER_SKONTO_PREFIXES + VENDOR_SKONTO_PREFIXES)
+               for account in accounts):
+            self.env['project.statistic.cache']._clear()
+        return accounts
+
+    def write(self, vals):
+        """
+        Override write to invalidate the cached Skonto accounts when an account
+        code changes (codes are company dependent, hence the code_store check).
+        """
+        result = super().write(vals)
+        if 'code' in vals or 'code_store' in vals:
+            self.env['project.statistic.cache']._clear()
+        return result
+
+    def unlink(self):
+        customer_ids, vendor_ids = self.env['project.statistic.cache']._get_skonto_account_ids()
+        is_skonto = bool(set(self.ids) & set(customer_ids + vendor_ids))
+        result = super().unlink()
+        if is_skonto:
+            self.env['project.statistic.cache']._clear()
+        return result
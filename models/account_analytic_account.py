@@ -0,0 +1,23 @@
+from odoo import models
+
+
+class AccountAnalyticAccount(models.Model):
+    _inherit = 'account.analytic.account'
+
+    def write(self, vals):
+        """
+        Override write to invalidate the cached analytic account -> project map
+        (project.statistic.cache) when an account moves to another plan.
+        """
+        result = super().write(vals)
+        if 'plan_id' in vals:
+            self.env['project.statistic.cache']._clear()
+        return result
+
+    def unlink(self):
+        project_plan_id = self.env['project.statistic.cache']._get_project_plan_id()
+        is_project_account = any(account.plan_id.id == project_plan_id for account in self)
+        result = super().unlink()
+        if is_project_account:
+            self.env['project.statistic.cache']._clear()
+        return result
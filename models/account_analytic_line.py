@@ -1,12 +1,67 @@
 from odoo import models, api
+from odoo.tools.sql import column_exists, create_index
+from collections import Counter
 import logging
 
 _logger = logging.getLogger(__name__)
 
+# Fields whose change can alter the contribution of an analytic line
+PROJECT_STATISTIC_WATCHED_FIELDS = ['account_id', 'unit_amount', 'amount', 'employee_id', 'is_timesheet', 'move_line_id', 'date']
+
 
 class AccountAnalyticLine(models.Model):
     _inherit = 'account.analytic.line'
 
+    def init(self):
+        """
+        Create the indexes supporting the project analytics lookups on account_analytic_line.
+        Runs on every module install/update; existing indexes are left untouched.
+        Indexes whose columns are not stored in this database are skipped.
+        """
+        super().init()
+        for index in self._get_project_statistic_indexes():
+            if all(column_exists(self.env.cr, self._table, column) for column in index['columns']):
+                create_index(
+                    self.env.cr, index['name'], self._table, index['expressions'],
+                    method=index['method'], where=index['where'],
+                )
+
+    @api.model
+    def _get_project_statistic_indexes(self):
+        """
+        Indexes shipped by project_statistic for account_analytic_line.
+
+        - (account_id, is_timesheet): Skonto lookups and generic per-account searches
+        - (account_id, employee_id) WHERE is_timesheet: timesheet hours/costs per project
+        - (account_id) WHERE amount < 0 AND NOT is_timesheet: other costs per project
+
+        Returns:
+            list: [{'name', 'expressions', 'columns', 'method', 'where'}, ...]
+        """
+        return [
+            {
+                'name': 'project_statistic_aal_account_timesheet_idx',
+                'expressions': ['account_id', 'is_timesheet'],
+                'columns': ['account_id', 'is_timesheet'],
+                'method': 'btree',
+                'where': '',
+            },
+            {
+                'name': 'project_statistic_aal_timesheet_employee_idx',
+                'expressions': ['account_id', 'employee_id'],
+                'columns': ['account_id', 'employee_id', 'is_timesheet'],
+                'method': 'btree',
+                'where': 'is_timesheet IS TRUE',
+            },
+            {
+                'name': 'project_statistic_aal_other_cost_idx',
+                'expressions': ['account_id'],
+                'columns': ['account_id', 'amount', 'is_timesheet'],
+                'method': 'btree',
+                'where': 'amount < 0 AND is_timesheet IS NOT TRUE',
+            },
+        ]
+
     @api.model_create_multi
     def create(self, vals_list):
         """
@@ -19,13 +74,17 @@ class AccountAnalyticLine(models.Model):
     def write(self, vals):
         """
         Override write to trigger project analytics recomputation when timesheets are modified.
-        Only triggers when relevant fields change.
+        Only triggers when relevant fields change, and only for lines whose
+        watched values actually differ afterwards.
         """
+        watched_fields = [key for key in PROJECT_STATISTIC_WATCHED_FIELDS if key in vals]
+        old_values = self._get_project_statistic_snapshot(watched_fields) if watched_fields else None
+
         result = super().write(vals)
 
         # Only trigger recompute if fields that affect project analytics changed
-        if any(key in vals for key in ['account_id', 'unit_amount', 'amount', 'employee_id', 'is_timesheet']):
-            self._trigger_project_analytics_recompute(self)
+        if watched_fields:
+            self._trigger_project_analytics_recompute(self, old_values=old_values)
 
         return result
 
@@ -34,27 +93,95 @@ class AccountAnalyticLine(models.Model):
         Override unlink to trigger project analytics recomputation when timesheets are deleted.
         """
         # Trigger BEFORE deletion so we can still access the data
-        self._trigger_project_analytics_recompute(self)
+        self._trigger_project_analytics_recompute(self, unlink=True)
         return super().unlink()
 
-    def _trigger_project_analytics_recompute(self, lines):
+    def _get_project_statistic_snapshot(self, field_names):
         """
-        Trigger recomputation of project analytics when analytic lines (timesheets) change.
+        Capture the watched values of the lines, to detect no-op writes.
+
+        Returns:
+            tuple: (field_names, {line_id: values})
+        """
+        return field_names, {
+            line.id: tuple(line[field_name] for field_name in field_names)
+            for line in self
+        }
+
+    def _filter_project_statistic_relevant(self, lines, old_values=None):
+        """
+        Drop hook events that cannot change any stored project figure.
+
+        A line is skipped (and counted by reason) when it
+        - had all watched values unchanged by the write ('unchanged'),
+        - is not booked on an analytic account linked to a project ('non_project_account'),
+        - falls into no ledger category, e.g. revenue lines or invoice analytic
+          lines that are counted via the journal items ('not_classified').
+        Lines that currently have ledger rows are always kept (unless
+        unchanged), since the change may have to remove their contribution.
 
         Args:
             lines: Recordset of account.analytic.line records that changed
+            old_values: Snapshot from _get_project_statistic_snapshot() (writes only)
+
+        Returns:
+            account.analytic.line recordset of the relevant lines
         """
-        if not lines:
-            return
+        ledger = self.env['project.statistic.contribution'].sudo()
+        skipped = Counter()
+
+        if old_values is not None:
+            field_names, values_by_line = old_values
+            changed = lines.browse([
+                line.id for line in lines
+                if tuple(line[field_name] for field_name in field_names) != values_by_line.get(line.id)
+            ])
+            skipped['unchanged'] = len(lines) - len(changed)
+            lines = changed
 
-        # Collect all unique analytic account IDs from the lines
-        analytic_account_ids = set()
+        lines_with_rows = ledger._get_lines_with_rows('analytic_line_id', lines.ids)
+        project_account_ids = ledger._get_project_account_ids(lines.account_id.ids)
+
+        relevant_ids = []
         for line in lines:
-            if line.account_id:
-                analytic_account_ids.add(line.account_id.id)
+            if line.id in lines_with_rows:
+                relevant_ids.append(line.id)
+            elif line.account_id.id not in project_account_ids:
+                skipped['non_project_account'] += 1
+            elif not ledger._classify_analytic_line(line)[0]:
+                skipped['not_classified'] += 1
+            else:
+                relevant_ids.append(line.id)
+
+        ledger._count_skipped_events(self._name, skipped, relevant=len(relevant_ids))
+        return lines.browse(relevant_ids)
 
-        if not analytic_account_ids:
+    def _trigger_project_analytics_recompute(self, lines, unlink=False, old_values=None):
+        """
+        Trigger recomputation of project analytics when analytic lines (timesheets) change.
+
+        The lines are only registered in a per-transaction dirty set; the ledger
+        sync and the project update run once at commit time (see
+        project.project _register_contribution_changes()), so importing many
+        timesheets updates each project exactly once.
+
+        Args:
+            lines: Recordset of account.analytic.line records that changed
+            unlink: True if the lines are about to be deleted (their ledger rows are
+                    removed right away, while the lines still exist)
+            old_values: Watched values before a write (see _filter_project_statistic_relevant())
+        """
+        if not lines:
             return
 
-        # Use shared helper method from project.project model
-        self.env['project.project'].trigger_recompute_for_analytic_accounts(analytic_account_ids)
+        if not unlink:
+            lines = self._filter_project_statistic_relevant(lines, old_values)
+            if not lines:
+                return
+
+        Project = self.env['project.project']
+        if unlink:
+            deltas = self.env['project.statistic.contribution'].sudo()._remove_analytic_lines(lines.ids)
+            Project._register_contribution_changes(deltas=deltas)
+        else:
+            Project._register_contribution_changes(analytic_line_ids=lines.ids)
@@ -0,0 +1,14 @@
+from odoo import models
+
+
+class AccountAnalyticPlan(models.Model):
+    _inherit = 'account.analytic.plan'
+
+    def unlink(self):
+        """
+        Override unlink to invalidate the cached Projects plan and analytic
+        account -> project map (project.statistic.cache).
+        """
+        result = super().unlink()
+        self.env['project.statistic.cache']._clear()
+        return result
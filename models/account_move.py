@@ -0,0 +1,73 @@
+from odoo import models, fields, _
+from odoo.exceptions import UserError
+from odoo.tools import SQL
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class AccountMove(models.Model):
+    _inherit = 'account.move'
+
+    project_statistic_account_id = fields.Many2one(
+        'account.analytic.account',
+        string='Project Analytic Account',
+        compute='_compute_project_statistic_account_id',
+        search='_search_project_statistic_account_id',
+        help="Search-only: moves with a posted journal item distributed to this analytic account."
+    )
+
+    def _compute_project_statistic_account_id(self):
+        # Only used in domains (see _search_project_statistic_account_id)
+        self.project_statistic_account_id = False
+
+    def _search_project_statistic_account_id(self, operator, value):
+        """
+        Find the moves with a posted journal item carrying one of the analytic
+        accounts as a key of its analytic_distribution.
+
+        The subquery uses the jsonb key-existence operator ?|, which is served
+        by the GIN index on account_move_line.analytic_distribution (see
+        account.move.line _get_project_statistic_indexes()). The domain stays a
+        subquery, so list views count and paginate in the database instead of
+        receiving a materialized list of move IDs.
+
+        Args:
+            operator: '=' or 'in'
+            value: analytic account ID, or list of IDs
+
+        Returns:
+            list: Domain on account.move
+        """
+        if operator not in ('=', 'in'):
+            raise UserError(_("Operation not supported on Project Analytic Account: %s", operator))
+        account_ids = value if isinstance(value, (list, tuple)) else [value]
+        keys = [str(account_id) for account_id in account_ids if account_id]
+        if not keys:
+            return [('id', '=', False)]
+        self.env['account.move.line'].flush_model(['analytic_distribution', 'parent_state', 'move_id'])
+        return [('id', 'in', SQL(
+            """
+            SELECT line.move_id
+              FROM account_move_line line
+             WHERE line.analytic_distribution ?| %s::text[]
+               AND line.parent_state = 'posted'
+            """,
+            keys,
+        ))]
+
+    def write(self, vals):
+        """
+        Override write to keep project analytics in sync when invoices/bills change state.
+
+        Posting, resetting to draft and cancelling only write 'state' on the move;
+        the parent_state of the lines changes without a write on account.move.line,
+        so the line hooks would not notice it.
+        """
+        result = super().write(vals)
+
+        if any(key in vals for key in ['state', 'date', 'reversed_entry_id']):
+            lines = self.line_ids
+            lines._trigger_project_analytics_recompute(lines)
+
+        return result
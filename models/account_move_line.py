@@ -1,12 +1,64 @@
 from odoo import models, api
+from odoo.tools.sql import column_exists, create_index
+from collections import Counter
 import logging
 
+from .project_statistic_contribution import INVOICE_MOVE_TYPES
+
 _logger = logging.getLogger(__name__)
 
+# Fields whose change can alter the contribution of a journal item
+PROJECT_STATISTIC_WATCHED_FIELDS = ['analytic_distribution', 'price_subtotal', 'price_total', 'debit', 'credit', 'balance']
+
 
 class AccountMoveLine(models.Model):
     _inherit = 'account.move.line'
 
+    def init(self):
+        """
+        Create the indexes supporting the project analytics lookups on account_move_line.
+        Runs on every module install/update; existing indexes are left untouched.
+        """
+        super().init()
+        for index in self._get_project_statistic_indexes():
+            if all(column_exists(self.env.cr, self._table, column) for column in index['columns']):
+                create_index(
+                    self.env.cr, index['name'], self._table, index['expressions'],
+                    method=index['method'], where=index['where'],
+                )
+
+    @api.model
+    def _get_project_statistic_indexes(self):
+        """
+        Indexes shipped by project_statistic for account_move_line.
+
+        - GIN on analytic_distribution (default jsonb_ops operator class): lets the
+          per-account lookups use the ? / ?| key-existence operators. jsonb_path_ops
+          would be smaller but only supports @> containment, which needs the
+          percentage as well and is therefore useless for key lookups.
+        - Partial btree on (parent_state, move_id) for lines carrying a distribution:
+          covers the posted-state filter and the join to account_move.move_type.
+
+        Returns:
+            list: [{'name', 'expressions', 'columns', 'method', 'where'}, ...]
+        """
+        return [
+            {
+                'name': 'project_statistic_aml_analytic_distribution_gin',
+                'expressions': ['analytic_distribution'],
+                'columns': ['analytic_distribution'],
+                'method': 'gin',
+                'where': 'analytic_distribution IS NOT NULL',
+            },
+            {
+                'name': 'project_statistic_aml_state_move_idx',
+                'expressions': ['parent_state', 'move_id'],
+                'columns': ['analytic_distribution', 'parent_state', 'move_id'],
+                'method': 'btree',
+                'where': 'analytic_distribution IS NOT NULL',
+            },
+        ]
+
     @api.model_create_multi
     def create(self, vals_list):
         """
@@ -20,13 +72,17 @@ class AccountMoveLine(models.Model):
     def write(self, vals):
         """
         Override write to trigger project analytics recomputation.
-        Only triggers when relevant fields change.
+        Only triggers when relevant fields change, and only for lines whose
+        watched values actually differ afterwards.
         """
+        watched_fields = [key for key in PROJECT_STATISTIC_WATCHED_FIELDS if key in vals]
+        old_values = self._get_project_statistic_snapshot(watched_fields) if watched_fields else None
+
         result = super().write(vals)
 
         # Only trigger recompute if fields that affect project analytics changed
-        if any(key in vals for key in ['analytic_distribution', 'price_subtotal', 'price_total', 'debit', 'credit', 'balance']):
-            self._trigger_project_analytics_recompute(self)
+        if watched_fields:
+            self._trigger_project_analytics_recompute(self, old_values=old_values)
 
         return result
 
@@ -36,42 +92,104 @@ class AccountMoveLine(models.Model):
         Captures project IDs before deletion.
         """
         # Trigger BEFORE deletion so we can still access the data
-        self._trigger_project_analytics_recompute(self)
+        self._trigger_project_analytics_recompute(self, unlink=True)
         return super().unlink()
 
-    def _trigger_project_analytics_recompute(self, lines):
+    def _get_project_statistic_snapshot(self, field_names):
         """
-        Trigger recomputation of project analytics when move lines with analytic distribution change.
+        Capture the watched values of the lines, to detect no-op writes.
+
+        Returns:
+            tuple: (field_names, {line_id: values})
+        """
+        return field_names, {
+            line.id: tuple(line[field_name] for field_name in field_names)
+            for line in self
+        }
+
+    def _filter_project_statistic_relevant(self, lines, old_values=None):
+        """
+        Drop hook events that cannot change any stored project figure.
+
+        A line is skipped (and counted by reason) when it
+        - had all watched values unchanged by the write ('unchanged'),
+        - is a section or note line ('section_note'),
+        - belongs to a move that is not posted ('draft'),
+        - is not on an invoice, credit note or bill ('non_invoice_move'),
+        - has no distribution key on a project analytic account ('non_project_plan').
+        Lines that currently have ledger rows are always kept (unless
+        unchanged), since the change may have to remove their contribution.
 
         Args:
             lines: Recordset of account.move.line records that changed
-        """
-        if not lines:
-            return
+            old_values: Snapshot from _get_project_statistic_snapshot() (writes only)
 
-        # Filter lines that have analytic distribution
-        lines_with_distribution = lines.filtered(lambda l: l.analytic_distribution)
+        Returns:
+            account.move.line recordset of the relevant lines
+        """
+        ledger = self.env['project.statistic.contribution'].sudo()
+        skipped = Counter()
+
+        if old_values is not None:
+            field_names, values_by_line = old_values
+            changed = lines.browse([
+                line.id for line in lines
+                if tuple(line[field_name] for field_name in field_names) != values_by_line.get(line.id)
+            ])
+            skipped['unchanged'] = len(lines) - len(changed)
+            lines = changed
+
+        lines_with_rows = ledger._get_lines_with_rows('move_line_id', lines.ids)
+        distribution_keys = {key for line in lines for key in (line.analytic_distribution or {})}
+        project_account_ids = ledger._get_project_account_ids(
+            int(key) for key in distribution_keys if key.isdigit()
+        )
+
+        relevant_ids = []
+        for line in lines:
+            if line.id in lines_with_rows:
+                relevant_ids.append(line.id)
+            elif line.display_type in ('line_section', 'line_note'):
+                skipped['section_note'] += 1
+            elif line.parent_state != 'posted':
+                skipped['draft'] += 1
+            elif line.move_id.move_type not in INVOICE_MOVE_TYPES:
+                skipped['non_invoice_move'] += 1
+            elif not any(key.isdigit() and int(key) in project_account_ids
+                         for key in (line.analytic_distribution or {})):
+                skipped['non_project_plan'] += 1
+            else:
+                relevant_ids.append(line.id)
+
+        ledger._count_skipped_events(self._name, skipped, relevant=len(relevant_ids))
+        return lines.browse(relevant_ids)
+
+    def _trigger_project_analytics_recompute(self, lines, unlink=False, old_values=None):
+        """
+        Trigger recomputation of project analytics when move lines with analytic distribution change.
 
-        if not lines_with_distribution:
-            return
+        The lines are only registered in a per-transaction dirty set; the ledger
+        sync and the project update run once at commit time (see
+        project.project _register_contribution_changes()), however often the
+        lines are written in between.
 
-        # Collect all analytic account IDs from analytic_distribution
-        analytic_account_ids = set()
-
-        for line in lines_with_distribution:
-            try:
-                for analytic_account_id_str in line.analytic_distribution.keys():
-                    try:
-                        analytic_account_id = int(analytic_account_id_str)
-                        analytic_account_ids.add(analytic_account_id)
-                    except (ValueError, TypeError):
-                        continue
-            except Exception as e:
-                _logger.warning(f"Error parsing analytic_distribution for line {line.id}: {e}")
-                continue
-
-        if not analytic_account_ids:
+        Args:
+            lines: Recordset of account.move.line records that changed
+            unlink: True if the lines are about to be deleted (their ledger rows are
+                    removed right away, while the lines still exist)
+            old_values: Watched values before a write (see _filter_project_statistic_relevant())
+        """
+        if not lines:
             return
 
-        # Use shared helper method from project.project model
-        self.env['project.project'].trigger_recompute_for_analytic_accounts(analytic_account_ids)
+        if not unlink:
+            lines = self._filter_project_statistic_relevant(lines, old_values)
+            if not lines:
+                return
+
+        Project = self.env['project.project']
+        if unlink:
+            deltas = self.env['project.statistic.contribution'].sudo()._remove_move_lines(lines.ids)
+            Project._register_contribution_changes(deltas=deltas)
+        else:
+            Project._register_contribution_changes(move_line_ids=lines.ids)
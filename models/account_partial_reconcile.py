@@ -0,0 +1,48 @@
+from odoo import models, api
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class AccountPartialReconcile(models.Model):
+    _inherit = 'account.partial.reconcile'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """
+        Override create to refresh the paid figures of reconciled invoices/bills.
+        """
+        partials = super().create(vals_list)
+        self._trigger_project_payment_refresh(partials)
+        return partials
+
+    def unlink(self):
+        """
+        Override unlink to refresh the paid figures of unreconciled invoices/bills.
+        Captures the moves before deletion.
+        """
+        self._trigger_project_payment_refresh(self)
+        return super().unlink()
+
+    def _trigger_project_payment_refresh(self, partials):
+        """
+        Register the invoices/bills on both sides of the partials for a payment
+        refresh at commit time.
+
+        A reconciliation only changes amount_residual of the moves, so only the
+        paid and outstanding figures of their projects are updated (see
+        project.statistic.contribution _refresh_payment_ratios()). Moves without
+        ledger rows (e.g. the payment entries themselves) are a no-op there.
+
+        Args:
+            partials: Recordset of account.partial.reconcile records
+        """
+        if not partials:
+            return
+
+        moves = partials.debit_move_id.move_id | partials.credit_move_id.move_id
+        invoices = moves.filtered(lambda m: m.is_invoice(include_receipts=False))
+        if not invoices:
+            return
+
+        self.env['project.project']._register_contribution_changes(payment_move_ids=invoices.ids)
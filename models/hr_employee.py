@@ -10,3 +10,48 @@ class HrEmployee(models.Model):
         help="Hourly Forecast Correction Factor. This factor is used to adjust the booked hours for this employee. "
              "Default is 1.0 (no adjustment). For example, 0.8 means 80% of booked hours count towards adjusted calculations."
     )
+
+    def write(self, vals):
+        """
+        Override write to propagate HFC factor changes to the projects the
+        employees booked time on.
+        """
+        old_factors = {employee.id: employee.faktor_hfc or 1.0 for employee in self} if 'faktor_hfc' in vals else None
+
+        result = super().write(vals)
+
+        if old_factors is not None:
+            self._propagate_faktor_hfc_change(old_factors)
+
+        return result
+
+    def _propagate_faktor_hfc_change(self, old_factors):
+        """
+        Shift the adjusted hours of the affected projects by the factor change.
+
+        Reads the (analytic account, employee) hours matrix from the timesheet
+        rows of the contribution ledger - no timesheet rescan - and registers
+        adjusted_hours deltas = hours x (new factor - old factor). Only
+        total_hours_booked_adjusted and the fields derived from it
+        (labor_costs_adjusted, current_calculated_profit_loss) change.
+
+        Args:
+            old_factors: {employee_id: factor before the write (0/empty as 1.0)}
+        """
+        factor_changes = {
+            employee.id: (employee.faktor_hfc or 1.0) - old_factors[employee.id]
+            for employee in self
+            if (employee.faktor_hfc or 1.0) != old_factors[employee.id]
+        }
+        if not factor_changes:
+            return
+
+        ledger = self.env['project.statistic.contribution'].sudo()
+        ledger._mark_employee_months_dirty(list(factor_changes))
+        deltas = {}
+        for (account_id, employee_id), hours in ledger._get_employee_hours(list(factor_changes)).items():
+            delta = deltas.setdefault((account_id, 'timesheet'), ledger._get_empty_delta())
+            delta['adjusted_hours'] += hours * factor_changes[employee_id]
+
+        if deltas:
+            self.env['project.project']._register_contribution_changes(deltas=deltas)
@@ -0,0 +1,35 @@
+from odoo import models, api
+
+# System parameters that only feed the rate dependent project fields
+RATE_PARAMETERS = (
+    'project_statistic.general_hourly_rate',
+    'project_statistic.vendor_bill_surcharge_factor',
+)
+
+
+class IrConfigParameter(models.Model):
+    _inherit = 'ir.config_parameter'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """
+        Override create to re-derive the rate dependent project fields when a
+        rate parameter is created.
+        """
+        params = super().create(vals_list)
+        if any(vals.get('key') in RATE_PARAMETERS for vals in vals_list):
+            self.env['project.project'].sudo()._rederive_rate_dependent_fields()
+        return params
+
+    def write(self, vals):
+        """
+        Override write to re-derive the rate dependent project fields whenever
+        the hourly rate or the vendor bill surcharge factor changes.
+        """
+        rate_changed = 'value' in vals and any(
+            param.key in RATE_PARAMETERS and param.value != vals['value'] for param in self
+        )
+        result = super().write(vals)
+        if rate_changed:
+            self.env['project.project'].sudo()._rederive_rate_dependent_fields()
+        return result
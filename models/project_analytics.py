@@ -1,9 +1,48 @@
 from odoo import models, fields, api, _
+from itertools import groupby
 import logging
-import json
+
+from ..metrics import METRICS, detail_enabled, format_summary
 
 _logger = logging.getLogger(__name__)
 
+# Base fields shifted by a ledger delta, per contribution category:
+# {category: [(project field, delta key), ...]}
+CONTRIBUTION_DELTA_FIELDS = {
+    'invoice': [
+        ('customer_invoices_net', 'amount_net'),
+        ('customer_invoiced_amount_net', 'amount_net'),
+        ('customer_invoiced_amount_gross', 'amount_gross'),
+        ('customer_paid_amount_net', 'paid_net'),
+        ('customer_paid_amount_gross', 'paid_gross'),
+    ],
+    'credit_note': [
+        ('customer_credit_notes_net', 'amount_net'),
+        ('customer_invoiced_amount_net', 'amount_net'),
+        ('customer_invoiced_amount_gross', 'amount_gross'),
+        ('customer_paid_amount_net', 'paid_net'),
+        ('customer_paid_amount_gross', 'paid_gross'),
+    ],
+    'bill': [
+        ('vendor_bills_net', 'amount_net'),
+        ('vendor_bills_total_net', 'amount_net'),
+        ('vendor_bills_total_gross', 'amount_gross'),
+    ],
+    'refund': [
+        ('vendor_credit_notes_net', 'amount_net'),
+        ('vendor_bills_total_net', 'amount_net'),
+        ('vendor_bills_total_gross', 'amount_gross'),
+    ],
+    'skonto_customer': [('customer_skonto_taken', 'amount_net')],
+    'skonto_vendor': [('vendor_skonto_received', 'amount_net')],
+    'timesheet': [
+        ('total_hours_booked', 'hours'),
+        ('labor_costs', 'amount_net'),
+        ('total_hours_booked_adjusted', 'adjusted_hours'),
+    ],
+    'other_cost': [('other_costs_net', 'amount_net')],
+}
+
 
 class ProjectAnalytics(models.Model):
     _inherit = 'project.project'
@@ -285,6 +324,45 @@ class ProjectAnalytics(models.Model):
              "This provides real-time profitability including cost adjustments."
     )
 
+    # Per-document breakdown of the figures above (stored, see project.statistic.document)
+    statistic_document_ids = fields.One2many(
+        'project.statistic.document',
+        'project_id',
+        string='Document Breakdown',
+        readonly=True,
+        help="Invoices, bills and other documents the project figures are made of, "
+             "with their weighted NET/GROSS amount and paid share. Timesheets and "
+             "other costs without a document are summed per type."
+    )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """
+        Override create to invalidate the cached analytic account -> project map
+        (project.statistic.cache) when a created project has an analytic account.
+        """
+        projects = super().create(vals_list)
+        if any(project.account_id for project in projects):
+            self.env['project.statistic.cache']._clear()
+        return projects
+
+    def write(self, vals):
+        """
+        Override write to invalidate the cached analytic account -> project map
+        when a project changes its analytic account or is (un)archived.
+        """
+        result = super().write(vals)
+        if 'account_id' in vals or 'active' in vals:
+            self.env['project.statistic.cache']._clear()
+        return result
+
+    def unlink(self):
+        has_account = any(project.account_id for project in self)
+        result = super().unlink()
+        if has_account:
+            self.env['project.statistic.cache']._clear()
+        return result
+
     @api.depends('has_analytic_account')
     def _compute_analytic_status_display(self):
         """
@@ -370,71 +448,70 @@ class ProjectAnalytics(models.Model):
 
         This ensures data is always synchronized with Odoo's accounting engine.
         """
-        # Cache system parameters and project plan ONCE for all projects (performance optimization)
-        general_hourly_rate = float(
-            self.env['ir.config_parameter'].sudo().get_param(
-                'project_statistic.general_hourly_rate', default='66.0'
-            )
-        )
-        vendor_bill_surcharge_factor = float(
-            self.env['ir.config_parameter'].sudo().get_param(
-                'project_statistic.vendor_bill_surcharge_factor', default='1.30'
+        # System parameters and project plan from the metadata cache, ONCE for all projects
+        cache = self.env['project.statistic.cache']
+        settings = cache._get_settings()
+        general_hourly_rate = settings['general_hourly_rate']
+        vendor_bill_surcharge_factor = settings['vendor_bill_surcharge_factor']
+        project_plan = self.env['account.analytic.plan'].browse(cache._get_project_plan_id())
+
+        # Phase durations of this batch, logged as one summary line at the end
+        timings = {}
+
+        # Resolve the analytic account of every project first, so that each source
+        # (invoices, bills, analytic lines) is read ONCE for the whole recordset
+        # instead of once per project. Projects sharing an analytic account reuse
+        # the same per-account result.
+        project_accounts = {
+            project.id: self._get_project_analytic_account(project, project_plan)
+            for project in self
+        }
+        analytic_accounts = self.env['account.analytic.account'].browse({
+            account.id for account in project_accounts.values() if account
+        })
+
+        # Re-derive the contribution ledger of these accounts from the source lines.
+        # The hooks keep the ledger in sync line by line and skip this full rebuild
+        # (context key 'project_statistic_ledger_synced').
+        if not self.env.context.get('project_statistic_ledger_synced'):
+            self.env['project.statistic.contribution'].sudo().with_context(
+                project_statistic_timings=timings
+            )._rebuild_for_accounts(analytic_accounts.ids)
+            with METRICS.timer('monthly_aggregates', timings):
+                self.env['project.statistic.monthly'].sudo()._rebuild_for_projects(self.ids)
+            with METRICS.timer('document_breakdown', timings):
+                self.env['project.statistic.document'].sudo()._rebuild_for_projects(self.ids)
+
+        # The figures below reflect the current ledger, so deltas of this
+        # transaction that are already in the ledger must not be applied again
+        pending = self.env.cr.precommit.data.get('project_statistic.pending')
+        if pending:
+            for key in [key for key in pending['deltas'] if key[0] in analytic_accounts.ids]:
+                del pending['deltas'][key]
+
+        # All categories in one grouped ledger read, split up by the batch helpers
+        Ledger = self.env['project.statistic.contribution']
+        with METRICS.timer('ledger_totals', timings):
+            totals = Ledger._get_totals(
+                analytic_accounts.ids, [key for key, _label in Ledger._fields['category'].selection]
             )
-        )
-        project_plan = self.env.ref('analytic.analytic_plan_projects', raise_if_not_found=False)
+        with METRICS.timer('sales_orders', timings):
+            sales_order_by_project = self._get_sales_order_data_batch()
+        with METRICS.timer('customer', timings):
+            customer_by_account = self._get_customer_invoices_batch(analytic_accounts, totals)
+        with METRICS.timer('vendor', timings):
+            vendor_by_account = self._get_vendor_bills_batch(analytic_accounts, totals)
+        with METRICS.timer('skonto', timings):
+            skonto_by_account = self._get_skonto_batch(analytic_accounts, totals)
+        with METRICS.timer('timesheet', timings):
+            timesheet_by_account = self._get_timesheet_costs_batch(analytic_accounts, totals)
+        with METRICS.timer('other_costs', timings):
+            other_costs_by_account = self._get_other_costs_batch(analytic_accounts, totals)
 
         for project in self:
-            # Initialize all fields
-            customer_invoiced_amount_net = 0.0
-            customer_paid_amount_net = 0.0
-            customer_outstanding_amount_net = 0.0
-            customer_invoiced_amount_gross = 0.0
-            customer_paid_amount_gross = 0.0
-            customer_outstanding_amount_gross = 0.0
-            customer_invoices_net = 0.0
-            customer_credit_notes_net = 0.0
-
-            vendor_bills_total_net = 0.0
-            vendor_bills_total_gross = 0.0
-            vendor_bills_net = 0.0
-            vendor_credit_notes_net = 0.0
-            adjusted_vendor_bill_amount = 0.0
-
-            customer_skonto_taken = 0.0
-            vendor_skonto_received = 0.0
-
-            sale_order_amount_net = 0.0
-            sale_order_tax_names = ''
-            has_sales_orders = False
-
-            total_hours_booked = 0.0
-            labor_costs = 0.0
-            other_costs_net = 0.0
-            total_costs_net = 0.0
-
-            profit_loss_net = 0.0
-            negative_difference_net = 0.0
-            current_calculated_profit_loss = 0.0
-
-            # Get the analytic account for this project (simplified logic)
-            analytic_account = project.account_id
-
-            # Verify it belongs to the projects plan (if plan exists)
-            if analytic_account and project_plan and analytic_account.plan_id != project_plan:
-                _logger.warning(
-                    f"Project '{project.name}' analytic account is not on Projects plan "
-                    f"(Plan: {analytic_account.plan_id.name if analytic_account.plan_id else 'None'})"
-                )
-                analytic_account = None
+            analytic_account = project_accounts[project.id]
 
             if not analytic_account:
-                _logger.warning(
-                    f"Project '{project.name}' (ID: {project.id}) has no analytic account linked. "
-                    f"Financial data cannot be calculated. Please ensure: "
-                    f"1) Analytic Accounting is enabled in Accounting settings, "
-                    f"2) This project has an analytic account assigned (Projects plan), "
-                    f"3) Invoice/bill lines have analytic_distribution set."
-                )
                 # Set status fields
                 project.has_analytic_account = False
                 project.data_availability_status = 'no_analytic_account'
@@ -468,7 +545,7 @@ class ProjectAnalytics(models.Model):
                 continue
 
             # 1. Calculate Customer Invoices (Revenue) - Both NET and GROSS
-            customer_data = self._get_customer_invoices_from_analytic(analytic_account)
+            customer_data = customer_by_account[analytic_account.id]
             customer_invoiced_amount_net = customer_data['invoiced_net']
             customer_paid_amount_net = customer_data['paid_net']
             customer_invoiced_amount_gross = customer_data['invoiced_gross']
@@ -477,69 +554,54 @@ class ProjectAnalytics(models.Model):
             customer_credit_notes_net = customer_data['credit_notes_net']
 
             # 2. Calculate Vendor Bills (Direct Costs) - Both NET and GROSS
-            vendor_data = self._get_vendor_bills_from_analytic(analytic_account)
+            vendor_data = vendor_by_account[analytic_account.id]
             vendor_bills_total_net = vendor_data['total_net']
             vendor_bills_total_gross = vendor_data['total_gross']
             vendor_bills_net = vendor_data['bills_net']
             vendor_credit_notes_net = vendor_data['credit_notes_net']
 
             # 3. Calculate Skonto (Cash Discounts) from analytic lines
-            skonto_data = self._get_skonto_from_analytic(analytic_account)
+            skonto_data = skonto_by_account[analytic_account.id]
             customer_skonto_taken = skonto_data['customer_skonto']
             vendor_skonto_received = skonto_data['vendor_skonto']
 
             # 3a. Calculate Sales Order data (confirmed orders linked to project)
-            sales_order_data = self._get_sales_order_data(project)
+            sales_order_data = sales_order_by_project[project.id]
             sale_order_amount_net = sales_order_data['amount_net']
             sale_order_tax_names = sales_order_data['tax_names']
             has_sales_orders = sales_order_data['has_sales_orders']
 
             # 4. Calculate Labor Costs (Timesheets) - NET amount
-            timesheet_data = self._get_timesheet_costs(analytic_account)
+            timesheet_data = timesheet_by_account[analytic_account.id]
             total_hours_booked = timesheet_data['hours']
             labor_costs = timesheet_data['costs']
             total_hours_booked_adjusted = timesheet_data['adjusted_hours']
 
-            # 4a. Calculate Adjusted Labor Costs using general hourly rate from system parameters
-            general_hourly_rate = float(
-                self.env['ir.config_parameter'].sudo().get_param(
-                    'project_statistic.general_hourly_rate', default='66.0'
-                )
-            )
-            labor_costs_adjusted = total_hours_booked_adjusted * general_hourly_rate
-
-            # 4b. Calculate Adjusted Vendor Bill Amount using surcharge factor from system parameters
-            vendor_bill_surcharge_factor = float(
-                self.env['ir.config_parameter'].sudo().get_param(
-                    'project_statistic.vendor_bill_surcharge_factor', default='1.30'
-                )
-            )
-            adjusted_vendor_bill_amount = vendor_bills_total_net * vendor_bill_surcharge_factor
-
             # 5. Calculate Other Costs (non-timesheet, non-bill analytic lines) - NET amount
-            other_costs_net = self._get_other_costs_from_analytic(analytic_account)
-
-            # 6. Calculate totals
-            customer_outstanding_amount_net = customer_invoiced_amount_net - customer_paid_amount_net
-            customer_outstanding_amount_gross = customer_invoiced_amount_gross - customer_paid_amount_gross
-
-            total_costs_net = labor_costs + other_costs_net
-
-            # 7. Calculate Profit/Loss - NET basis (consistent comparison)
-            # Formula: (Revenue NET - Customer Skonto) - (Vendor Bills NET - Vendor Skonto + Internal Costs NET)
-            # This ensures we're comparing NET revenue to NET costs (apples to apples)
-            adjusted_revenue_net = customer_invoiced_amount_net - customer_skonto_taken
-            adjusted_vendor_costs_net = vendor_bills_total_net - vendor_skonto_received
-            profit_loss_net = adjusted_revenue_net - (adjusted_vendor_costs_net + total_costs_net)
-            negative_difference_net = abs(min(0, profit_loss_net))
-
-            # 8. Calculate Current Calculated Profit/Loss using adjusted cost components
-            # Formula: Total Invoiced - Adjusted Vendor Bills - Adjusted Labor Costs - Adjusted Other Costs
-            current_calculated_profit_loss = (
-                customer_invoiced_amount_net
-                - adjusted_vendor_bill_amount
-                - labor_costs_adjusted
-                - other_costs_net
+            other_costs_net = other_costs_by_account[analytic_account.id]
+
+            base_values = {
+                'customer_invoiced_amount_net': customer_invoiced_amount_net,
+                'customer_paid_amount_net': customer_paid_amount_net,
+                'customer_invoiced_amount_gross': customer_invoiced_amount_gross,
+                'customer_paid_amount_gross': customer_paid_amount_gross,
+                'customer_invoices_net': customer_invoices_net,
+                'customer_credit_notes_net': customer_credit_notes_net,
+                'vendor_bills_total_net': vendor_bills_total_net,
+                'vendor_bills_total_gross': vendor_bills_total_gross,
+                'vendor_bills_net': vendor_bills_net,
+                'vendor_credit_notes_net': vendor_credit_notes_net,
+                'customer_skonto_taken': customer_skonto_taken,
+                'vendor_skonto_received': vendor_skonto_received,
+                'total_hours_booked': total_hours_booked,
+                'labor_costs': labor_costs,
+                'total_hours_booked_adjusted': total_hours_booked_adjusted,
+                'other_costs_net': other_costs_net,
+            }
+
+            # 4a/4b and 6-8. Adjusted costs, totals and Profit/Loss
+            derived_values = self._get_derived_financial_values(
+                base_values, general_hourly_rate, vendor_bill_surcharge_factor
             )
 
             # Update status fields (data available)
@@ -547,44 +609,248 @@ class ProjectAnalytics(models.Model):
             project.data_availability_status = 'available'
 
             # Update all computed fields
-            project.customer_invoiced_amount_net = customer_invoiced_amount_net
-            project.customer_paid_amount_net = customer_paid_amount_net
-            project.customer_outstanding_amount_net = customer_outstanding_amount_net
-            project.customer_invoiced_amount_gross = customer_invoiced_amount_gross
-            project.customer_paid_amount_gross = customer_paid_amount_gross
-            project.customer_outstanding_amount_gross = customer_outstanding_amount_gross
-            project.customer_invoices_net = customer_invoices_net
-            project.customer_credit_notes_net = customer_credit_notes_net
-
-            project.vendor_bills_total_net = vendor_bills_total_net
-            project.vendor_bills_total_gross = vendor_bills_total_gross
-            project.vendor_bills_net = vendor_bills_net
-            project.vendor_credit_notes_net = vendor_credit_notes_net
-            project.adjusted_vendor_bill_amount = adjusted_vendor_bill_amount
-
-            project.customer_skonto_taken = customer_skonto_taken
-            project.vendor_skonto_received = vendor_skonto_received
+            project.update(base_values)
+            project.update(derived_values)
 
             project.sale_order_amount_net = sale_order_amount_net
             project.sale_order_tax_names = sale_order_tax_names
             project.has_sales_orders = has_sales_orders
 
-            project.total_hours_booked = total_hours_booked
-            project.labor_costs = labor_costs
-            project.total_hours_booked_adjusted = total_hours_booked_adjusted
-            project.labor_costs_adjusted = labor_costs_adjusted
-            project.other_costs_net = other_costs_net
-            project.total_costs_net = total_costs_net
+        without_account = sum(1 for account in project_accounts.values() if not account)
+        METRICS.increment('projects_computed_total', len(self) - without_account)
+        METRICS.increment('projects_without_account_total', without_account)
+        if without_account and not detail_enabled(self.env):
+            _logger.warning(
+                f"{without_account} project(s) have no analytic account on the Projects plan, "
+                f"financial data cannot be calculated for them "
+                f"(set project_statistic.debug_metrics to log each project)"
+            )
+        _logger.info(
+            f"Computed financial data of {len(self)} project(s) / {len(analytic_accounts)} analytic "
+            f"account(s): {format_summary(timings)}"
+        )
+
+    @api.model
+    def _get_derived_financial_values(self, base_values, general_hourly_rate, vendor_bill_surcharge_factor):
+        """
+        Derive the adjusted, total and Profit/Loss fields from the base quantities.
+
+        Shared by the full compute and the incremental (delta) updates, so both
+        always apply the same formulas.
+
+        Args:
+            base_values: dict with the base fields (see _get_financial_base_fields())
+            general_hourly_rate: float - project_statistic.general_hourly_rate
+            vendor_bill_surcharge_factor: float - project_statistic.vendor_bill_surcharge_factor
+
+        Returns:
+            dict: Values of the derived fields
+        """
+        # 4a. Calculate Adjusted Labor Costs using general hourly rate from system parameters
+        labor_costs_adjusted = base_values['total_hours_booked_adjusted'] * general_hourly_rate
+
+        # 4b. Calculate Adjusted Vendor Bill Amount using surcharge factor from system parameters
+        adjusted_vendor_bill_amount = base_values['vendor_bills_total_net'] * vendor_bill_surcharge_factor
+
+        # 6. Calculate totals
+        customer_outstanding_amount_net = base_values['customer_invoiced_amount_net'] - base_values['customer_paid_amount_net']
+        customer_outstanding_amount_gross = base_values['customer_invoiced_amount_gross'] - base_values['customer_paid_amount_gross']
+
+        total_costs_net = base_values['labor_costs'] + base_values['other_costs_net']
+
+        # 7. Calculate Profit/Loss - NET basis (consistent comparison)
+        # Formula: (Revenue NET - Customer Skonto) - (Vendor Bills NET - Vendor Skonto + Internal Costs NET)
+        # This ensures we're comparing NET revenue to NET costs (apples to apples)
+        adjusted_revenue_net = base_values['customer_invoiced_amount_net'] - base_values['customer_skonto_taken']
+        adjusted_vendor_costs_net = base_values['vendor_bills_total_net'] - base_values['vendor_skonto_received']
+        profit_loss_net = adjusted_revenue_net - (adjusted_vendor_costs_net + total_costs_net)
+        negative_difference_net = abs(min(0, profit_loss_net))
+
+        # 8. Calculate Current Calculated Profit/Loss using adjusted cost components
+        # Formula: Total Invoiced - Adjusted Vendor Bills - Adjusted Labor Costs - Adjusted Other Costs
+        current_calculated_profit_loss = (
+            base_values['customer_invoiced_amount_net']
+            - adjusted_vendor_bill_amount
+            - labor_costs_adjusted
+            - base_values['other_costs_net']
+        )
+
+        return {
+            'labor_costs_adjusted': labor_costs_adjusted,
+            'adjusted_vendor_bill_amount': adjusted_vendor_bill_amount,
+            'customer_outstanding_amount_net': customer_outstanding_amount_net,
+            'customer_outstanding_amount_gross': customer_outstanding_amount_gross,
+            'total_costs_net': total_costs_net,
+            'profit_loss_net': profit_loss_net,
+            'negative_difference_net': negative_difference_net,
+            'current_calculated_profit_loss': current_calculated_profit_loss,
+        }
+
+    @api.model
+    def _rederive_rate_dependent_fields(self, project_ids=None):
+        """
+        Re-derive the fields that depend on the hourly rate or the vendor bill
+        surcharge factor, for all projects in ONE set-based UPDATE.
+
+        labor_costs_adjusted, adjusted_vendor_bill_amount and
+        current_calculated_profit_loss only depend on stored base quantities
+        and the two system parameters, so a rate change needs no recompute.
+        Same formulas as _get_derived_financial_values() (steps 4a, 4b and 8).
+
+        Args:
+            project_ids: Restrict to these projects (default: all projects with data)
+
+        Returns:
+            int: Number of projects updated
+        """
+        settings = self.env['project.statistic.cache']._get_settings()
+        general_hourly_rate = settings['general_hourly_rate']
+        vendor_bill_surcharge_factor = settings['vendor_bill_surcharge_factor']
+
+        where = "data_availability_status = 'available'"
+        params = [general_hourly_rate, vendor_bill_surcharge_factor,
+                  vendor_bill_surcharge_factor, general_hourly_rate]
+        if project_ids is not None:
+            if not project_ids:
+                return 0
+            where += " AND id = ANY(%s)"
+            params.append(list(project_ids))
+
+        self.flush_model()
+        self.env.cr.execute(f"""
+            UPDATE project_project
+               SET labor_costs_adjusted = COALESCE(total_hours_booked_adjusted, 0.0) * %s,
+                   adjusted_vendor_bill_amount = COALESCE(vendor_bills_total_net, 0.0) * %s,
+                   current_calculated_profit_loss = COALESCE(customer_invoiced_amount_net, 0.0)
+                                                  - COALESCE(vendor_bills_total_net, 0.0) * %s
+                                                  - COALESCE(total_hours_booked_adjusted, 0.0) * %s
+                                                  - COALESCE(other_costs_net, 0.0)
+             WHERE {where}
+        """, params)
+        count = self.env.cr.rowcount
+        self.invalidate_model([
+            'labor_costs_adjusted', 'adjusted_vendor_bill_amount', 'current_calculated_profit_loss',
+        ])
+        _logger.info(
+            f"Re-derived rate dependent fields for {count} project(s) "
+            f"(hourly rate {general_hourly_rate:.2f}, surcharge factor {vendor_bill_surcharge_factor:.2f})"
+        )
+        return count
+
+    @api.model
+    def _get_financial_base_fields(self):
+        """
+        Stored fields holding base quantities summed from the contribution ledger.
+        All other financial fields are derived from them (_get_derived_financial_values()).
+        """
+        return [
+            'customer_invoiced_amount_net', 'customer_paid_amount_net',
+            'customer_invoiced_amount_gross', 'customer_paid_amount_gross',
+            'customer_invoices_net', 'customer_credit_notes_net',
+            'vendor_bills_total_net', 'vendor_bills_total_gross',
+            'vendor_bills_net', 'vendor_credit_notes_net',
+            'customer_skonto_taken', 'vendor_skonto_received',
+            'total_hours_booked', 'labor_costs', 'total_hours_booked_adjusted',
+            'other_costs_net',
+        ]
+
+    def get_financial_figures_for_period(self, date_from=None, date_to=None):
+        """
+        Revenue, cost, labor and Profit/Loss figures of the projects for a date
+        range, summed from the monthly aggregates (project.statistic.monthly)
+        instead of the source lines.
+
+        The range is applied to whole months: every month overlapping
+        [date_from, date_to] counts. Without bounds the result equals the
+        stored lifetime fields.
+
+        Args:
+            date_from: First date (inclusive), or None
+            date_to: Last date (inclusive), or None
+
+        Returns:
+            dict: {project_id: {field_name: value}} with the base fields
+                  (_get_financial_base_fields()) and the derived fields
+                  (_get_derived_financial_values()) for the period
+        """
+        cache = self.env['project.statistic.cache']
+        settings = cache._get_settings()
+        general_hourly_rate = settings['general_hourly_rate']
+        vendor_bill_surcharge_factor = settings['vendor_bill_surcharge_factor']
+        project_plan = self.env['account.analytic.plan'].browse(cache._get_project_plan_id())
+
+        totals = self.env['project.statistic.monthly'].sudo()._get_totals(self.ids, date_from, date_to)
+        base_fields = self._get_financial_base_fields()
 
-            project.profit_loss_net = profit_loss_net
-            project.negative_difference_net = negative_difference_net
-            project.current_calculated_profit_loss = current_calculated_profit_loss
+        results = {}
+        for project in self:
+            base_values = dict.fromkeys(base_fields, 0.0)
+            if self._get_project_analytic_account(project, project_plan):
+                for category, total in totals.get(project.id, {}).items():
+                    for field_name, key in CONTRIBUTION_DELTA_FIELDS.get(category, []):
+                        base_values[field_name] += total[key]
+            values = dict(base_values)
+            values.update(self._get_derived_financial_values(
+                base_values, general_hourly_rate, vendor_bill_surcharge_factor
+            ))
+            results[project.id] = values
+        return results
+
+    def _get_project_analytic_account(self, project, project_plan):
+        """
+        Return the analytic account used for the financial data of a project.
+
+        The account must belong to the Projects plan (if that plan exists).
+        Returns None when the project cannot be evaluated.
+
+        Args:
+            project: project.project record
+            project_plan: account.analytic.plan record of the Projects plan (or None)
+        """
+        analytic_account = project.account_id
+
+        # Verify it belongs to the projects plan (if plan exists)
+        # Per-project warnings only with project_statistic.debug_metrics, otherwise
+        # _compute_financial_data() logs one summary line per batch
+        if analytic_account and project_plan and analytic_account.plan_id != project_plan:
+            if detail_enabled(self.env):
+                _logger.warning(
+                    f"Project '{project.name}' analytic account is not on Projects plan "
+                    f"(Plan: {analytic_account.plan_id.name if analytic_account.plan_id else 'None'})"
+                )
+            analytic_account = None
+
+        if not analytic_account:
+            if detail_enabled(self.env):
+                _logger.warning(
+                    f"Project '{project.name}' (ID: {project.id}) has no analytic account linked. "
+                    f"Financial data cannot be calculated. Please ensure: "
+                    f"1) Analytic Accounting is enabled in Accounting settings, "
+                    f"2) This project has an analytic account assigned (Projects plan), "
+                    f"3) Invoice/bill lines have analytic_distribution set."
+                )
+            return None
+
+        return analytic_account
 
     def _get_customer_invoices_from_analytic(self, analytic_account):
+        """
+        Get customer invoices and credit notes for a single analytic account.
+
+        Thin wrapper around _get_customer_invoices_batch() - see there for details.
+        """
+        return self._get_customer_invoices_batch(analytic_account)[analytic_account.id]
+
+    def _get_customer_invoices_batch(self, analytic_accounts, totals=None):
         """
         Get customer invoices and credit notes via analytic_distribution in account.move.line.
         This is the Odoo v18 way to link invoices to projects.
 
+        BATCH MODE: Summed from the contribution ledger (project.statistic.contribution)
+        for all given analytic accounts in one grouped query. Every line's
+        analytic_distribution was fanned out to all project accounts it references
+        when the ledger rows were derived.
+
         IMPORTANT: We calculate BOTH NET and GROSS amounts:
         - NET: price_subtotal (base amount without taxes)
         - GROSS: price_total (total amount including all taxes)
@@ -596,107 +862,74 @@ class ProjectAnalytics(models.Model):
         - out_invoice: Customer invoices (positive revenue)
         - out_refund: Customer credit notes (negative revenue)
 
+        Args:
+            analytic_accounts: Recordset of account.analytic.account
+            totals: Ledger totals from _get_totals() covering these accounts (optional,
+                    read here if not given)
+
         Returns:
-            dict: {
+            dict: {analytic_account_id: {
                 'invoiced_net': float,
                 'paid_net': float,
                 'invoiced_gross': float,
                 'paid_gross': float,
                 'invoices_net': float,  # Only out_invoice (positive)
                 'credit_notes_net': float,  # Only out_refund (negative)
-            }
+            }}
         """
-        result = {
-            'invoiced_net': 0.0,
-            'paid_net': 0.0,
-            'invoiced_gross': 0.0,
-            'paid_gross': 0.0,
-            'invoices_net': 0.0,
-            'credit_notes_net': 0.0,
+        results = {
+            account_id: {
+                'invoiced_net': 0.0,
+                'paid_net': 0.0,
+                'invoiced_gross': 0.0,
+                'paid_gross': 0.0,
+                'invoices_net': 0.0,
+                'credit_notes_net': 0.0,
+            }
+            for account_id in analytic_accounts.ids
         }
+        if not results:
+            return results
 
-        # Find all posted customer invoice/credit note lines with this analytic account
-        # RELAXED FILTER: Removed account_type filter to catch all invoice lines
-        # German accounting (SKR03/SKR04) might use different account types
-        invoice_lines = self.env['account.move.line'].search([
-            ('analytic_distribution', '!=', False),
-            ('parent_state', '=', 'posted'),
-            ('move_id.move_type', 'in', ['out_invoice', 'out_refund']),
-            ('display_type', 'not in', ['line_section', 'line_note']),  # Exclude section/note lines
-        ])
-
-        _logger.info(f"Found {len(invoice_lines)} potential invoice lines (before analytic filter)")
-
-        matched_lines = 0
-        for line in invoice_lines:
-            if not line.analytic_distribution:
+        if totals is None:
+            totals = self.env['project.statistic.contribution']._get_totals(
+                list(results), ['invoice', 'credit_note']
+            )
+        for (account_id, category), total in totals.items():
+            if category not in ('invoice', 'credit_note') or account_id not in results:
                 continue
+            result = results[account_id]
 
-            # Skip reversal entries (Storno) - they cancel out the original entry
-            # In Odoo 18, only reversed_entry_id exists (reversal_move_id was removed)
-            if line.move_id.reversed_entry_id:
-                continue
+            # Separate tracking for invoices vs credit notes
+            # (credit notes are already negative in the ledger)
+            if category == 'invoice':
+                result['invoices_net'] += total['amount_net']
+            elif category == 'credit_note':
+                result['credit_notes_net'] += total['amount_net']
 
-            # Parse the analytic_distribution JSON
-            try:
-                distribution = line.analytic_distribution
-                if isinstance(distribution, str):
-                    distribution = json.loads(distribution)
-
-                # Check if this project's analytic account is in the distribution
-                if str(analytic_account.id) in distribution:
-                    matched_lines += 1
-                    # Get the percentage allocated to this project for THIS LINE
-                    percentage = distribution.get(str(analytic_account.id), 0.0) / 100.0
-
-                    # Get the invoice to calculate payment proportion
-                    invoice = line.move_id
-
-                    # Calculate this line's contribution to the project
-                    # NET: price_subtotal (without taxes)
-                    line_amount_net = line.price_subtotal * percentage
-                    # GROSS: price_total (with taxes)
-                    line_amount_gross = line.price_total * percentage
-
-                    # Separate tracking for invoices vs credit notes
-                    if invoice.move_type == 'out_invoice':
-                        # Regular invoices: positive amounts
-                        result['invoices_net'] += line_amount_net
-                    elif invoice.move_type == 'out_refund':
-                        # Credit notes: store as negative amounts
-                        result['credit_notes_net'] += -abs(line_amount_net)
-                        # For total calculation, make credit notes negative
-                        line_amount_net = -abs(line_amount_net)
-                        line_amount_gross = -abs(line_amount_gross)
-
-                    result['invoiced_net'] += line_amount_net
-                    result['invoiced_gross'] += line_amount_gross
-
-                    _logger.info(f"  - Invoice {invoice.name}: NET={line_amount_net:.2f}, GROSS={line_amount_gross:.2f}, Account={line.account_id.code} ({line.account_id.account_type})")
-
-                    # Calculate paid amount for this line
-                    # Payment proportion = (invoice.amount_total - invoice.amount_residual) / invoice.amount_total
-                    if abs(invoice.amount_total) > 0:
-                        payment_ratio = (invoice.amount_total - invoice.amount_residual) / invoice.amount_total
-                        line_paid_net = line_amount_net * payment_ratio
-                        line_paid_gross = line_amount_gross * payment_ratio
-                        result['paid_net'] += line_paid_net
-                        result['paid_gross'] += line_paid_gross
+            result['invoiced_net'] += total['amount_net']
+            result['invoiced_gross'] += total['amount_gross']
+            result['paid_net'] += total['paid_net']
+            result['paid_gross'] += total['paid_gross']
 
-            except Exception as e:
-                _logger.warning(f"Error parsing analytic_distribution for line {line.id}: {e}")
-                continue
+        return results
 
-        _logger.info(f"Matched {matched_lines} invoice lines for analytic account {analytic_account.id}")
-        _logger.info(f"Result: NET invoiced={result['invoiced_net']:.2f}, GROSS invoiced={result['invoiced_gross']:.2f}")
+    def _get_vendor_bills_from_analytic(self, analytic_account):
+        """
+        Get vendor bills and refunds for a single analytic account.
 
-        return result
+        Thin wrapper around _get_vendor_bills_batch() - see there for details.
+        """
+        return self._get_vendor_bills_batch(analytic_account)[analytic_account.id]
 
-    def _get_vendor_bills_from_analytic(self, analytic_account):
+    def _get_vendor_bills_batch(self, analytic_accounts, totals=None):
         """
         Get vendor bills and refunds via analytic_distribution in account.move.line.
         This is the Odoo v18 way to link bills to projects.
 
+        BATCH MODE: Summed from the contribution ledger (project.statistic.contribution)
+        for all given analytic accounts in one grouped query.
+
         IMPORTANT: We calculate BOTH NET and GROSS amounts:
         - NET: price_subtotal (base amount without taxes)
         - GROSS: price_total (total amount including all taxes)
@@ -708,96 +941,69 @@ class ProjectAnalytics(models.Model):
         - in_invoice: Vendor bills (positive cost)
         - in_refund: Vendor refunds (negative cost)
 
+        Args:
+            analytic_accounts: Recordset of account.analytic.account
+            totals: Ledger totals from _get_totals() covering these accounts (optional,
+                    read here if not given)
+
         Returns:
-            dict: {
+            dict: {analytic_account_id: {
                 'total_net': float,
                 'total_gross': float,
                 'bills_net': float,  # Only in_invoice (positive)
                 'credit_notes_net': float,  # Only in_refund (negative)
-            }
+            }}
         """
-        result = {
-            'total_net': 0.0,
-            'total_gross': 0.0,
-            'bills_net': 0.0,
-            'credit_notes_net': 0.0,
+        results = {
+            account_id: {
+                'total_net': 0.0,
+                'total_gross': 0.0,
+                'bills_net': 0.0,
+                'credit_notes_net': 0.0,
+            }
+            for account_id in analytic_accounts.ids
         }
+        if not results:
+            return results
 
-        # Find all posted vendor bill/refund lines with this analytic account
-        # RELAXED FILTER: Removed account_type filter to catch all bill lines
-        # German accounting (SKR03/SKR04) might use different account types
-        bill_lines = self.env['account.move.line'].search([
-            ('analytic_distribution', '!=', False),
-            ('parent_state', '=', 'posted'),
-            ('move_id.move_type', 'in', ['in_invoice', 'in_refund']),
-            ('display_type', 'not in', ['line_section', 'line_note']),  # Exclude section/note lines
-        ])
-
-        _logger.info(f"Found {len(bill_lines)} potential bill lines (before analytic filter)")
-
-        matched_lines = 0
-        for line in bill_lines:
-            if not line.analytic_distribution:
+        if totals is None:
+            totals = self.env['project.statistic.contribution']._get_totals(
+                list(results), ['bill', 'refund']
+            )
+        for (account_id, category), total in totals.items():
+            if category not in ('bill', 'refund') or account_id not in results:
                 continue
+            result = results[account_id]
 
-            # Skip reversal entries (Storno) - they cancel out the original entry
-            # In Odoo 18, only reversed_entry_id exists (reversal_move_id was removed)
-            if line.move_id.reversed_entry_id:
-                continue
+            # Separate tracking for bills vs refunds
+            # (refunds are already negative in the ledger)
+            if category == 'bill':
+                result['bills_net'] += total['amount_net']
+            elif category == 'refund':
+                result['credit_notes_net'] += total['amount_net']
 
-            # Parse the analytic_distribution JSON
-            try:
-                distribution = line.analytic_distribution
-                if isinstance(distribution, str):
-                    distribution = json.loads(distribution)
-
-                # Check if this project's analytic account is in the distribution
-                if str(analytic_account.id) in distribution:
-                    matched_lines += 1
-                    # Get the percentage allocated to this project for THIS LINE
-                    percentage = distribution.get(str(analytic_account.id), 0.0) / 100.0
-
-                    # Get the bill to check type
-                    bill = line.move_id
-
-                    # Calculate this line's contribution to the project
-                    # NET: price_subtotal (without taxes)
-                    line_amount_net = line.price_subtotal * percentage
-                    # GROSS: price_total (with taxes)
-                    line_amount_gross = line.price_total * percentage
-
-                    # Separate tracking for bills vs refunds
-                    if bill.move_type == 'in_invoice':
-                        # Regular vendor bills: positive amounts
-                        result['bills_net'] += line_amount_net
-                    elif bill.move_type == 'in_refund':
-                        # Vendor refunds: store as negative amounts
-                        result['credit_notes_net'] += -abs(line_amount_net)
-                        # For total calculation, make refunds negative
-                        line_amount_net = -abs(line_amount_net)
-                        line_amount_gross = -abs(line_amount_gross)
-
-                    result['total_net'] += line_amount_net
-                    result['total_gross'] += line_amount_gross
-
-                    _logger.info(f"  - Bill {bill.name}: NET={line_amount_net:.2f}, GROSS={line_amount_gross:.2f}, Account={line.account_id.code} ({line.account_id.account_type})")
+            result['total_net'] += total['amount_net']
+            result['total_gross'] += total['amount_gross']
 
-            except Exception as e:
-                _logger.warning(f"Error parsing analytic_distribution for bill line {line.id}: {e}")
-                continue
+        return results
 
-        _logger.info(f"Matched {matched_lines} bill lines for analytic account {analytic_account.id}")
-        _logger.info(f"Result: NET bills={result['total_net']:.2f}, GROSS bills={result['total_gross']:.2f}")
+    def _get_skonto_from_analytic(self, analytic_account):
+        """
+        Get Skonto (cash discounts) for a single analytic account.
 
-        return result
+        Thin wrapper around _get_skonto_batch() - see there for details.
+        """
+        return self._get_skonto_batch(analytic_account)[analytic_account.id]
 
-    def _get_skonto_from_analytic(self, analytic_account):
+    def _get_skonto_batch(self, analytic_accounts, totals=None):
         """
         Get Skonto (cash discounts) by querying analytic lines from discount accounts.
 
         This is a simpler and more reliable approach than analyzing reconciliation.
         Skonto entries are typically posted to specific accounts with analytic distribution.
 
+        BATCH MODE: Summed from the contribution ledger for all given analytic accounts.
+
         Customer Skonto (Gewährte Skonti):
         - Accounts 7300-7303 (expense - reduces profit)
         - Account 2130 (liability account for customer discounts)
@@ -806,68 +1012,91 @@ class ProjectAnalytics(models.Model):
         - Accounts 4730-4733 (income - increases profit)
         - Account 2670 (asset account for vendor discounts)
 
+        Args:
+            analytic_accounts: Recordset of account.analytic.account
+            totals: Ledger totals from _get_totals() covering these accounts (optional,
+                    read here if not given)
+
         Returns:
-            dict: {'customer_skonto': amount, 'vendor_skonto': amount}
+            dict: {analytic_account_id: {'customer_skonto': amount, 'vendor_skonto': amount}}
         """
-        result = {'customer_skonto': 0.0, 'vendor_skonto': 0.0}
-
-        # Get all analytic lines for this account
-        analytic_lines = self.env['account.analytic.line'].search([
-            ('account_id', '=', analytic_account.id)
-        ])
-
-        for line in analytic_lines:
-            if not line.move_line_id or not line.move_line_id.account_id:
-                continue
+        results = {
+            account_id: {'customer_skonto': 0.0, 'vendor_skonto': 0.0}
+            for account_id in analytic_accounts.ids
+        }
+        if not results:
+            return results
 
-            account_code = line.move_line_id.account_id.code
-            if not account_code:
+        if totals is None:
+            totals = self.env['project.statistic.contribution']._get_totals(
+                list(results), ['skonto_customer', 'skonto_vendor']
+            )
+        for (account_id, category), total in totals.items():
+            if account_id not in results:
                 continue
+            # Customer Skonto reduces our revenue/profit (customer got discount)
+            if category == 'skonto_customer':
+                results[account_id]['customer_skonto'] += total['amount_net']
+            # Vendor Skonto increases our profit (we got discount from vendor)
+            elif category == 'skonto_vendor':
+                results[account_id]['vendor_skonto'] += total['amount_net']
 
-            # Customer Skonto (Gewährte Skonti) - expense accounts 7300-7303 + liability 2130
-            # These reduce our revenue/profit (customer got discount)
-            if account_code.startswith(('7300', '7301', '7302', '7303', '2130')):
-                result['customer_skonto'] += abs(line.amount)
+        return results
 
-            # Vendor Skonto (Erhaltene Skonti) - income accounts 4730-4733 + asset 2670
-            # These increase our profit (we got discount from vendor)
-            elif account_code.startswith(('4730', '4731', '4732', '4733', '2670')):
-                result['vendor_skonto'] += abs(line.amount)
+    def _get_timesheet_costs(self, analytic_account):
+        """
+        Get timesheet hours and costs for a single analytic account.
 
-        return result
+        Thin wrapper around _get_timesheet_costs_batch() - see there for details.
+        """
+        return self._get_timesheet_costs_batch(analytic_account)[analytic_account.id]
 
-    def _get_timesheet_costs(self, analytic_account):
+    def _get_timesheet_costs_batch(self, analytic_accounts, totals=None):
         """
         Get timesheet hours and costs from account.analytic.line.
         Timesheets have is_timesheet=True.
 
         Returns NET amounts (timesheets don't have VAT).
         Also calculates adjusted hours based on employee HFC factors.
-        """
-        result = {'hours': 0.0, 'costs': 0.0, 'adjusted_hours': 0.0}
 
-        # Find all timesheet lines for this analytic account
-        timesheet_lines = self.env['account.analytic.line'].search([
-            ('account_id', '=', analytic_account.id),
-            ('is_timesheet', '=', True)
-        ])
+        BATCH MODE: Summed from the contribution ledger for all given analytic accounts.
+        Adjusted hours use the current employee HFC factors at read time.
 
-        for line in timesheet_lines:
-            hours = line.unit_amount or 0.0
-            result['hours'] += hours
-            result['costs'] += abs(line.amount or 0.0)
+        Args:
+            analytic_accounts: Recordset of account.analytic.account
+            totals: Ledger totals from _get_totals() covering these accounts (optional,
+                    read here if not given)
 
-            # Calculate adjusted hours using employee HFC factor
-            if line.employee_id and hasattr(line.employee_id, 'faktor_hfc'):
-                faktor_hfc = line.employee_id.faktor_hfc or 1.0
-                result['adjusted_hours'] += hours * faktor_hfc
-            else:
-                # If no employee or no HFC factor, use 1.0 (no adjustment)
-                result['adjusted_hours'] += hours
+        Returns:
+            dict: {analytic_account_id: {'hours': float, 'costs': float, 'adjusted_hours': float}}
+        """
+        results = {
+            account_id: {'hours': 0.0, 'costs': 0.0, 'adjusted_hours': 0.0}
+            for account_id in analytic_accounts.ids
+        }
+        if not results:
+            return results
 
-        return result
+        if totals is None:
+            totals = self.env['project.statistic.contribution']._get_totals(list(results), ['timesheet'])
+        for (account_id, category), total in totals.items():
+            if category != 'timesheet' or account_id not in results:
+                continue
+            results[account_id]['hours'] += total['hours']
+            results[account_id]['costs'] += total['amount_net']
+            results[account_id]['adjusted_hours'] += total['adjusted_hours']
+
+        return results
 
     def _get_other_costs_from_analytic(self, analytic_account):
+        """
+        Get other costs for a single analytic account.
+
+        Thin wrapper around _get_other_costs_batch() - see there for details.
+        """
+        return self._get_other_costs_batch(analytic_account)[analytic_account.id]
+
+    def _get_other_costs_batch(self, analytic_accounts, totals=None):
         """
         Get other costs from analytic lines that are NOT already counted elsewhere.
 
@@ -875,8 +1104,10 @@ class ProjectAnalytics(models.Model):
         INTEGRATION WITH ODOO V18 ENTERPRISE ACCOUNTING
         ==============================================================================
 
-        This method reads from account.analytic.line and carefully excludes all
-        entries that are already counted in other categories to prevent double-counting.
+        The analytic lines are classified once into the contribution ledger (see
+        project.statistic.contribution._insert_analytic_line_rows()), which carefully
+        excludes all entries that are already counted in other categories to
+        prevent double-counting.
 
         EXCLUDED (already counted elsewhere):
         -------------------------------------
@@ -918,56 +1149,28 @@ class ProjectAnalytics(models.Model):
           b) Monthly deferral entries (move_type='entry') → Excluded here ✓
         - This ensures the cost is counted ONCE, not once per deferral period
 
-        Returns NET amounts (negative values converted to positive).
-        """
-        other_costs = 0.0
-
-        # Skonto account codes (to exclude from other costs as they're counted separately)
-        skonto_account_codes = ['7300', '7301', '7302', '7303', '2130', '4730', '4731', '4732', '4733', '2670']
-
-        # Find all cost lines (negative amounts, not timesheets)
-        # First get all potential cost lines
-        cost_lines = self.env['account.analytic.line'].search([
-            ('account_id', '=', analytic_account.id),
-            ('amount', '<', 0),
-            ('is_timesheet', '=', False)
-        ])
-
-        _logger.debug(f"Analyzing other costs for account {analytic_account.id} ({analytic_account.name})")
+        BATCH MODE: Summed from the contribution ledger for all given analytic accounts.
 
-        for line in cost_lines:
-            should_include = True
-
-            # Check if line has a move_line_id (comes from accounting entry)
-            if line.move_line_id:
-                move = line.move_line_id.move_id
-                account = line.move_line_id.account_id
-
-                # Skip if from any invoice or bill type
-                if move:
-                    move_type = move.move_type
-                    if move_type in ['in_invoice', 'in_refund', 'out_invoice', 'out_refund']:
-                        should_include = False
-
-                    # Skip journal entries (type 'entry') - these include deferrals and other auto-generated entries
-                    # Deferred expenses from vendor bills create journal entries that shouldn't be counted separately
-                    # Real manual cost entries should be created directly as analytic lines without move_line_id
-                    elif move_type == 'entry':
-                        should_include = False
-
-                    # Skip reversed entries to avoid counting cancellations twice
-                    elif move.reversed_entry_id:
-                        should_include = False
-
-                # Skip Skonto/cash discount accounts (counted separately)
-                if should_include and account and account.code in skonto_account_codes:
-                    should_include = False
+        Args:
+            analytic_accounts: Recordset of account.analytic.account
+            totals: Ledger totals from _get_totals() covering these accounts (optional,
+                    read here if not given)
 
-            if should_include:
-                other_costs += abs(line.amount)
+        Returns:
+            dict: {analytic_account_id: float} - NET amounts (negative values converted to positive).
+        """
+        results = {account_id: 0.0 for account_id in analytic_accounts.ids}
+        if not results:
+            return results
+
+        if totals is None:
+            totals = self.env['project.statistic.contribution']._get_totals(list(results), ['other_cost'])
+        for (account_id, category), total in totals.items():
+            if category != 'other_cost' or account_id not in results:
+                continue
+            results[account_id] += total['amount_net']
 
-        _logger.debug(f"Total other costs for account {analytic_account.id}: {other_costs:.2f}")
-        return other_costs
+        return results
 
     def action_view_account_analytic_line(self):
         """
@@ -993,14 +1196,10 @@ class ProjectAnalytics(models.Model):
                 }
             }
 
-        # Get the custom list view using module-agnostic search
-        list_view_id = False
-        list_view = self.env['ir.ui.view'].search([
-            ('name', '=', 'account.analytic.line.list.enhanced'),
-            ('model', '=', 'account.analytic.line'),
-        ], limit=1)
-        if list_view:
-            list_view_id = list_view.id
+        # Get the custom list view using module-agnostic search (cached)
+        list_view_id = self.env['project.statistic.cache']._get_view_id(
+            'account.analytic.line.list.enhanced', 'account.analytic.line'
+        )
 
         return {
             'type': 'ir.actions.act_window',
@@ -1013,6 +1212,31 @@ class ProjectAnalytics(models.Model):
             'target': 'current',
         }
 
+    def action_view_contributions(self):
+        """
+        Open the contribution ledger rows of this project's analytic account.
+        Each row is the weighted NET/GROSS contribution of one source line.
+        """
+        self.ensure_one()
+
+        if not self.account_id:
+            return {
+                'type': 'ir.actions.client',
+                'tag': 'display_notification',
+                'params': {
+                    'message': _('No analytic account found for this project.'),
+                    'type': 'warning',
+                    'sticky': False,
+                }
+            }
+
+        action = self.env['ir.actions.act_window']._for_xml_id(
+            'project_statistic.action_project_statistic_contribution'
+        )
+        action['name'] = _('Contributions - %s') % self.name
+        action['domain'] = [('account_id', '=', self.account_id.id)]
+        return action
+
     def action_open_project_dashboard(self):
         """
         Open the standard project dashboard/form view for this project.
@@ -1065,26 +1289,14 @@ class ProjectAnalytics(models.Model):
                 }
             }
 
-        # Find all account.move.line records with this analytic account in distribution
-        # Then get the unique parent moves
-        move_lines = self.env['account.move.line'].search([
-            ('analytic_distribution', '!=', False),
-            ('parent_state', '=', 'posted'),
-        ])
-
-        # Filter for lines that have this analytic account
-        move_ids = set()
-        analytic_id_str = str(analytic_account.id)
-        for line in move_lines:
-            if line.analytic_distribution and analytic_id_str in line.analytic_distribution:
-                move_ids.add(line.move_id.id)
-
+        # Resolved by an indexed subquery (account.move _search_project_statistic_account_id),
+        # so the list view counts and paginates in the database
         return {
             'type': 'ir.actions.act_window',
             'name': _('Account Moves - %s') % self.name,
             'res_model': 'account.move',
             'view_mode': 'list,form',
-            'domain': [('id', 'in', list(move_ids))],
+            'domain': [('project_statistic_account_id', '=', analytic_account.id)],
             'context': {'search_default_posted': 1},
             'target': 'current',
         }
@@ -1099,14 +1311,11 @@ class ProjectAnalytics(models.Model):
         # Get the analytics form view ID using multiple fallback methods
         view_id = False
 
-        # Method 1: Try to get the view by searching for it by name (most reliable)
-        view = self.env['ir.ui.view'].search([
-            ('name', '=', 'project.project.form.account.analytics'),
-            ('model', '=', 'project.project'),
-        ], limit=1)
-        if view:
-            view_id = view.id
-        else:
+        # Method 1: Try to get the view by searching for it by name (most reliable, cached)
+        view_id = self.env['project.statistic.cache']._get_view_id(
+            'project.project.form.account.analytics', 'project.project'
+        )
+        if not view_id:
             # Method 2: Fallback to external ID lookup with module-agnostic search
             try:
                 # Search for the external ID without module prefix
@@ -1132,69 +1341,131 @@ class ProjectAnalytics(models.Model):
 
     def _get_sales_order_data(self, project):
         """
-        Get sales order data for the project: total NET amount and tax codes.
+        Get sales order data for a single project.
+
+        Thin wrapper around _get_sales_order_data_batch() - see there for details.
+        """
+        return project._get_sales_order_data_batch()[project.id]
+
+    def _get_sales_order_data_batch(self):
+        """
+        Get sales order data for all projects in self: total NET amount and tax codes.
 
         Only includes confirmed sales orders (state in ['sale', 'done']).
         Sales orders are linked via project_id field (standard Odoo field).
 
         FALLBACK: If no sales orders are found, uses manual_sales_order_amount_net field.
 
-        Args:
-            project: project.project record
+        BATCH MODE: Constant number of queries for the whole recordset:
+        1. sale.order grouped by (project_id, currency_id, company_id) (SUM amount_untaxed, order IDs)
+        2. sale.order.line grouped by (order_id, tax_id) over the order-line/tax relation
+        3. tax names (prefetched in one read)
+        4. only with foreign-currency orders: their dates and amounts (one read) and
+           the rates of all (currency, date) pairs (one query), converted in memory
+           to the company currency
 
         Returns:
-            dict: {
+            dict: {project_id: {
                 'amount_net': float,  # Total untaxed amount (price_subtotal) or manual fallback
                 'tax_names': str,     # Comma-separated tax names
                 'has_sales_orders': bool,  # Whether linked sales orders exist
-            }
+            }}
         """
-        result = {
-            'amount_net': 0.0,
-            'tax_names': '',
-            'has_sales_orders': False,
+        results = {
+            project.id: {
+                'amount_net': project.manual_sales_order_amount_net or 0.0,
+                'tax_names': '',
+                'has_sales_orders': False,
+            }
+            for project in self
         }
+        if not results:
+            return results
 
-        # Search for confirmed sales orders linked to this project
+        # Search for confirmed sales orders linked to these projects
         # state='sale' means confirmed, 'done' means fully delivered
-        sales_orders = self.env['sale.order'].search([
-            ('project_id', '=', project.id),
-            ('state', 'in', ['sale', 'done'])
-        ])
-
-        if not sales_orders:
-            # FALLBACK: Use manual amount if no sales orders found
-            result['amount_net'] = project.manual_sales_order_amount_net or 0.0
-            result['has_sales_orders'] = False
-            return result
+        # Grouped by currency as well: orders in the company currency are summed
+        # by the database, foreign-currency orders are converted below
+        order_groups = self.env['sale.order']._read_group(
+            [('project_id', 'in', self.ids), ('state', 'in', ['sale', 'done'])],
+            ['project_id', 'currency_id', 'company_id'],
+            ['amount_untaxed:sum', 'id:array_agg'],
+        )
 
-        result['has_sales_orders'] = True
+        project_by_order = {}
+        amount_by_project = {}
+        foreign_order_ids = []
+        for project, currency, company, amount_untaxed, order_ids in order_groups:
+            results[project.id]['has_sales_orders'] = True
+            project_by_order.update(dict.fromkeys(order_ids, project.id))
+            if currency == company.currency_id:
+                amount_by_project[project.id] = amount_by_project.get(project.id, 0.0) + (amount_untaxed or 0.0)
+            else:
+                foreign_order_ids += order_ids
+
+        if foreign_order_ids:
+            # Convert at the order date with ONE rate lookup for all orders
+            Currency = self.env['res.currency']
+            orders = self.env['sale.order'].browse(foreign_order_ids)
+            rate_keys = set()
+            for order in orders:
+                order_date = order.date_order.date()
+                rate_keys.add((order.currency_id.id, order.company_id.id, order_date))
+                rate_keys.add((order.company_id.currency_id.id, order.company_id.id, order_date))
+            rate_table = Currency._get_project_statistic_rate_table(rate_keys)
+            for order in orders:
+                project_id = project_by_order[order.id]
+                amount_by_project[project_id] = amount_by_project.get(project_id, 0.0) + Currency._project_statistic_convert(
+                    order.amount_untaxed, order.currency_id.id, order.company_id.currency_id.id,
+                    order.company_id.id, order.date_order.date(), rate_table,
+                )
 
-        # Collect tax names (use set to avoid duplicates)
-        tax_names_set = set()
+        for project_id, amount_untaxed in amount_by_project.items():
+            results[project_id]['amount_net'] = amount_untaxed  # NET amount (without taxes)
 
-        # Calculate total NET amount
-        for order in sales_orders:
-            result['amount_net'] += order.amount_untaxed  # NET amount (without taxes)
+        if not project_by_order:
+            return results
 
-            # Collect tax names from order lines
-            for line in order.order_line:
-                for tax in line.tax_id:
-                    if tax.name:
-                        tax_names_set.add(tax.name)
+        # Collect tax names from order lines (use set to avoid duplicates)
+        tax_names_by_project = {project_id: set() for project_id in results}
+        line_groups = self.env['sale.order.line']._read_group(
+            [('order_id', 'in', list(project_by_order)), ('tax_id', '!=', False)],
+            ['order_id', 'tax_id'],
+        )
+        for order, tax in line_groups:
+            if tax.name:
+                tax_names_by_project[project_by_order[order.id]].add(tax.name)
 
         # Convert set to comma-separated string
-        if tax_names_set:
-            result['tax_names'] = ', '.join(sorted(tax_names_set))
+        for project_id, tax_names_set in tax_names_by_project.items():
+            if tax_names_set:
+                results[project_id]['tax_names'] = ', '.join(sorted(tax_names_set))
 
-        return result
+        return results
 
     def action_refresh_financial_data(self):
         """
         Manually refresh/recompute all financial data for selected projects.
         This is useful when invoices or analytic lines are added/modified.
         Reloads the view after calculation to show updated values.
+
+        Selections larger than one refresh job chunk are recalculated in the
+        background (project.statistic.refresh.job) instead of in this request.
         """
+        chunk_size = self.env['project.statistic.cache']._get_settings()['refresh_job_chunk_size']
+        if len(self) > chunk_size:
+            self.env['project.statistic.refresh.job']._start(self)
+            return {
+                'type': 'ir.actions.client',
+                'tag': 'display_notification',
+                'params': {
+                    'title': _('Financial Data Refresh Started'),
+                    'message': _('%s project(s) are recalculated in the background. You will be notified when it is done.') % len(self),
+                    'type': 'info',
+                    'sticky': False,
+                }
+            }
+
         self._compute_financial_data()
 
         # Return a reload action with notification
@@ -1211,6 +1482,61 @@ class ProjectAnalytics(models.Model):
             }
         }
 
+    @api.model
+    def _get_rebuild_chunks(self, chunk_size):
+        """
+        Partition all projects into chunks of about chunk_size projects for the
+        project-statistic-rebuild command, never splitting the projects of one
+        analytic account: no two processes rebuild the contribution ledger of
+        the same account concurrently.
+
+        Args:
+            chunk_size: Target number of projects per chunk
+
+        Returns:
+            list: [[project_id, ...], ...]
+        """
+        self.flush_model(['account_id'])
+        self.env.cr.execute("""
+            SELECT id, account_id FROM project_project ORDER BY account_id NULLS FIRST, id
+        """)
+        rows = self.env.cr.fetchall()
+
+        chunks = []
+        current = []
+        for account_id, group in groupby(rows, key=lambda row: row[1]):
+            project_ids = [project_id for project_id, _account_id in group]
+            if account_id is None:
+                # Projects without an account only get zeroed, they can be split freely
+                chunks += [project_ids[i:i + chunk_size] for i in range(0, len(project_ids), chunk_size)]
+                continue
+            current += project_ids
+            if len(current) >= chunk_size:
+                chunks.append(current)
+                current = []
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _rebuild_chunk(self):
+        """
+        Rebuild one chunk of the project-statistic-rebuild command: re-derive
+        the contribution ledger of the projects' analytic accounts and
+        recompute their figures. The caller commits.
+
+        Returns:
+            int: Number of ledger lines of the chunk's analytic accounts
+        """
+        projects = self.exists()
+        projects._compute_financial_data()
+        self.env.flush_all()
+        if not projects.account_id:
+            return 0
+        self.env.cr.execute("""
+            SELECT COUNT(*) FROM project_statistic_contribution WHERE account_id = ANY(%s)
+        """, [projects.account_id.ids])
+        return self.env.cr.fetchone()[0]
+
     @api.model
     def trigger_recompute_for_analytic_accounts(self, analytic_account_ids):
         """
@@ -1219,6 +1545,10 @@ class ProjectAnalytics(models.Model):
         This method is called from both account.move.line and account.analytic.line hooks
         to avoid code duplication (~150 lines).
 
+        The hooks synchronize the contribution ledger for the changed lines BEFORE
+        calling this method, so the recompute only sums the ledger and skips the
+        full rebuild from the source lines.
+
         Args:
             analytic_account_ids: Set or list of analytic account IDs to process
 
@@ -1229,33 +1559,7 @@ class ProjectAnalytics(models.Model):
             return 0
 
         try:
-            # Get project plan reference once
-            try:
-                project_plan = self.env.ref('analytic.analytic_plan_projects', raise_if_not_found=False)
-            except Exception as e:
-                _logger.warning(f"Could not load project plan reference: {e}")
-                return 0
-
-            if not project_plan:
-                _logger.debug("Project analytic plan not found - skipping recompute trigger")
-                return 0
-
-            # Batch-fetch all analytic accounts
-            analytic_accounts = self.env['account.analytic.account'].browse(list(analytic_account_ids))
-
-            # Filter for project plan accounts only
-            project_analytic_accounts = analytic_accounts.filtered(
-                lambda a: a.exists() and a.plan_id == project_plan
-            )
-
-            if not project_analytic_accounts:
-                return 0
-
-            # Find all projects linked to these analytic accounts in one query
-            projects = self.search([
-                ('account_id', 'in', project_analytic_accounts.ids)
-            ])
-
+            projects = self._get_projects_for_analytic_accounts(analytic_account_ids)
             if not projects:
                 return 0
 
@@ -1274,8 +1578,8 @@ class ProjectAnalytics(models.Model):
                     # CRITICAL: Invalidate cache first to ensure fresh data
                     chunk_projects.invalidate_recordset()
 
-                    # Recompute financial data for this batch
-                    chunk_projects._compute_financial_data()
+                    # Recompute financial data for this batch (ledger already in sync)
+                    chunk_projects.with_context(project_statistic_ledger_synced=True)._compute_financial_data()
 
                     _logger.debug(f"Recomputed financial data for {len(chunk_projects)} project(s)")
 
@@ -1291,3 +1595,226 @@ class ProjectAnalytics(models.Model):
         except Exception as e:
             _logger.error(f"Error in trigger_recompute_for_analytic_accounts: {e}", exc_info=True)
             return 0
+
+    @api.model
+    def _get_projects_for_analytic_accounts(self, analytic_account_ids):
+        """
+        Find the projects linked to the given analytic accounts.
+
+        Only accounts of the project analytic plan are considered.
+
+        Args:
+            analytic_account_ids: Set or list of analytic account IDs
+
+        Returns:
+            project.project recordset (empty if the project plan is missing)
+        """
+        # Cached map of the project plan accounts (empty if the plan is missing)
+        account_project_map = self.env['project.statistic.cache']._get_account_project_map()
+        project_ids = [
+            project_id
+            for account_id in set(analytic_account_ids)
+            for project_id in account_project_map.get(account_id, ())
+        ]
+        return self.browse(sorted(project_ids))
+
+    @api.model
+    def _register_contribution_changes(self, move_line_ids=(), analytic_line_ids=(), deltas=None,
+                                       payment_move_ids=()):
+        """
+        Collect changed source lines in a per-transaction dirty set.
+
+        Posting one invoice writes its lines many times (price_subtotal, balance,
+        state of the move, ...). Instead of syncing the ledger and updating the
+        projects on every write, the hooks only register the changed lines here;
+        _process_contribution_changes() runs ONCE as a precommit callback and
+        syncs the ledger and updates each affected project exactly once per
+        transaction. The callback also runs on an explicit cr.flush().
+
+        Args:
+            move_line_ids: account.move.line IDs whose ledger rows must be re-derived
+            analytic_line_ids: account.analytic.line IDs whose ledger rows must be re-derived
+            deltas: Already applied ledger deltas (from lines removed before unlink)
+            payment_move_ids: account.move IDs whose payment state changed (reconciliation);
+                              only their paid/outstanding figures are updated
+        """
+        precommit = self.env.cr.precommit
+        pending = precommit.data.get('project_statistic.pending')
+        if pending is None:
+            pending = precommit.data['project_statistic.pending'] = {
+                'move_line_ids': set(),
+                'analytic_line_ids': set(),
+                'payment_move_ids': set(),
+                'deltas': {},
+            }
+            precommit.add(self.sudo()._process_contribution_changes)
+
+        pending['move_line_ids'].update(move_line_ids)
+        pending['analytic_line_ids'].update(analytic_line_ids)
+        pending['payment_move_ids'].update(payment_move_ids)
+        if deltas:
+            self.env['project.statistic.contribution']._merge_deltas(pending['deltas'], deltas)
+
+    @api.model
+    def _process_contribution_changes(self):
+        """
+        Precommit callback: sync the ledger of all lines changed in this
+        transaction and apply the summed deltas to the projects in one batch.
+        """
+        pending = self.env.cr.precommit.data.pop('project_statistic.pending', None)
+        if not pending:
+            return
+
+        self.env.flush_all()
+        ledger = self.env['project.statistic.contribution'].sudo()
+        deltas = pending['deltas']
+        if pending['move_line_ids']:
+            ledger._sync_move_lines(list(pending['move_line_ids']), deltas=deltas)
+        if pending['analytic_line_ids']:
+            analytic_lines = self.env['account.analytic.line'].sudo().browse(list(pending['analytic_line_ids']))
+            ledger._sync_analytic_lines(analytic_lines, deltas=deltas)
+        if pending['payment_move_ids']:
+            ledger._refresh_payment_ratios(list(pending['payment_move_ids']), deltas=deltas)
+
+        if deltas:
+            self._apply_contribution_deltas(deltas)
+        self.env['project.statistic.monthly'].sudo()._rebuild_months(
+            self.env.cr.precommit.data.pop('project_statistic.dirty_months', ())
+        )
+        self.env['project.statistic.document'].sudo()._rebuild_documents(
+            self.env.cr.precommit.data.pop('project_statistic.dirty_documents', ())
+        )
+        # Callbacks run after the final flush of the transaction
+        self.env.flush_all()
+
+    @api.model
+    def _apply_contribution_deltas(self, deltas):
+        """
+        Shift the stored project figures by the ledger deltas of a line change.
+
+        Called from the precommit callback _process_contribution_changes() right
+        after it synchronized the contribution ledger. Instead of recomputing the
+        whole project (which sums the ledger of every category), only the base
+        fields of the changed categories are shifted by the delta and the
+        derived fields (adjusted costs, totals, Profit/Loss) are re-derived from
+        the new base values with _get_derived_financial_values().
+
+        Projects whose figures were never computed (data_availability_status is
+        not 'available') fall back to a full recompute from the ledger, since
+        there is no baseline to shift.
+
+        In queued mode (system parameter project_statistic.recompute_mode =
+        'queue') the projects are only enqueued in
+        project.statistic.recompute.queue and updated by the cron job.
+
+        Errors are not caught: the ledger, monthly and document rows of the
+        same transaction must not commit while the project figures stay stale.
+
+        Args:
+            deltas: {(analytic_account_id, category): {amount_net, amount_gross,
+                     paid_net, paid_gross, hours, adjusted_hours}} as returned by
+                     the project.statistic.contribution sync methods
+
+        Returns:
+            int: Number of projects that were updated
+        """
+        # Drop deltas that do not change anything (e.g. a rewrite with the same values)
+        deltas = {
+            key: delta for key, delta in deltas.items()
+            if any(abs(value) > 1e-9 for value in delta.values())
+        }
+        if not deltas:
+            return 0
+
+        projects = self._get_projects_for_analytic_accounts({account_id for account_id, _category in deltas})
+        if not projects:
+            return 0
+
+        # Queued mode: the cron job recomputes the projects from the ledger later
+        queue = self.env['project.statistic.recompute.queue'].sudo()
+        if queue._get_recompute_mode() == 'queue':
+            queue._enqueue_projects(projects.ids)
+            return len(projects)
+
+        projects.invalidate_recordset()
+        to_recompute = projects.filtered(lambda p: p.data_availability_status != 'available')
+        if to_recompute:
+            to_recompute.with_context(project_statistic_ledger_synced=True)._compute_financial_data()
+
+        settings = self.env['project.statistic.cache']._get_settings()
+        general_hourly_rate = settings['general_hourly_rate']
+        vendor_bill_surcharge_factor = settings['vendor_bill_surcharge_factor']
+        base_fields = self._get_financial_base_fields()
+
+        for project in projects - to_recompute:
+            base_values = {field_name: project[field_name] for field_name in base_fields}
+            for (account_id, category), delta in deltas.items():
+                if account_id != project.account_id.id:
+                    continue
+                for field_name, key in CONTRIBUTION_DELTA_FIELDS.get(category, []):
+                    base_values[field_name] += delta[key]
+
+            vals = dict(base_values)
+            vals.update(self._get_derived_financial_values(
+                base_values, general_hourly_rate, vendor_bill_surcharge_factor
+            ))
+            # Only write what changed, e.g. a payment only touches paid/outstanding
+            vals = {
+                field_name: value for field_name, value in vals.items()
+                if project[field_name] != value
+            }
+            if vals:
+                project.sudo().write(vals)
+        METRICS.increment('projects_delta_updated_total', len(projects - to_recompute))
+
+        _logger.debug(
+            f"Applied {len(deltas)} contribution delta(s) to {len(projects - to_recompute)} project(s), "
+            f"fully recomputed {len(to_recompute)} project(s)"
+        )
+        return len(projects)
+
+    @api.model
+    def get_analytics_index_report(self):
+        """
+        Report whether the indexes shipped by this module exist and are being used.
+
+        Reads pg_index/pg_stat_user_indexes for the indexes declared in
+        account.move.line and account.analytic.line _get_project_statistic_indexes().
+        Usage statistics are cumulative since the last PostgreSQL stats reset.
+
+        Returns:
+            list: [{
+                'name': str,
+                'table': str,
+                'exists': bool,
+                'valid': bool,       # False while a concurrent build is pending/failed
+                'scans': int,        # Number of index scans
+                'tuples_read': int,  # Index entries returned by scans
+                'size': str,         # Human readable index size
+            }, ...]
+        """
+        report = []
+        for model_name in ('account.move.line', 'account.analytic.line'):
+            model = self.env[model_name]
+            for index in model._get_project_statistic_indexes():
+                self.env.cr.execute("""
+                    SELECT idx.indisvalid AS valid,
+                           COALESCE(stat.idx_scan, 0) AS scans,
+                           COALESCE(stat.idx_tup_read, 0) AS tuples_read,
+                           pg_size_pretty(pg_relation_size(idx.indexrelid)) AS size
+                      FROM pg_index idx
+                      JOIN pg_class cls ON cls.oid = idx.indexrelid
+                 LEFT JOIN pg_stat_user_indexes stat ON stat.indexrelid = idx.indexrelid
+                     WHERE cls.relname = %s
+                """, [index['name']])
+                row = self.env.cr.dictfetchone()
+                report.append({
+                    'name': index['name'],
+                    'table': model._table,
+                    'exists': bool(row),
+                    'valid': bool(row and row['valid']),
+                    'scans': row['scans'] if row else 0,
+                    'tuples_read': row['tuples_read'] if row else 0,
+                    'size': row['size'] if row else '',
+                })
+        return report
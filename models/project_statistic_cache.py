@@ -0,0 +1,158 @@
+from odoo import models, api, tools
+from odoo.osv import expression
+from odoo.tools import frozendict
+import logging
+
+from .project_statistic_contribution import CUSTOMER_SKONTO_PREFIXES, VENDOR_SKONTO_PREFIXES
+
+_logger = logging.getLogger(__name__)
+
+# System parameters of the module: {setting: (ir.config_parameter key, default, type)}
+SETTINGS = {
+    'general_hourly_rate': ('project_statistic.general_hourly_rate', '66.0', float),
+    'vendor_bill_surcharge_factor': ('project_statistic.vendor_bill_surcharge_factor', '1.30', float),
+    'recompute_mode': ('project_statistic.recompute_mode', 'sync', str),
+    'queue_chunk_size': ('project_statistic.queue_chunk_size', '100', int),
+    'queue_max_attempts': ('project_statistic.queue_max_attempts', '5', int),
+    'refresh_job_chunk_size': ('project_statistic.refresh_job_chunk_size', '100', int),
+    'refresh_job_max_seconds': ('project_statistic.refresh_job_max_seconds', '300', int),
+    'debug_metrics': ('project_statistic.debug_metrics', '', str),
+    'export_chunk_size': ('project_statistic.export_chunk_size', '2000', int),
+}
+
+
+class ProjectStatisticCache(models.AbstractModel):
+    """
+    Process-wide cache of the metadata every hook and compute needs.
+
+    The system parameters, the Projects analytic plan, the analytic account ->
+    project map, the Skonto accounts and the view IDs of the drilldown buttons
+    rarely change but were
+    read on every hook call, compute and button click. They are cached here with
+    ormcache, i.e. in the registry of each worker.
+
+    Invalidation goes through the registry signaling: registry.clear_cache()
+    marks the cache as invalidated, the change is signaled to the other workers
+    at the end of the request, and a rolled back transaction drops whatever it
+    cached. Callers:
+    - ir.config_parameter create/write/unlink (standard Odoo)
+    - project.project create/unlink of projects with an analytic account and
+      writes of account_id/active
+    - account.analytic.account writes of plan_id and unlink of Projects plan accounts
+    - account.analytic.plan unlink
+    - account.account creates, code writes and unlinks of Skonto accounts
+    - ir.ui.view create/write/unlink clear the 'templates' cache (standard Odoo)
+
+    Cached values are shared by all users and must not be modified.
+    """
+    _name = 'project.statistic.cache'
+    _description = 'Project Statistic Metadata Cache'
+
+    @api.model
+    @tools.ormcache()
+    def _get_settings(self):
+        """
+        All system parameters of the module, converted to their type. Invalid
+        values fall back to the default.
+
+        Returns:
+            frozendict: {setting: value} (see SETTINGS)
+        """
+        ICP = self.env['ir.config_parameter'].sudo()
+        settings = {}
+        for setting, (key, default, value_type) in SETTINGS.items():
+            value = ICP.get_param(key, default)
+            try:
+                settings[setting] = value_type(value)
+            except (TypeError, ValueError):
+                _logger.warning(f"Invalid value '{value}' of system parameter {key}, using {default}")
+                settings[setting] = value_type(default)
+        return frozendict(settings)
+
+    @api.model
+    @tools.ormcache()
+    def _get_project_plan_id(self):
+        """
+        Returns:
+            int: ID of the Projects analytic plan, or False if it does not exist
+        """
+        project_plan = self.env.ref('analytic.analytic_plan_projects', raise_if_not_found=False)
+        return project_plan.id if project_plan else False
+
+    @api.model
+    @tools.ormcache()
+    def _get_account_project_map(self):
+        """
+        Active projects per analytic account of the Projects plan, in one query.
+
+        Accounts of other plans are not included, so the map also answers
+        "is this account evaluated at all". Record rules are not applied: the
+        map feeds the hook processing, which runs as superuser.
+
+        Returns:
+            frozendict: {analytic_account_id: (project_id, ...)}
+        """
+        project_plan_id = self._get_project_plan_id()
+        if not project_plan_id:
+            return frozendict()
+        self.env['project.project'].flush_model(['account_id', 'active'])
+        self.env['account.analytic.account'].flush_model(['plan_id'])
+        self.env.cr.execute("""
+            SELECT project.account_id, array_agg(project.id ORDER BY project.id)
+              FROM project_project project
+              JOIN account_analytic_account account ON account.id = project.account_id
+             WHERE account.plan_id = %s
+               AND project.active
+          GROUP BY project.account_id
+        """, [project_plan_id])
+        return frozendict({
+            account_id: tuple(project_ids) for account_id, project_ids in self.env.cr.fetchall()
+        })
+
+    @api.model
+    @tools.ormcache()
+    def _get_skonto_account_ids(self):
+        """
+        Resolve the Skonto account code prefixes to account IDs.
+
+        Account codes are company dependent, so the prefixes are searched per
+        company. The SQL classifier then only compares integer IDs.
+
+        Returns:
+            tuple: (customer Skonto account IDs, vendor Skonto account IDs), both tuples
+        """
+        Account = self.env['account.account'].sudo().with_context(active_test=False)
+        customer_domain = expression.OR([[('code', '=like', f'{prefix}%')] for prefix in CUSTOMER_SKONTO_PREFIXES])
+        vendor_domain = expression.OR([[('code', '=like', f'{prefix}%')] for prefix in VENDOR_SKONTO_PREFIXES])
+        customer_ids, vendor_ids = set(), set()
+        for company in self.env['res.company'].sudo().search([]):
+            customer_ids.update(Account.with_company(company).search(customer_domain).ids)
+            vendor_ids.update(Account.with_company(company).search(vendor_domain).ids)
+        return tuple(sorted(customer_ids)), tuple(sorted(vendor_ids))
+
+    @api.model
+    @tools.ormcache('name', 'model', cache='templates')
+    def _get_view_id(self, name, model):
+        """
+        ID of a view found by name, so the view does not need a module prefix.
+
+        Args:
+            name: ir.ui.view name
+            model: Model of the view
+
+        Returns:
+            int: View ID, or False if there is no such view
+        """
+        view = self.env['ir.ui.view'].sudo().search([('name', '=', name), ('model', '=', model)], limit=1)
+        return view.id
+
+    @api.model
+    def _clear(self):
+        """
+        Invalidate the cached metadata in all workers.
+
+        registry.clear_cache() empties the whole default ormcache of the
+        registry (not only this model's entries) in every worker, so callers
+        only clear when the change can actually affect the cached values.
+        """
+        self.env.registry.clear_cache()
@@ -0,0 +1,896 @@
+from odoo import models, fields, api
+from odoo.tools.sql import column_exists, create_index
+import logging
+
+from ..metrics import METRICS, detail_enabled
+
+_logger = logging.getLogger(__name__)
+
+# Cash discount (Skonto) account code prefixes - SKR03/SKR04
+# Customer Skonto (Gewährte Skonti): expense accounts 7300-7303 + liability 2130
+CUSTOMER_SKONTO_PREFIXES = ('7300', '7301', '7302', '7303', '2130')
+# Vendor Skonto (Erhaltene Skonti): income accounts 4730-4733 + asset 2670
+VENDOR_SKONTO_PREFIXES = ('4730', '4731', '4732', '4733', '2670')
+
+# Move types whose analytic lines are already counted via the move line contributions
+INVOICE_MOVE_TYPES = ('out_invoice', 'out_refund', 'in_invoice', 'in_refund')
+
+# Keys of a totals/delta entry per (analytic account, category)
+TOTAL_KEYS = ('amount_net', 'amount_gross', 'paid_net', 'paid_gross', 'hours', 'adjusted_hours')
+
+# Columns returned by the ledger statements to derive deltas
+RETURNING_COLUMNS = "account_id, category, amount_net, amount_gross, payment_ratio, hours, employee_id, date, move_id"
+
+# Paid share of an invoice/bill (alias "move"), stored per ledger row
+PAYMENT_RATIO_SQL = """(CASE WHEN move.amount_total <> 0
+             THEN (move.amount_total - move.amount_residual) / move.amount_total
+             ELSE 0.0
+        END)::float"""
+
+# Company-currency factor of a journal item (alias "line"): its own accounting
+# rate balance / amount_currency, so foreign-currency invoices and bills are
+# converted in the same statement without any rate lookup
+COMPANY_CURRENCY_FACTOR_SQL = """(CASE WHEN line.currency_id = line.company_currency_id OR line.amount_currency = 0
+             THEN 1.0
+             ELSE line.balance / line.amount_currency
+        END)"""
+
+
+class ProjectStatisticContribution(models.Model):
+    """
+    Contribution ledger: one row per (project analytic account, source line).
+
+    Every row holds the already-weighted amount a single journal item
+    (account.move.line) or analytic entry (account.analytic.line) contributes
+    to a project analytic account, classified into exactly one category.
+    Project totals are a SUM over this table instead of a rescan of the
+    accounting ledger.
+
+    Rows are maintained by:
+    - _rebuild_for_accounts(): full rebuild from the sources (Refresh Financial Data)
+    - _sync_move_lines() / _sync_analytic_lines(): hooks on the source models
+    - ON DELETE CASCADE on the source line foreign keys
+
+    The sync methods return the DELTA of the project totals caused by the
+    change (removed rows count negative, inserted rows positive), in the same
+    shape as _get_totals(). The hooks add these deltas to the stored project
+    fields instead of recomputing the projects from scratch.
+    """
+    _name = 'project.statistic.contribution'
+    _description = 'Project Statistic Contribution'
+    _order = 'date desc, id desc'
+    _log_access = False
+
+    account_id = fields.Many2one(
+        'account.analytic.account',
+        string='Analytic Account',
+        required=True,
+        index=True,
+        ondelete='cascade',
+        readonly=True,
+        help="Project analytic account this contribution is booked on."
+    )
+    move_line_id = fields.Many2one(
+        'account.move.line',
+        string='Journal Item',
+        index='btree_not_null',
+        ondelete='cascade',
+        readonly=True,
+        help="Source invoice/bill line (for invoice, credit note, bill and refund contributions)."
+    )
+    analytic_line_id = fields.Many2one(
+        'account.analytic.line',
+        string='Analytic Entry',
+        index='btree_not_null',
+        ondelete='cascade',
+        readonly=True,
+        help="Source analytic line (for timesheet, other cost and Skonto contributions)."
+    )
+    move_id = fields.Many2one(
+        'account.move',
+        string='Document',
+        index='btree_not_null',
+        ondelete='cascade',
+        readonly=True,
+        help="Invoice, bill or journal entry the source line belongs to."
+    )
+    employee_id = fields.Many2one(
+        'hr.employee',
+        string='Employee',
+        index='btree_not_null',
+        ondelete='set null',
+        readonly=True,
+        help="Employee of a timesheet contribution. Used for HFC-adjusted hours."
+    )
+    company_id = fields.Many2one(
+        'res.company',
+        string='Company',
+        readonly=True,
+    )
+    date = fields.Date(
+        string='Date',
+        index=True,
+        readonly=True,
+        help="Accounting date of the source line."
+    )
+    category = fields.Selection([
+        ('invoice', 'Customer Invoice'),
+        ('credit_note', 'Customer Credit Note'),
+        ('bill', 'Vendor Bill'),
+        ('refund', 'Vendor Refund'),
+        ('timesheet', 'Timesheet'),
+        ('other_cost', 'Other Cost'),
+        ('skonto_customer', 'Customer Skonto'),
+        ('skonto_vendor', 'Vendor Skonto'),
+    ], string='Category',
+        required=True,
+        readonly=True,
+    )
+    amount_net = fields.Float(
+        string='Amount (NET)',
+        readonly=True,
+        help="Weighted NET contribution. Credit notes and refunds are negative, costs are positive."
+    )
+    amount_gross = fields.Float(
+        string='Amount (GROSS)',
+        readonly=True,
+        help="Weighted GROSS contribution (invoices and bills only)."
+    )
+    hours = fields.Float(
+        string='Hours',
+        readonly=True,
+        help="Booked hours (timesheets only)."
+    )
+    payment_ratio = fields.Float(
+        string='Payment Ratio',
+        readonly=True,
+        help="Paid share of the document: (amount_total - amount_residual) / amount_total."
+    )
+
+    def init(self):
+        super().init()
+        # Totals are always read per (account, category)
+        create_index(
+            self.env.cr, 'project_statistic_contribution_account_category_idx',
+            self._table, ['account_id', 'category'],
+        )
+        # (employee, account) hours matrix for HFC factor changes, see _get_employee_hours()
+        create_index(
+            self.env.cr, 'project_statistic_contribution_employee_hours_idx',
+            self._table, ['employee_id', 'account_id', 'hours'],
+            where="category = 'timesheet' AND employee_id IS NOT NULL",
+        )
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _rebuild_all(self):
+        """
+        Rebuild the ledger for every analytic account linked to a project.
+        Used on module install/upgrade.
+        """
+        self.env['project.project'].flush_model(['account_id'])
+        self.env.cr.execute("""
+            SELECT DISTINCT account_id FROM project_project WHERE account_id IS NOT NULL
+        """)
+        account_ids = [row[0] for row in self.env.cr.fetchall()]
+        _logger.info(f"Rebuilding project contribution ledger for {len(account_ids)} analytic account(s)")
+        self._rebuild_for_accounts(account_ids)
+        self.env['project.statistic.monthly']._rebuild_for_projects()
+        self.env['project.statistic.document']._rebuild_for_projects()
+
+    @api.model
+    def _rebuild_for_accounts(self, analytic_account_ids):
+        """
+        Replace all ledger rows of the given analytic accounts by rows freshly
+        derived from the source lines.
+
+        Args:
+            analytic_account_ids: List of analytic account IDs
+        """
+        analytic_account_ids = list(analytic_account_ids)
+        if not analytic_account_ids:
+            return
+
+        self.flush_model()
+        self.env.cr.execute("""
+            DELETE FROM project_statistic_contribution WHERE account_id = ANY(%s)
+        """, [analytic_account_ids])
+        self.invalidate_model()
+
+        with METRICS.timer('ledger_move_lines', self.env.context.get('project_statistic_timings')):
+            self._insert_move_line_rows(account_ids=analytic_account_ids)
+        with METRICS.timer('ledger_analytic_lines', self.env.context.get('project_statistic_timings')):
+            self._insert_analytic_line_rows(account_ids=analytic_account_ids)
+
+    @api.model
+    def _sync_move_lines(self, move_line_ids, deltas=None):
+        """
+        Re-derive the ledger rows of the given journal items.
+
+        Returns:
+            dict: {(analytic_account_id, category): delta} - see _accumulate_deltas().
+                  Covers the accounts of the removed rows AND of the new rows, so
+                  distributions that moved to another account are handled.
+        """
+        deltas = self._remove_move_lines(move_line_ids, deltas=deltas)
+        return self._insert_move_line_rows(move_line_ids=move_line_ids, deltas=deltas)
+
+    @api.model
+    def _remove_move_lines(self, move_line_ids, deltas=None):
+        """
+        Delete the ledger rows of the given journal items.
+
+        Returns:
+            dict: Deltas of the removed rows (negative)
+        """
+        deltas = {} if deltas is None else deltas
+        if not move_line_ids:
+            return deltas
+        self.flush_model()
+        self.env.cr.execute(f"""
+            DELETE FROM project_statistic_contribution
+             WHERE move_line_id = ANY(%s)
+         RETURNING {RETURNING_COLUMNS}
+        """, [list(move_line_ids)])
+        rows = self.env.cr.dictfetchall()
+        METRICS.increment('ledger_rows_removed_total', len(rows), source='account.move.line')
+        self._mark_rows_dirty(rows)
+        self._accumulate_deltas(rows, -1, deltas)
+        self.invalidate_model()
+        return deltas
+
+    @api.model
+    def _sync_analytic_lines(self, analytic_lines, deltas=None):
+        """
+        Re-derive the ledger rows of the given analytic lines.
+
+        Returns:
+            dict: {(analytic_account_id, category): delta} - covers the old and the
+                  new analytic account of reassigned lines
+        """
+        deltas = self._remove_analytic_lines(analytic_lines.ids, deltas=deltas)
+        return self._insert_analytic_line_rows(analytic_line_ids=analytic_lines.ids, deltas=deltas)
+
+    @api.model
+    def _remove_analytic_lines(self, analytic_line_ids, deltas=None):
+        """
+        Delete the ledger rows of the given analytic lines.
+
+        Returns:
+            dict: Deltas of the removed rows (negative)
+        """
+        deltas = {} if deltas is None else deltas
+        if not analytic_line_ids:
+            return deltas
+        self.flush_model()
+        self.env.cr.execute(f"""
+            DELETE FROM project_statistic_contribution
+             WHERE analytic_line_id = ANY(%s)
+         RETURNING {RETURNING_COLUMNS}
+        """, [list(analytic_line_ids)])
+        rows = self.env.cr.dictfetchall()
+        METRICS.increment('ledger_rows_removed_total', len(rows), source='account.analytic.line')
+        self._mark_rows_dirty(rows)
+        self._accumulate_deltas(rows, -1, deltas)
+        self.invalidate_model()
+        return deltas
+
+    @api.model
+    def _insert_move_line_rows(self, account_ids=None, move_line_ids=None, deltas=None):
+        """
+        Insert the contributions of posted invoice/bill lines in one INSERT ... SELECT.
+
+        The analytic_distribution JSON of every line is exploded with jsonb_each(),
+        weighted with its percentage and joined with account_move for move_type,
+        reversed_entry_id, amount_total and amount_residual.
+
+        Rules:
+        - Only posted lines of customer invoices/credit notes and vendor bills/refunds
+        - Section/note lines are excluded
+        - Reversal entries (reversed_entry_id set) are skipped
+        - Credit notes/refunds are stored as negative amounts
+        - Payment ratio = (amount_total - amount_residual) / amount_total
+        - Amounts are in company currency: foreign-currency lines are converted
+          with their own accounting rate (balance / amount_currency)
+
+        Args:
+            account_ids: Restrict to these analytic accounts (rebuild)
+            move_line_ids: Restrict to these journal items (hooks); only accounts
+                           linked to a project are kept
+            deltas: Delta dict to accumulate into (optional)
+
+        Returns:
+            dict: Deltas of the inserted rows (positive)
+        """
+        deltas = {} if deltas is None else deltas
+        conditions = []
+        params = []
+        if account_ids is not None:
+            if not account_ids:
+                return deltas
+            # ?| prefilter lets PostgreSQL use the GIN index on analytic_distribution
+            # (see AccountMoveLine._get_project_statistic_indexes())
+            account_keys = [str(account_id) for account_id in account_ids]
+            conditions.append("line.analytic_distribution ?| %s AND dist.key = ANY(%s)")
+            params += [account_keys, account_keys]
+        if move_line_ids is not None:
+            if not move_line_ids:
+                return deltas
+            conditions.append("""line.id = ANY(%s) AND dist.key IN (
+                SELECT account_id::text FROM project_project WHERE account_id IS NOT NULL
+            )""")
+            params.append(list(move_line_ids))
+
+        # Make sure pending ORM writes are visible to the raw query
+        self.env['account.move.line'].flush_model([
+            'analytic_distribution', 'parent_state', 'display_type', 'move_id',
+            'price_subtotal', 'price_total', 'date', 'company_id',
+            'balance', 'amount_currency', 'currency_id', 'company_currency_id',
+        ])
+        self.env['account.move'].flush_model([
+            'move_type', 'reversed_entry_id', 'amount_total', 'amount_residual',
+        ])
+        self.env['project.project'].flush_model(['account_id'])
+        self.flush_model()
+
+        self.env.cr.execute(f"""
+            INSERT INTO project_statistic_contribution (
+                account_id, move_line_id, move_id, company_id, date, category,
+                amount_net, amount_gross, hours, payment_ratio
+            )
+            SELECT dist.key::integer,
+                   line.id,
+                   move.id,
+                   line.company_id,
+                   line.date,
+                   CASE move.move_type
+                        WHEN 'out_invoice' THEN 'invoice'
+                        WHEN 'out_refund' THEN 'credit_note'
+                        WHEN 'in_invoice' THEN 'bill'
+                        WHEN 'in_refund' THEN 'refund'
+                   END,
+                   CASE WHEN move.move_type IN ('out_refund', 'in_refund')
+                        THEN -ABS(line.price_subtotal * {COMPANY_CURRENCY_FACTOR_SQL} * dist.value::numeric / 100.0)
+                        ELSE line.price_subtotal * {COMPANY_CURRENCY_FACTOR_SQL} * dist.value::numeric / 100.0
+                   END,
+                   CASE WHEN move.move_type IN ('out_refund', 'in_refund')
+                        THEN -ABS(line.price_total * {COMPANY_CURRENCY_FACTOR_SQL} * dist.value::numeric / 100.0)
+                        ELSE line.price_total * {COMPANY_CURRENCY_FACTOR_SQL} * dist.value::numeric / 100.0
+                   END,
+                   0.0,
+                   {PAYMENT_RATIO_SQL}
+              FROM account_move_line line
+              JOIN account_move move ON move.id = line.move_id
+             CROSS JOIN LATERAL jsonb_each(line.analytic_distribution) AS dist(key, value)
+             WHERE line.analytic_distribution IS NOT NULL
+               AND jsonb_typeof(line.analytic_distribution) = 'object'
+               AND line.parent_state = 'posted'
+               AND (line.display_type IS NULL OR line.display_type NOT IN ('line_section', 'line_note'))
+               AND move.move_type IN %s
+               AND move.reversed_entry_id IS NULL
+               AND jsonb_typeof(dist.value) = 'number'
+               AND {' AND '.join(conditions)}
+         RETURNING {RETURNING_COLUMNS}
+        """, [INVOICE_MOVE_TYPES] + params)
+        rows = self.env.cr.dictfetchall()
+        self._record_line_metrics('account.move.line', rows)
+        if move_line_ids is not None:
+            self._mark_rows_dirty(rows)
+        self._accumulate_deltas(rows, 1, deltas)
+        self.invalidate_model()
+        return deltas
+
+    @api.model
+    def _refresh_payment_ratios(self, move_ids, deltas=None):
+        """
+        Update the payment ratio of the ledger rows of the given invoices/bills.
+
+        Payments change amount_residual on account.move without writing any
+        journal item of the invoice, so the line hooks never see them. Only the
+        payment_ratio column is updated; the returned deltas contain nothing but
+        the paid_net/paid_gross difference of each changed row.
+
+        Args:
+            move_ids: IDs of account.move whose reconciliation changed
+            deltas: Delta dict to accumulate into (optional)
+
+        Returns:
+            dict: Deltas of the paid amounts
+        """
+        deltas = {} if deltas is None else deltas
+        if not move_ids:
+            return deltas
+        self.env['account.move'].flush_model(['amount_total', 'amount_residual'])
+        self.flush_model()
+        self.env.cr.execute(f"""
+            UPDATE project_statistic_contribution contribution
+               SET payment_ratio = ratio.new_ratio
+              FROM (
+                    SELECT existing.id,
+                           COALESCE(existing.payment_ratio, 0.0) AS old_ratio,
+                           {PAYMENT_RATIO_SQL} AS new_ratio
+                      FROM project_statistic_contribution existing
+                      JOIN account_move move ON move.id = existing.move_id
+                     WHERE existing.move_id = ANY(%s)
+                       AND existing.move_line_id IS NOT NULL
+                   ) ratio
+             WHERE contribution.id = ratio.id
+               AND ratio.new_ratio IS DISTINCT FROM ratio.old_ratio
+         RETURNING contribution.account_id,
+                   contribution.category,
+                   contribution.date,
+                   contribution.move_id,
+                   contribution.amount_net * (ratio.new_ratio - ratio.old_ratio) AS paid_net,
+                   contribution.amount_gross * (ratio.new_ratio - ratio.old_ratio) AS paid_gross
+        """, [list(move_ids)])
+        rows = self.env.cr.dictfetchall()
+        self._mark_rows_dirty(rows)
+        for row in rows:
+            delta = deltas.setdefault((row['account_id'], row['category']), dict.fromkeys(TOTAL_KEYS, 0.0))
+            delta['paid_net'] += row['paid_net'] or 0.0
+            delta['paid_gross'] += row['paid_gross'] or 0.0
+        self.invalidate_model()
+        return deltas
+
+    @api.model
+    def _classify_analytic_line(self, line):
+        """
+        Put an analytic line into exactly one ledger category.
+
+        Python mirror of the single-scan classifier in _insert_analytic_line_rows(),
+        used by the hook relevance filter on single records.
+
+        - Timesheets (is_timesheet=True) → 'timesheet'
+        - Lines from Skonto accounts (7300-7303, 2130 / 4730-4733, 2670)
+          → 'skonto_customer' / 'skonto_vendor'
+        - Negative non-timesheet lines → 'other_cost', EXCEPT lines coming from
+          invoices/bills (counted via move lines), journal entries (deferrals,
+          adjustments) and reversed entries (Storno)
+        - Anything else is not a project contribution
+
+        Args:
+            line: account.analytic.line record
+
+        Returns:
+            tuple: (category or False, NET amount as positive value)
+        """
+        if line.is_timesheet:
+            return 'timesheet', abs(line.amount or 0.0)
+
+        move_line = line.move_line_id
+        account_code = (move_line.account_id.code or '') if move_line else ''
+
+        if account_code.startswith(CUSTOMER_SKONTO_PREFIXES):
+            return 'skonto_customer', abs(line.amount)
+        if account_code.startswith(VENDOR_SKONTO_PREFIXES):
+            return 'skonto_vendor', abs(line.amount)
+
+        if line.amount < 0:
+            move = move_line.move_id
+            if move and (
+                move.move_type in INVOICE_MOVE_TYPES
+                or move.move_type == 'entry'
+                or move.reversed_entry_id
+            ):
+                return False, 0.0
+            return 'other_cost', abs(line.amount)
+
+        return False, 0.0
+
+    @api.model
+    def _get_skonto_account_ids(self):
+        """
+        Resolve the Skonto account code prefixes to account IDs.
+
+        Cached per worker (project.statistic.cache _get_skonto_account_ids()),
+        so the hook commits do not search the accounts of every company again.
+
+        Returns:
+            tuple: (customer Skonto account IDs, vendor Skonto account IDs)
+        """
+        customer_ids, vendor_ids = self.env['project.statistic.cache']._get_skonto_account_ids()
+        return list(customer_ids), list(vendor_ids)
+
+    @api.model
+    def _insert_analytic_line_rows(self, account_ids=None, analytic_line_ids=None, deltas=None):
+        """
+        Classify analytic lines and insert their contributions in ONE scan.
+
+        Every analytic line of the selection is read exactly once, joined to its
+        journal item and move, and put into exactly one bucket by a CASE
+        expression (same rules as _classify_analytic_line()):
+
+        1. Timesheets → 'timesheet'
+        2. Journal item on a customer / vendor Skonto account → 'skonto_customer' / 'skonto_vendor'
+        3. Negative lines from invoices/bills, journal entries or reversed
+           entries → excluded (counted via the move lines or not a cost)
+        4. Other negative lines → 'other_cost'
+        5. Everything else → excluded
+
+        Only lines booked on an analytic account linked to a project are kept.
+
+        Args:
+            account_ids: Restrict to these analytic accounts (rebuild)
+            analytic_line_ids: Restrict to these analytic lines (hooks)
+            deltas: Delta dict to accumulate into (optional)
+
+        Returns:
+            dict: Deltas of the inserted rows (positive)
+        """
+        deltas = {} if deltas is None else deltas
+        conditions = []
+        params = []
+        if account_ids is not None:
+            if not account_ids:
+                return deltas
+            conditions.append("aal.account_id = ANY(%s)")
+            params.append(list(account_ids))
+        if analytic_line_ids is not None:
+            if not analytic_line_ids:
+                return deltas
+            conditions.append("aal.id = ANY(%s)")
+            params.append(list(analytic_line_ids))
+
+        AnalyticLine = self.env['account.analytic.line']
+        if column_exists(self.env.cr, AnalyticLine._table, 'is_timesheet'):
+            timesheet_sql = "aal.is_timesheet IS TRUE"
+            timesheet_fields = ['is_timesheet']
+        else:
+            # hr_timesheet definition of a timesheet
+            timesheet_sql = "aal.project_id IS NOT NULL"
+            timesheet_fields = ['project_id']
+        customer_skonto_ids, vendor_skonto_ids = self._get_skonto_account_ids()
+
+        # Make sure pending ORM writes are visible to the raw query
+        AnalyticLine.flush_model([
+            'account_id', 'amount', 'unit_amount', 'employee_id', 'move_line_id', 'date', 'company_id',
+        ] + timesheet_fields)
+        self.env['account.move.line'].flush_model(['account_id', 'move_id'])
+        self.env['account.move'].flush_model(['move_type', 'reversed_entry_id'])
+        self.env['project.project'].flush_model(['account_id'])
+        self.flush_model()
+
+        self.env.cr.execute(f"""
+            WITH classified AS (
+                SELECT aal.id,
+                       aal.account_id,
+                       aal.company_id,
+                       aal.date,
+                       aal.employee_id,
+                       aal.unit_amount,
+                       aal.amount,
+                       aml.move_id,
+                       CASE
+                            WHEN {timesheet_sql} THEN 'timesheet'
+                            WHEN aml.account_id = ANY(%s) THEN 'skonto_customer'
+                            WHEN aml.account_id = ANY(%s) THEN 'skonto_vendor'
+                            WHEN aal.amount < 0 AND (
+                                    move.move_type IN %s
+                                 OR move.move_type = 'entry'
+                                 OR move.reversed_entry_id IS NOT NULL
+                            ) THEN 'excluded'
+                            WHEN aal.amount < 0 THEN 'other_cost'
+                            ELSE 'excluded'
+                       END AS category
+                  FROM account_analytic_line aal
+             LEFT JOIN account_move_line aml ON aml.id = aal.move_line_id
+             LEFT JOIN account_move move ON move.id = aml.move_id
+                 WHERE aal.account_id IN (
+                           SELECT account_id FROM project_project WHERE account_id IS NOT NULL
+                       )
+                   AND {' AND '.join(conditions)}
+            ),
+            inserted AS (
+                INSERT INTO project_statistic_contribution (
+                    account_id, analytic_line_id, move_id, employee_id, company_id, date, category,
+                    amount_net, amount_gross, hours, payment_ratio
+                )
+                SELECT account_id,
+                       id,
+                       move_id,
+                       CASE WHEN category = 'timesheet' THEN employee_id END,
+                       company_id,
+                       date,
+                       category,
+                       ABS(COALESCE(amount, 0.0)),
+                       0.0,
+                       CASE WHEN category = 'timesheet' THEN COALESCE(unit_amount, 0.0) ELSE 0.0 END,
+                       0.0
+                  FROM classified
+                 WHERE category <> 'excluded'
+             RETURNING {RETURNING_COLUMNS}
+            )
+            SELECT (SELECT COUNT(*) FROM classified) AS scanned,
+                   COALESCE((SELECT json_agg(inserted) FROM inserted), '[]'::json) AS rows
+        """, [customer_skonto_ids, vendor_skonto_ids, INVOICE_MOVE_TYPES] + params)
+        scanned, rows = self.env.cr.fetchone()
+        self._record_line_metrics('account.analytic.line', rows, scanned=scanned)
+        if analytic_line_ids is not None:
+            self._mark_rows_dirty(rows)
+        self._accumulate_deltas(rows, 1, deltas)
+        self.invalidate_model()
+        return deltas
+
+    @api.model
+    def _accumulate_deltas(self, rows, sign, deltas):
+        """
+        Add the contribution of ledger rows to a delta dict.
+
+        Paid amounts use the row's payment ratio; adjusted hours use the CURRENT
+        HFC factor of the employee, exactly like _get_totals(), so that
+        "old totals + delta" always equals the new _get_totals() result.
+
+        Args:
+            rows: List of dicts with the RETURNING_COLUMNS keys
+            sign: 1 for inserted rows, -1 for removed rows
+            deltas: {(analytic_account_id, category): {TOTAL_KEYS: float}}, updated in place
+
+        Returns:
+            dict: deltas
+        """
+        employee_ids = {row['employee_id'] for row in rows if row.get('employee_id')}
+        factors = {
+            employee.id: employee.faktor_hfc or 1.0
+            for employee in self.env['hr.employee'].sudo().browse(employee_ids)
+        }
+        for row in rows:
+            delta = deltas.setdefault((row['account_id'], row['category']), dict.fromkeys(TOTAL_KEYS, 0.0))
+            amount_net = float(row.get('amount_net') or 0.0)
+            amount_gross = float(row.get('amount_gross') or 0.0)
+            payment_ratio = float(row.get('payment_ratio') or 0.0)
+            hours = float(row.get('hours') or 0.0)
+            delta['amount_net'] += sign * amount_net
+            delta['amount_gross'] += sign * amount_gross
+            delta['paid_net'] += sign * amount_net * payment_ratio
+            delta['paid_gross'] += sign * amount_gross * payment_ratio
+            delta['hours'] += sign * hours
+            delta['adjusted_hours'] += sign * hours * factors.get(row.get('employee_id'), 1.0)
+        return deltas
+
+    @api.model
+    def _mark_rows_dirty(self, rows):
+        """
+        Record the monthly buckets and the (analytic account, document) pairs
+        touched by changed ledger rows; project.statistic.monthly and
+        project.statistic.document rebuild them once at commit time
+        (project.project _process_contribution_changes()). Rows without a
+        document are recorded as (analytic account, None).
+
+        Args:
+            rows: Ledger rows with 'account_id', 'date' and 'move_id'
+        """
+        self._mark_months_dirty(rows)
+        pairs = self.env.cr.precommit.data.setdefault('project_statistic.dirty_documents', set())
+        for row in rows:
+            pairs.add((row['account_id'], row.get('move_id') or None))
+
+    @api.model
+    def _mark_months_dirty(self, rows):
+        """
+        Record the (analytic account, month) buckets touched by changed ledger
+        rows; project.statistic.monthly rebuilds them once at commit time
+        (project.project _process_contribution_changes()).
+
+        Args:
+            rows: Ledger rows with 'account_id' and 'date'
+        """
+        buckets = self.env.cr.precommit.data.setdefault('project_statistic.dirty_months', set())
+        for row in rows:
+            if row.get('date'):
+                buckets.add((row['account_id'], fields.Date.to_date(row['date']).replace(day=1)))
+
+    @api.model
+    def _mark_employee_months_dirty(self, employee_ids):
+        """Record the buckets of all timesheet rows of the given employees (HFC factor change)."""
+        self.flush_model()
+        self.env.cr.execute("""
+            SELECT DISTINCT account_id, date
+              FROM project_statistic_contribution
+             WHERE category = 'timesheet'
+               AND employee_id = ANY(%s)
+        """, [list(employee_ids)])
+        self._mark_months_dirty(self.env.cr.dictfetchall())
+
+    @api.model
+    def _get_empty_delta(self):
+        """Return a zero delta/totals entry (see _accumulate_deltas())."""
+        return dict.fromkeys(TOTAL_KEYS, 0.0)
+
+    @api.model
+    def _merge_deltas(self, target, source):
+        """
+        Add the deltas of source into target (both in _accumulate_deltas() shape).
+
+        Returns:
+            dict: target
+        """
+        for key, delta in source.items():
+            total = target.setdefault(key, dict.fromkeys(TOTAL_KEYS, 0.0))
+            for total_key in TOTAL_KEYS:
+                total[total_key] += delta[total_key]
+        return target
+
+    # -------------------------------------------------------------------------
+    # Hook relevance filtering
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _get_lines_with_rows(self, source_field, line_ids):
+        """
+        Return the source lines that currently have ledger rows.
+
+        Lines with rows are always relevant for the hooks, since a change may
+        have to REMOVE their contribution (reset to draft, distribution removed).
+
+        Args:
+            source_field: 'move_line_id' or 'analytic_line_id'
+            line_ids: IDs of the source lines
+
+        Returns:
+            set: IDs of the lines with at least one ledger row
+        """
+        if not line_ids:
+            return set()
+        self.flush_model([source_field])
+        self.env.cr.execute(f"""
+            SELECT DISTINCT {source_field}
+              FROM project_statistic_contribution
+             WHERE {source_field} = ANY(%s)
+        """, [list(line_ids)])
+        return {row[0] for row in self.env.cr.fetchall()}
+
+    @api.model
+    def _get_project_account_ids(self, account_ids):
+        """
+        Return the analytic accounts that are linked to a project.
+
+        Args:
+            account_ids: Iterable of analytic account IDs
+
+        Returns:
+            set: The IDs that are the account_id of at least one project
+        """
+        account_ids = list(account_ids)
+        if not account_ids:
+            return set()
+        self.env['project.project'].flush_model(['account_id'])
+        self.env.cr.execute("""
+            SELECT DISTINCT account_id FROM project_project WHERE account_id = ANY(%s)
+        """, [account_ids])
+        return {row[0] for row in self.env.cr.fetchall()}
+
+    @api.model
+    def _record_line_metrics(self, model_name, rows, scanned=None):
+        """
+        Count the source lines processed by a ledger insert statement.
+
+        Per-row detail is only logged when project_statistic.debug_metrics is
+        set; by default the counters are the only trace.
+
+        Args:
+            model_name: Source model of the lines
+            rows: Inserted ledger rows (RETURNING_COLUMNS dicts)
+            scanned: Number of source lines read by the statement, if known
+        """
+        METRICS.increment('lines_matched_total', len(rows), source=model_name)
+        if scanned is not None:
+            METRICS.increment('lines_scanned_total', scanned, source=model_name)
+            METRICS.increment('lines_skipped_total', max(scanned - len(rows), 0), source=model_name)
+        if rows and detail_enabled(self.env):
+            for row in rows:
+                _logger.info(f"Ledger row from {model_name}: {row}")
+
+    @api.model
+    def _count_skipped_events(self, model_name, skipped, relevant=0):
+        """
+        Record the outcome of a hook relevance filter.
+
+        Args:
+            model_name: Source model of the events
+            skipped: {reason: number of lines}
+            relevant: Number of lines that passed the filter
+        """
+        METRICS.increment('hook_events_total', relevant, model=model_name, result='relevant')
+        METRICS.increment('hook_events_total', sum(skipped.values()), model=model_name, result='skipped')
+        for reason, count in skipped.items():
+            METRICS.increment('hook_events_skipped_total', count, model=model_name, reason=reason)
+        if any(skipped.values()):
+            _logger.debug(f"Project statistic hook on {model_name}: skipped {dict(skipped)}")
+
+    @api.model
+    def get_skipped_event_counters(self):
+        """
+        Counters of hook events dropped by the relevance filters since the
+        worker process started.
+
+        Returns:
+            dict: {model_name: {reason: count}}
+        """
+        counters = {}
+        for (name, labels), count in METRICS.snapshot()[0].items():
+            if name == 'hook_events_skipped_total':
+                labels = dict(labels)
+                counters.setdefault(labels['model'], {})[labels['reason']] = int(count)
+        return counters
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _get_employee_hours(self, employee_ids):
+        """
+        Hours booked per (analytic account, employee) for the given employees.
+
+        Served by project_statistic_contribution_employee_hours_idx (index-only
+        scan), so an HFC factor change never touches account_analytic_line.
+
+        Args:
+            employee_ids: List of hr.employee IDs
+
+        Returns:
+            dict: {(analytic_account_id, employee_id): hours}
+        """
+        if not employee_ids:
+            return {}
+        self.flush_model(['employee_id', 'account_id', 'hours', 'category'])
+        self.env.cr.execute("""
+            SELECT account_id, employee_id, SUM(hours)
+              FROM project_statistic_contribution
+             WHERE category = 'timesheet'
+               AND employee_id = ANY(%s)
+          GROUP BY account_id, employee_id
+        """, [list(employee_ids)])
+        return {
+            (account_id, employee_id): float(hours or 0.0)
+            for account_id, employee_id, hours in self.env.cr.fetchall()
+        }
+
+    @api.model
+    def _get_totals(self, analytic_account_ids, categories):
+        """
+        Sum the ledger per (analytic account, category).
+
+        Adjusted hours are derived at read time from the current employee HFC
+        factor (faktor_hfc, 0/empty counts as 1.0), so factor changes need no
+        rebuild of the ledger.
+
+        Args:
+            analytic_account_ids: List of analytic account IDs
+            categories: List of category keys
+
+        Returns:
+            dict: {(analytic_account_id, category): {
+                'amount_net', 'amount_gross', 'paid_net', 'paid_gross',
+                'hours', 'adjusted_hours'}}
+        """
+        if not analytic_account_ids:
+            return {}
+
+        self.flush_model()
+        self.env['hr.employee'].flush_model(['faktor_hfc'])
+        self.env.cr.execute("""
+            SELECT contribution.account_id,
+                   contribution.category,
+                   SUM(contribution.amount_net) AS amount_net,
+                   SUM(contribution.amount_gross) AS amount_gross,
+                   SUM(contribution.amount_net * contribution.payment_ratio) AS paid_net,
+                   SUM(contribution.amount_gross * contribution.payment_ratio) AS paid_gross,
+                   SUM(contribution.hours) AS hours,
+                   SUM(contribution.hours * COALESCE(NULLIF(employee.faktor_hfc, 0), 1.0)) AS adjusted_hours
+              FROM project_statistic_contribution contribution
+         LEFT JOIN hr_employee employee ON employee.id = contribution.employee_id
+             WHERE contribution.account_id = ANY(%s)
+               AND contribution.category IN %s
+          GROUP BY contribution.account_id, contribution.category
+        """, [list(analytic_account_ids), tuple(categories)])
+
+        totals = {}
+        for row in self.env.cr.dictfetchall():
+            totals[(row['account_id'], row['category'])] = {
+                key: float(row[key] or 0.0) for key in TOTAL_KEYS
+            }
+        return totals
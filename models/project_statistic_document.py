@@ -0,0 +1,187 @@
+from odoo import models, fields, api
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class ProjectStatisticDocument(models.Model):
+    """
+    Per-document breakdown of the project figures: one row per (project,
+    document, category).
+
+    Answers "which invoices make up this project's revenue" from a stored
+    table: the ledger rows of a project are summed per invoice, bill or
+    journal entry, with the weighted NET/GROSS amount and the paid share. The
+    analytics form shows it as a paginated list, without reading the ledger.
+
+    Maintenance follows project.statistic.monthly:
+    - the ledger statements of the hooks record the (analytic account,
+      document) pairs of the rows they insert, delete or re-ratio; only these
+      pairs are rebuilt, once per transaction (_rebuild_documents())
+    - a full project recompute rebuilds all documents of its projects
+      (_rebuild_for_projects())
+
+    Ledger rows without a document (timesheets, costs booked directly on the
+    analytic account) are summed into one row per category without document,
+    so the rows of a project add up to its figures.
+    """
+    _name = 'project.statistic.document'
+    _description = 'Project Statistic Document Breakdown'
+    _order = 'date desc, id desc'
+    _log_access = False
+
+    project_id = fields.Many2one(
+        'project.project',
+        string='Project',
+        required=True,
+        ondelete='cascade',
+        readonly=True,
+        index=True,
+    )
+    account_id = fields.Many2one(
+        'account.analytic.account',
+        string='Analytic Account',
+        required=True,
+        ondelete='cascade',
+        readonly=True,
+    )
+    move_id = fields.Many2one(
+        'account.move',
+        string='Document',
+        ondelete='cascade',
+        readonly=True,
+        help="Empty for the summed contributions without a document (timesheets, other costs)."
+    )
+    partner_id = fields.Many2one(related='move_id.partner_id', string='Partner')
+    category = fields.Selection(
+        selection=lambda self: self.env['project.statistic.contribution']._fields['category'].selection,
+        string='Type',
+        required=True,
+        readonly=True,
+    )
+    date = fields.Date(string='Date', readonly=True)
+    amount_net = fields.Float(
+        string='Amount (NET)',
+        readonly=True,
+        help="Weighted NET contribution of the document to the project."
+    )
+    amount_gross = fields.Float(
+        string='Amount (GROSS)',
+        readonly=True,
+        help="Weighted GROSS contribution of the document to the project (invoices and bills only)."
+    )
+    paid_net = fields.Float(string='Paid (NET)', readonly=True)
+    paid_gross = fields.Float(string='Paid (GROSS)', readonly=True)
+    paid_share = fields.Float(
+        string='Paid Share',
+        readonly=True,
+        help="Paid part of the document (Paid (NET) / Amount (NET))."
+    )
+
+    # Rows without a document have move_id NULL and are not covered by the
+    # constraint; _insert_documents() groups them into one row per category
+    _sql_constraints = [
+        ('project_move_category_uniq', 'UNIQUE(project_id, move_id, category)',
+         'Only one breakdown row per project, document and category.'),
+    ]
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _rebuild_for_projects(self, project_ids=None):
+        """
+        Replace the document breakdown of the given projects.
+
+        Args:
+            project_ids: List of project.project IDs, or None for all projects
+        """
+        self._flush_sources()
+        if project_ids is None:
+            self.env.cr.execute("DELETE FROM project_statistic_document")
+            self._insert_documents('', '', [])
+        else:
+            project_ids = list(project_ids)
+            if not project_ids:
+                return
+            self.env.cr.execute(
+                "DELETE FROM project_statistic_document WHERE project_id = ANY(%s)", [project_ids]
+            )
+            self._insert_documents('', 'AND project.id = ANY(%s)', [project_ids])
+        self.invalidate_model()
+
+    @api.model
+    def _rebuild_documents(self, pairs):
+        """
+        Rebuild the breakdown rows of the changed (analytic account, document)
+        pairs for all projects on these accounts. A move_id of None stands for
+        the summed rows without a document of the account.
+
+        Args:
+            pairs: Iterable of (analytic_account_id, move_id or None) tuples (see
+                   project.statistic.contribution _mark_rows_dirty())
+        """
+        pairs = list(set(pairs))
+        if not pairs:
+            return
+        account_ids = [account_id for account_id, _move_id in pairs]
+        move_ids = [move_id for _account_id, move_id in pairs]
+
+        self._flush_sources()
+        self.env.cr.execute("""
+            DELETE FROM project_statistic_document document
+             USING unnest(%s::int[], %s::int[]) AS pair(account_id, move_id)
+             WHERE document.account_id = pair.account_id
+               AND document.move_id IS NOT DISTINCT FROM pair.move_id
+        """, [account_ids, move_ids])
+        self._insert_documents("""
+            JOIN unnest(%s::int[], %s::int[]) AS pair(account_id, move_id)
+              ON pair.account_id = contribution.account_id
+             AND pair.move_id IS NOT DISTINCT FROM contribution.move_id
+        """, '', [account_ids, move_ids])
+        self.invalidate_model()
+        _logger.debug(f"Rebuilt {len(pairs)} project statistic document breakdown pair(s)")
+
+    @api.model
+    def _flush_sources(self):
+        self.env['project.statistic.contribution'].flush_model()
+        self.env['project.project'].flush_model(['account_id'])
+        self.flush_model()
+
+    @api.model
+    def _insert_documents(self, join_sql, where_sql, params):
+        """
+        INSERT ... SELECT the ledger sums per (project, document, category).
+        Ledger rows without a document form one group per (project, category).
+
+        Args:
+            join_sql: Additional JOIN restricting the ledger rows
+            where_sql: Additional WHERE condition (starting with AND)
+            params: Query parameters of join_sql followed by those of where_sql
+        """
+        self.env.cr.execute(f"""
+            INSERT INTO project_statistic_document (
+                project_id, account_id, move_id, category, date,
+                amount_net, amount_gross, paid_net, paid_gross, paid_share
+            )
+            SELECT project.id,
+                   contribution.account_id,
+                   contribution.move_id,
+                   contribution.category,
+                   MIN(contribution.date),
+                   SUM(contribution.amount_net),
+                   SUM(contribution.amount_gross),
+                   SUM(contribution.amount_net * contribution.payment_ratio),
+                   SUM(contribution.amount_gross * contribution.payment_ratio),
+                   CASE WHEN SUM(contribution.amount_net) <> 0
+                        THEN SUM(contribution.amount_net * contribution.payment_ratio) / SUM(contribution.amount_net)
+                        ELSE 0.0
+                   END
+              FROM project_statistic_contribution contribution
+              JOIN project_project project ON project.account_id = contribution.account_id
+              {join_sql}
+             WHERE TRUE
+                   {where_sql}
+          GROUP BY project.id, contribution.account_id, contribution.move_id, contribution.category
+        """, params)
@@ -0,0 +1,247 @@
+from odoo import models, api, _
+from odoo.exceptions import UserError
+from odoo.tools import SQL
+import csv
+import io
+import logging
+
+_logger = logging.getLogger(__name__)
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Export formats: {format: (file extension, mimetype)}
+EXPORT_FORMATS = {
+    'csv': ('csv', 'text/csv; charset=utf-8'),
+    'xlsx': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'parquet': ('parquet', 'application/vnd.apache.parquet'),
+}
+
+# Exported project columns ahead of the financial fields; "field.name" columns
+# are read from the linked record
+IDENTITY_COLUMNS = ['id', 'name', 'partner_id.name', 'user_id.login', 'company_id.name', 'account_id.code']
+
+# Additional stored fields besides the base and derived financial fields
+EXTRA_COLUMNS = [
+    'has_analytic_account', 'data_availability_status',
+    'sale_order_amount_net', 'sale_order_tax_names', 'has_sales_orders',
+]
+
+# Parquet column type per Odoo field type (everything else is exported as string)
+PARQUET_TYPES = {
+    'integer': 'int64',
+    'many2one': 'int64',
+    'float': 'float64',
+    'monetary': 'float64',
+    'boolean': 'bool_',
+    'date': 'date32',
+}
+
+
+class ProjectStatisticExport(models.AbstractModel):
+    """
+    Bulk export of the stored project statistic fields to CSV, XLSX or Parquet.
+
+    The standard list export reads every record and every field into memory
+    at once. This export selects the stored columns straight from
+    project_project through a server-side cursor (DECLARE ... CURSOR /
+    FETCH FORWARD) and writes them chunk by chunk
+    (project_statistic.export_chunk_size rows), so memory stays flat
+    regardless of the number of projects. Date range, company filter and
+    record rules are applied in the database (the domain is compiled with
+    _search()).
+
+    Used by the export wizard through the /project_statistic/export controller.
+    """
+    _name = 'project.statistic.export'
+    _description = 'Project Statistic Export'
+
+    @api.model
+    def _get_export_columns(self):
+        """
+        Exported columns: identity, base financial fields, derived financial
+        fields and the other stored project statistic fields.
+
+        Returns:
+            list: Column paths ('field' or 'many2one_field.field')
+        """
+        Project = self.env['project.project']
+        base_fields = Project._get_financial_base_fields()
+        derived_fields = list(Project._get_derived_financial_values(dict.fromkeys(base_fields, 0.0), 1.0, 1.0))
+        return IDENTITY_COLUMNS + base_fields + derived_fields + EXTRA_COLUMNS
+
+    @api.model
+    def _get_domain(self, date_from=None, date_to=None, company_ids=None):
+        """
+        Project domain of an export.
+
+        Projects are included if their runtime (date_start - date) overlaps the
+        date range; open start or end dates count as unbounded. Projects without
+        company are included in every company filter.
+
+        Args:
+            date_from: First date (inclusive), or None
+            date_to: Last date (inclusive), or None
+            company_ids: Restrict to these companies, or None for all allowed companies
+
+        Returns:
+            list: Domain on project.project
+        """
+        domain = []
+        if date_from:
+            domain += ['|', ('date', '=', False), ('date', '>=', date_from)]
+        if date_to:
+            domain += ['|', ('date_start', '=', False), ('date_start', '<=', date_to)]
+        if company_ids is not None:
+            # Projects without company are shared by all companies
+            domain.append(('company_id', 'in', list(company_ids) + [False]))
+        return domain
+
+    @api.model
+    def _get_column_field(self, path):
+        """Return the field definition of a column path."""
+        Project = self.env['project.project']
+        if '.' not in path:
+            return Project._fields[path]
+        fname, related_fname = path.split('.', 1)
+        return self.env[Project._fields[fname].comodel_name]._fields[related_fname]
+
+    @api.model
+    def _get_column_label(self, path):
+        """Column header: the label of the project field (of the many2one for 'field.name' columns)."""
+        return self.env['project.project']._fields[path.split('.', 1)[0]].string
+
+    @api.model
+    def _get_column_sql(self, query, path):
+        """
+        SQL expression of a column path, adding a LEFT JOIN to the query for
+        'many2one_field.field' columns.
+        """
+        Project = self.env['project.project']
+        if '.' not in path:
+            return Project._field_to_sql(Project._table, path, query)
+        fname, related_fname = path.split('.', 1)
+        comodel = self.env[Project._fields[fname].comodel_name]
+        alias = query.make_alias(Project._table, fname)
+        query.add_join('LEFT JOIN', alias, comodel._table, SQL(
+            "%s = %s", SQL.identifier(Project._table, fname), SQL.identifier(alias, 'id'),
+        ))
+        return comodel._field_to_sql(alias, related_fname, query)
+
+    @api.model
+    def _iter_chunks(self, columns, domain, chunk_size=None):
+        """
+        Yield the rows of the matching projects in chunks of chunk_size, read
+        through a server-side cursor ordered by project ID.
+
+        Args:
+            columns: Column paths (see _get_export_columns())
+            domain: Domain on project.project
+            chunk_size: Rows per chunk (default: project_statistic.export_chunk_size)
+
+        Yields:
+            list: Tuples of column values
+        """
+        chunk_size = chunk_size or self.env['project.statistic.cache']._get_settings()['export_chunk_size']
+        Project = self.env['project.project']
+        Project.check_access('read')
+        query = Project._search(domain, order='id')
+        select_sql = query.select(*[self._get_column_sql(query, path) for path in columns])
+
+        cursor_name = SQL.identifier('project_statistic_export')
+        self.env.cr.execute(SQL("DECLARE %s NO SCROLL CURSOR FOR %s", cursor_name, select_sql))
+        try:
+            while True:
+                self.env.cr.execute(SQL("FETCH FORWARD %s FROM %s", chunk_size, cursor_name))
+                rows = self.env.cr.fetchall()
+                if not rows:
+                    break
+                yield rows
+        finally:
+            self.env.cr.execute(SQL("CLOSE %s", cursor_name))
+
+    @api.model
+    def _export(self, file_format, fileobj, domain, chunk_size=None):
+        """
+        Write the export of the matching projects to a binary file object.
+
+        Args:
+            file_format: 'csv', 'xlsx' or 'parquet'
+            fileobj: Writable binary file object (a temporary file for large exports)
+            domain: Domain on project.project (see _get_domain())
+            chunk_size: Rows per chunk (default: project_statistic.export_chunk_size)
+
+        Returns:
+            int: Number of exported projects
+        """
+        if file_format not in EXPORT_FORMATS:
+            raise UserError(_("Unsupported export format: %s", file_format))
+        columns = self._get_export_columns()
+        writer = getattr(self, f'_export_{file_format}')
+        count = writer(fileobj, columns, self._iter_chunks(columns, domain, chunk_size))
+        _logger.info(f"Exported {count} project(s) as {file_format}")
+        return count
+
+    @api.model
+    def _export_csv(self, fileobj, columns, chunks):
+        stream = io.TextIOWrapper(fileobj, encoding='utf-8', newline='')
+        writer = csv.writer(stream)
+        writer.writerow([self._get_column_label(path) for path in columns])
+        count = 0
+        for rows in chunks:
+            writer.writerows(rows)
+            count += len(rows)
+        stream.flush()
+        # Leave fileobj open for the caller
+        stream.detach()
+        return count
+
+    @api.model
+    def _export_xlsx(self, fileobj, columns, chunks):
+        if xlsxwriter is None:
+            raise UserError(_("XLSX export requires the Python package xlsxwriter."))
+        # constant_memory: every row is flushed to disk once the next row starts
+        workbook = xlsxwriter.Workbook(fileobj, {'constant_memory': True})
+        worksheet = workbook.add_worksheet(_('Project Statistic'))
+        bold = workbook.add_format({'bold': True})
+        date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+        worksheet.write_row(0, 0, [self._get_column_label(path) for path in columns], bold)
+        count = 0
+        for rows in chunks:
+            for row in rows:
+                count += 1
+                for col, value in enumerate(row):
+                    if value is None:
+                        continue
+                    if hasattr(value, 'isoformat'):
+                        worksheet.write_datetime(count, col, value, date_format)
+                    else:
+                        worksheet.write(count, col, value)
+        workbook.close()
+        return count
+
+    @api.model
+    def _export_parquet(self, fileobj, columns, chunks):
+        if pyarrow is None:
+            raise UserError(_("Parquet export requires the Python package pyarrow."))
+        schema = pyarrow.schema([
+            (path, getattr(pyarrow, PARQUET_TYPES.get(self._get_column_field(path).type, 'string'))())
+            for path in columns
+        ])
+        count = 0
+        # One row group per chunk
+        with pyarrow.parquet.ParquetWriter(fileobj, schema) as writer:
+            for rows in chunks:
+                writer.write_table(pyarrow.Table.from_pylist(
+                    [dict(zip(columns, row)) for row in rows], schema=schema,
+                ))
+                count += len(rows)
+        return count
@@ -0,0 +1,263 @@
+from odoo import models, fields, api
+from odoo.tools.sql import create_index
+import logging
+
+from .project_statistic_contribution import TOTAL_KEYS
+
+_logger = logging.getLogger(__name__)
+
+# Sign of a category in the revenue and cost measures (P&L = revenue - costs),
+# same formula as profit_loss_net in project.project _get_derived_financial_values()
+REVENUE_SIGNS = {'invoice': 1, 'credit_note': 1, 'skonto_customer': -1}
+COST_SIGNS = {'bill': 1, 'refund': 1, 'timesheet': 1, 'other_cost': 1, 'skonto_vendor': -1}
+
+
+def _signed_sum_sql(signs):
+    """SUM(amount_net) signed per category, for the GROUP BY of _insert_aggregates()."""
+    cases = ' '.join(f"WHEN '{category}' THEN {sign}" for category, sign in signs.items())
+    return f"SUM(contribution.amount_net) * (CASE contribution.category {cases} ELSE 0 END)"
+
+
+class ProjectStatisticMonthly(models.Model):
+    """
+    Monthly aggregates of the contribution ledger per (project, month, category).
+
+    The stored project fields are lifetime totals. This table answers
+    date-range questions ("Q3 P&L per project") without rescanning the source
+    lines: the pivot/graph views group it by month, and
+    project.project get_financial_figures_for_period() sums it for a range.
+
+    Maintenance:
+    - the ledger statements of the hooks record the (analytic account, month)
+      buckets of the rows they insert, delete or re-ratio; only these buckets
+      are rebuilt, once per transaction (_rebuild_months())
+    - a full project recompute rebuilds all months of its projects
+      (_rebuild_for_projects())
+
+    Adjusted hours use the employee HFC factor at rebuild time; a factor change
+    marks the buckets of the employee's timesheets as changed.
+    """
+    _name = 'project.statistic.monthly'
+    _description = 'Project Statistic Monthly Aggregate'
+    _order = 'month desc, project_id, category'
+    _log_access = False
+
+    project_id = fields.Many2one(
+        'project.project',
+        string='Project',
+        required=True,
+        ondelete='cascade',
+        readonly=True,
+        index=True,
+    )
+    account_id = fields.Many2one(
+        'account.analytic.account',
+        string='Analytic Account',
+        required=True,
+        ondelete='cascade',
+        readonly=True,
+    )
+    month = fields.Date(
+        string='Month',
+        required=True,
+        readonly=True,
+        help="First day of the month."
+    )
+    category = fields.Selection(
+        selection=lambda self: self.env['project.statistic.contribution']._fields['category'].selection,
+        string='Category',
+        required=True,
+        readonly=True,
+    )
+    amount_net = fields.Float(string='Amount (NET)', readonly=True)
+    amount_gross = fields.Float(string='Amount (GROSS)', readonly=True)
+    paid_net = fields.Float(string='Paid (NET)', readonly=True)
+    paid_gross = fields.Float(string='Paid (GROSS)', readonly=True)
+    hours = fields.Float(string='Hours', readonly=True)
+    adjusted_hours = fields.Float(string='Hours (Adjusted)', readonly=True)
+    revenue_net = fields.Float(
+        string='Revenue (NET)',
+        readonly=True,
+        help="Invoices and credit notes minus customer Skonto."
+    )
+    costs_net = fields.Float(
+        string='Costs (NET)',
+        readonly=True,
+        help="Vendor bills minus vendor Skonto, plus labor and other costs."
+    )
+    profit_loss_net = fields.Float(
+        string='Profit/Loss (NET)',
+        readonly=True,
+        help="Revenue (NET) - Costs (NET), like Profit/Loss (NET) of the project."
+    )
+
+    _sql_constraints = [
+        ('project_month_category_uniq', 'UNIQUE(project_id, month, category)',
+         'Only one aggregate per project, month and category.'),
+    ]
+
+    def init(self):
+        create_index(
+            self.env.cr,
+            'project_statistic_monthly_account_month_idx',
+            self._table,
+            ['account_id', 'month'],
+        )
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _rebuild_for_projects(self, project_ids=None):
+        """
+        Replace all monthly aggregates of the given projects.
+
+        Args:
+            project_ids: List of project.project IDs, or None for all projects
+        """
+        self._flush_sources()
+        if project_ids is None:
+            self.env.cr.execute("DELETE FROM project_statistic_monthly")
+            self._insert_aggregates('', '', [])
+        else:
+            project_ids = list(project_ids)
+            if not project_ids:
+                return
+            self.env.cr.execute(
+                "DELETE FROM project_statistic_monthly WHERE project_id = ANY(%s)", [project_ids]
+            )
+            self._insert_aggregates('', 'AND project.id = ANY(%s)', [project_ids])
+        self.invalidate_model()
+
+    @api.model
+    def _rebuild_months(self, buckets):
+        """
+        Rebuild the aggregates of the changed (analytic account, month) buckets
+        for all projects on these accounts.
+
+        Args:
+            buckets: Iterable of (analytic_account_id, month) tuples, month being
+                     the first day of the month (see project.statistic.contribution
+                     _mark_months_dirty())
+        """
+        buckets = list(set(buckets))
+        if not buckets:
+            return
+        account_ids = [account_id for account_id, _month in buckets]
+        months = [month for _account_id, month in buckets]
+
+        self._flush_sources()
+        self.env.cr.execute("""
+            DELETE FROM project_statistic_monthly monthly
+             USING unnest(%s::int[], %s::date[]) AS bucket(account_id, month)
+             WHERE monthly.account_id = bucket.account_id
+               AND monthly.month = bucket.month
+        """, [account_ids, months])
+        self._insert_aggregates("""
+            JOIN unnest(%s::int[], %s::date[]) AS bucket(account_id, month)
+              ON bucket.account_id = contribution.account_id
+             AND contribution.date >= bucket.month
+             AND contribution.date < bucket.month + INTERVAL '1 month'
+        """, '', [account_ids, months])
+        self.invalidate_model()
+        _logger.debug(f"Rebuilt {len(buckets)} monthly project statistic bucket(s)")
+
+    @api.model
+    def _flush_sources(self):
+        self.env['project.statistic.contribution'].flush_model()
+        self.env['project.project'].flush_model(['account_id'])
+        self.env['hr.employee'].flush_model(['faktor_hfc'])
+        self.flush_model()
+
+    @api.model
+    def _insert_aggregates(self, join_sql, where_sql, params):
+        """
+        INSERT ... SELECT the ledger sums per (project, month, category).
+
+        Args:
+            join_sql: Additional JOIN restricting the ledger rows
+            where_sql: Additional WHERE condition (starting with AND)
+            params: Query parameters of join_sql followed by those of where_sql
+        """
+        self.env.cr.execute(f"""
+            INSERT INTO project_statistic_monthly (
+                project_id, account_id, month, category,
+                amount_net, amount_gross, paid_net, paid_gross, hours, adjusted_hours,
+                revenue_net, costs_net, profit_loss_net
+            )
+            SELECT project.id,
+                   contribution.account_id,
+                   date_trunc('month', contribution.date)::date,
+                   contribution.category,
+                   SUM(contribution.amount_net),
+                   SUM(contribution.amount_gross),
+                   SUM(contribution.amount_net * contribution.payment_ratio),
+                   SUM(contribution.amount_gross * contribution.payment_ratio),
+                   SUM(contribution.hours),
+                   SUM(contribution.hours * COALESCE(NULLIF(employee.faktor_hfc, 0), 1.0)),
+                   {_signed_sum_sql(REVENUE_SIGNS)},
+                   {_signed_sum_sql(COST_SIGNS)},
+                   {_signed_sum_sql(REVENUE_SIGNS)} - {_signed_sum_sql(COST_SIGNS)}
+              FROM project_statistic_contribution contribution
+              JOIN project_project project ON project.account_id = contribution.account_id
+              {join_sql}
+         LEFT JOIN hr_employee employee ON employee.id = contribution.employee_id
+             WHERE contribution.date IS NOT NULL
+                   {where_sql}
+          GROUP BY project.id, contribution.account_id, date_trunc('month', contribution.date), contribution.category
+        """, params)
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _get_totals(self, project_ids, date_from=None, date_to=None):
+        """
+        Sum the aggregates per (project, category) over a range of months.
+
+        Buckets are whole months: every month overlapping [date_from, date_to]
+        is included.
+
+        Args:
+            project_ids: List of project.project IDs
+            date_from: First date (inclusive), or None for no lower bound
+            date_to: Last date (inclusive), or None for no upper bound
+
+        Returns:
+            dict: {project_id: {category: {'amount_net', 'amount_gross', 'paid_net',
+                  'paid_gross', 'hours', 'adjusted_hours'}}}
+        """
+        if not project_ids:
+            return {}
+        conditions = ['project_id = ANY(%s)']
+        params = [list(project_ids)]
+        if date_from:
+            conditions.append("month >= date_trunc('month', %s::date)")
+            params.append(fields.Date.to_date(date_from))
+        if date_to:
+            conditions.append('month <= %s')
+            params.append(fields.Date.to_date(date_to))
+
+        self.flush_model()
+        self.env.cr.execute(f"""
+            SELECT project_id,
+                   category,
+                   SUM(amount_net) AS amount_net,
+                   SUM(amount_gross) AS amount_gross,
+                   SUM(paid_net) AS paid_net,
+                   SUM(paid_gross) AS paid_gross,
+                   SUM(hours) AS hours,
+                   SUM(adjusted_hours) AS adjusted_hours
+              FROM project_statistic_monthly
+             WHERE {' AND '.join(conditions)}
+          GROUP BY project_id, category
+        """, params)
+
+        totals = {}
+        for row in self.env.cr.dictfetchall():
+            totals.setdefault(row['project_id'], {})[row['category']] = {
+                key: float(row[key] or 0.0) for key in TOTAL_KEYS
+            }
+        return totals
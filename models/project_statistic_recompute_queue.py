@@ -0,0 +1,221 @@
+from odoo import models, fields, api
+import logging
+import threading
+
+_logger = logging.getLogger(__name__)
+
+# Values of the project_statistic.recompute_mode system parameter
+RECOMPUTE_MODE_SYNC = 'sync'
+RECOMPUTE_MODE_QUEUE = 'queue'
+
+
+class ProjectStatisticRecomputeQueue(models.Model):
+    """
+    Durable queue of projects whose financial data must be recomputed.
+
+    In queued mode (system parameter project_statistic.recompute_mode = 'queue')
+    the account.move.line / account.analytic.line hooks only synchronize the
+    contribution ledger and enqueue the affected projects here. The project
+    fields are updated later by the cron job (_cron_process_queue()), outside
+    of the user's transaction, so posting large bills or importing timesheets
+    no longer holds locks on project rows.
+
+    One row per project (unique): enqueueing an already pending project is a
+    no-op, so any number of changes to a project collapse into one recompute.
+    """
+    _name = 'project.statistic.recompute.queue'
+    _description = 'Project Statistic Recompute Queue'
+    _order = 'enqueued_at, id'
+    _log_access = False
+
+    project_id = fields.Many2one(
+        'project.project',
+        string='Project',
+        required=True,
+        ondelete='cascade',
+        readonly=True,
+    )
+    enqueued_at = fields.Datetime(
+        string='Enqueued At',
+        readonly=True,
+    )
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('failed', 'Failed'),
+    ], string='State',
+        required=True,
+        default='pending',
+        readonly=True,
+        help="Failed entries exceeded project_statistic.queue_max_attempts and are no longer retried "
+             "until the project changes again."
+    )
+    attempts = fields.Integer(
+        string='Attempts',
+        readonly=True,
+        help="Number of failed recompute attempts."
+    )
+    last_error = fields.Text(
+        string='Last Error',
+        readonly=True,
+    )
+
+    _sql_constraints = [
+        ('project_uniq', 'UNIQUE(project_id)', 'A project can only be queued once.'),
+    ]
+
+    # -------------------------------------------------------------------------
+    # Configuration
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _get_recompute_mode(self):
+        """
+        Per-database switch between synchronous and queued hook processing.
+
+        Returns:
+            str: 'sync' (default) or 'queue'
+        """
+        mode = self.env['project.statistic.cache']._get_settings()['recompute_mode']
+        return RECOMPUTE_MODE_QUEUE if mode == RECOMPUTE_MODE_QUEUE else RECOMPUTE_MODE_SYNC
+
+    # -------------------------------------------------------------------------
+    # Enqueue
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _enqueue_projects(self, project_ids):
+        """
+        Mark projects as dirty (deduplicated, one statement).
+
+        Pending entries are left untouched; failed entries are reset to pending
+        with a fresh attempt counter, since the project changed again.
+
+        Args:
+            project_ids: Iterable of project.project IDs
+
+        Returns:
+            int: Number of projects that were newly (re)queued
+        """
+        project_ids = list(set(project_ids))
+        if not project_ids:
+            return 0
+        self.flush_model()
+        self.env.cr.execute("""
+            INSERT INTO project_statistic_recompute_queue (project_id, enqueued_at, state, attempts)
+            SELECT project_id, NOW() AT TIME ZONE 'UTC', 'pending', 0
+              FROM unnest(%s::int[]) AS project_id
+            ON CONFLICT (project_id) DO UPDATE
+               SET state = 'pending',
+                   attempts = 0,
+                   enqueued_at = EXCLUDED.enqueued_at
+             WHERE project_statistic_recompute_queue.state = 'failed'
+        """, [project_ids])
+        count = self.env.cr.rowcount
+        self.invalidate_model()
+        return count
+
+    # -------------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _cron_process_queue(self, chunk_size=None, max_chunks=None):
+        """
+        Cron worker: drain the queue in chunks with one commit per chunk.
+
+        Each chunk is locked with FOR UPDATE SKIP LOCKED, so several workers
+        can drain the queue concurrently. If a chunk fails, it is rolled back
+        and retried project by project, so a single broken project does not
+        block the others. Failing projects stay queued with an increased
+        attempt counter and are marked 'failed' after
+        project_statistic.queue_max_attempts attempts.
+
+        Args:
+            chunk_size: Projects per chunk (default: project_statistic.queue_chunk_size, 100)
+            max_chunks: Stop after this many chunks (default: until the queue is empty)
+
+        Returns:
+            int: Number of projects recomputed
+        """
+        settings = self.env['project.statistic.cache']._get_settings()
+        chunk_size = chunk_size or settings['queue_chunk_size']
+        max_attempts = settings['queue_max_attempts']
+
+        processed = 0
+        failed = 0
+        chunks = 0
+        seen_ids = set()
+        while max_chunks is None or chunks < max_chunks:
+            self.flush_model()
+            self.env.cr.execute("""
+                SELECT id, project_id
+                  FROM project_statistic_recompute_queue
+                 WHERE state = 'pending'
+                   AND NOT (id = ANY(%s))
+              ORDER BY enqueued_at, id
+                 LIMIT %s
+                   FOR UPDATE SKIP LOCKED
+            """, [list(seen_ids), chunk_size])
+            rows = self.env.cr.fetchall()
+            if not rows:
+                break
+            chunks += 1
+            seen_ids.update(queue_id for queue_id, _project_id in rows)
+
+            try:
+                with self.env.cr.savepoint():
+                    self._recompute_entries(rows)
+                processed += len(rows)
+            except Exception as e:
+                _logger.warning(f"Recompute of {len(rows)} queued project(s) failed ({e}), retrying one by one")
+                for row in rows:
+                    try:
+                        with self.env.cr.savepoint():
+                            self._recompute_entries([row])
+                        processed += 1
+                    except Exception as e:
+                        failed += 1
+                        self._record_failure(row[0], e, max_attempts)
+
+            self._commit_chunk()
+
+        if processed or failed:
+            _logger.info(f"Recompute queue: {processed} project(s) recomputed, {failed} failed")
+        return processed
+
+    @api.model
+    def _recompute_entries(self, rows):
+        """
+        Recompute the projects of queue rows from the ledger and dequeue them.
+
+        Args:
+            rows: List of (queue_id, project_id) tuples
+        """
+        projects = self.env['project.project'].sudo().browse([project_id for _queue_id, project_id in rows]).exists()
+        projects.invalidate_recordset()
+        projects.with_context(project_statistic_ledger_synced=True)._compute_financial_data()
+        projects.flush_recordset()
+        self.env.cr.execute(
+            "DELETE FROM project_statistic_recompute_queue WHERE id = ANY(%s)",
+            [[queue_id for queue_id, _project_id in rows]],
+        )
+        self.invalidate_model()
+
+    @api.model
+    def _record_failure(self, queue_id, error, max_attempts):
+        """Increase the attempt counter of a queue row; mark it failed after max_attempts."""
+        _logger.error(f"Recompute of queue entry {queue_id} failed: {error}")
+        self.env.cr.execute("""
+            UPDATE project_statistic_recompute_queue
+               SET attempts = attempts + 1,
+                   last_error = %s,
+                   state = CASE WHEN attempts + 1 >= %s THEN 'failed' ELSE 'pending' END
+             WHERE id = %s
+        """, [str(error), max_attempts, queue_id])
+        self.invalidate_model()
+
+    @api.model
+    def _commit_chunk(self):
+        """Commit the processed chunk (skipped in tests, which must not commit)."""
+        if not getattr(threading.current_thread(), 'testing', False):
+            self.env.cr.commit()
@@ -0,0 +1,233 @@
+from odoo import models, fields, api, _
+import logging
+import threading
+import time
+
+_logger = logging.getLogger(__name__)
+
+
+class ProjectStatisticRefreshJob(models.Model):
+    """
+    Background run of the full financial data recalculation.
+
+    The Refresh Financial Data wizard (and the project button for large
+    selections) no longer recalculate inside the HTTP request. They create a
+    job that the cron "Project Statistic: Run Refresh Jobs" processes:
+
+    - projects are processed in ascending ID order, in chunks of
+      project_statistic.refresh_job_chunk_size, with one commit per chunk
+    - last_project_id is the checkpoint: after a crash or a timeout the next
+      cron run resumes after the last committed chunk
+    - a failing chunk is rolled back to its savepoint, logged and skipped,
+      the other chunks still complete
+    - start, completion and failures are sent to the requesting user through
+      the bus
+    """
+    _name = 'project.statistic.refresh.job'
+    _description = 'Project Statistic Refresh Job'
+    _order = 'id desc'
+
+    user_id = fields.Many2one(
+        'res.users',
+        string='Requested By',
+        required=True,
+        readonly=True,
+        default=lambda self: self.env.user,
+    )
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+    ], string='State',
+        required=True,
+        default='pending',
+        readonly=True,
+    )
+    all_projects = fields.Boolean(
+        string='All Projects',
+        readonly=True,
+        help="Recalculate all projects instead of the selected ones."
+    )
+    project_ids = fields.Many2many(
+        'project.project',
+        'project_statistic_refresh_job_project_rel',
+        'job_id', 'project_id',
+        string='Projects',
+        readonly=True,
+    )
+    last_project_id = fields.Integer(
+        string='Checkpoint',
+        readonly=True,
+        help="ID of the last project of the last committed chunk. Processing resumes after it."
+    )
+    total_count = fields.Integer(string='Total Projects', readonly=True)
+    done_count = fields.Integer(string='Processed Projects', readonly=True)
+    failed_count = fields.Integer(string='Failed Projects', readonly=True)
+    progress = fields.Float(
+        string='Progress (%)',
+        compute='_compute_progress',
+    )
+    date_start = fields.Datetime(string='Started', readonly=True)
+    date_end = fields.Datetime(string='Finished', readonly=True)
+    error_log = fields.Text(string='Errors', readonly=True)
+
+    @api.depends('done_count', 'total_count')
+    def _compute_progress(self):
+        for job in self:
+            job.progress = 100.0 * job.done_count / job.total_count if job.total_count else 0.0
+
+    # -------------------------------------------------------------------------
+    # Start
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _start(self, projects=None):
+        """
+        Create a refresh job and wake up the cron to run it right away.
+
+        Args:
+            projects: project.project recordset, or None for all projects
+
+        Returns:
+            project.statistic.refresh.job record
+        """
+        job = self.sudo().create({
+            'user_id': self.env.user.id,
+            'all_projects': projects is None,
+            'project_ids': [(6, 0, projects.ids)] if projects is not None else [],
+        })
+        cron = self.env.ref('project_statistic.ir_cron_project_statistic_refresh_job', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+        return job
+
+    # -------------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _cron_run_jobs(self, max_seconds=None):
+        """
+        Cron worker: run pending jobs and resume interrupted ones.
+
+        Stops after max_seconds (default project_statistic.refresh_job_max_seconds,
+        300) and re-triggers itself, so a single run never hits the cron time limit.
+
+        Returns:
+            bool: True if all jobs are finished
+        """
+        if max_seconds is None:
+            max_seconds = self.env['project.statistic.cache']._get_settings()['refresh_job_max_seconds']
+        deadline = time.monotonic() + max_seconds
+
+        for job in self.search([('state', 'in', ('pending', 'running'))], order='id'):
+            if not job._run(deadline):
+                cron = self.env.ref('project_statistic.ir_cron_project_statistic_refresh_job', raise_if_not_found=False)
+                if cron:
+                    cron._trigger()
+                return False
+        return True
+
+    def _run(self, deadline):
+        """
+        Process the job chunk by chunk until it is finished or the deadline passed.
+
+        Returns:
+            bool: True if the job is finished
+        """
+        self.ensure_one()
+        chunk_size = self.env['project.statistic.cache']._get_settings()['refresh_job_chunk_size']
+
+        if self.state == 'pending':
+            self.write({
+                'state': 'running',
+                'date_start': fields.Datetime.now(),
+                'total_count': self.env['project.project'].search_count(self._get_project_domain()),
+            })
+            self._commit_chunk()
+            self._notify_user(
+                _('Financial Data Refresh Started'),
+                _('Recalculating %s project(s) in the background.') % self.total_count,
+                'info',
+            )
+        else:
+            _logger.info(f"Resuming refresh job {self.id} after project {self.last_project_id}")
+
+        while True:
+            projects = self.env['project.project'].search(
+                self._get_project_domain() + [('id', '>', self.last_project_id)],
+                order='id', limit=chunk_size,
+            )
+            if not projects:
+                self._finish()
+                return True
+
+            failed_count = self.failed_count
+            error_log = self.error_log or ''
+            try:
+                with self.env.cr.savepoint():
+                    projects.invalidate_recordset()
+                    projects._compute_financial_data()
+                    projects.flush_recordset()
+            except Exception as e:
+                self.env.invalidate_all()
+                _logger.error(f"Refresh job {self.id}: chunk {projects.ids[0]}-{projects.ids[-1]} failed: {e}",
+                              exc_info=True)
+                failed_count += len(projects)
+                error_log += f"Projects {projects.ids[0]}-{projects.ids[-1]}: {e}\n"
+
+            self.write({
+                'last_project_id': projects.ids[-1],
+                'done_count': self.done_count + len(projects),
+                'failed_count': failed_count,
+                'error_log': error_log or False,
+            })
+            self._commit_chunk()
+
+            if time.monotonic() > deadline:
+                return False
+
+    def _get_project_domain(self):
+        """Domain of the projects covered by the job."""
+        self.ensure_one()
+        if self.all_projects:
+            return []
+        return [('id', 'in', self.project_ids.ids)]
+
+    def _finish(self):
+        """Mark the job done and report the result to the requesting user."""
+        self.write({
+            'state': 'done',
+            'date_end': fields.Datetime.now(),
+        })
+        self._commit_chunk()
+        if self.failed_count:
+            self._notify_user(
+                _('Financial Data Refresh Finished With Errors'),
+                _('%s of %s project(s) could not be recalculated. See the refresh job for details.') % (
+                    self.failed_count, self.done_count
+                ),
+                'warning',
+            )
+        else:
+            self._notify_user(
+                _('Financial Data Refreshed'),
+                _('Financial data has been recalculated for %s project(s).') % self.done_count,
+                'success',
+            )
+
+    def _notify_user(self, title, message, notification_type):
+        """Send a notification to the user who started the job."""
+        self.ensure_one()
+        self.env['bus.bus']._sendone(self.user_id.partner_id, 'simple_notification', {
+            'title': title,
+            'message': message,
+            'type': notification_type,
+            'sticky': notification_type == 'warning',
+        })
+
+    @api.model
+    def _commit_chunk(self):
+        """Commit the processed chunk (skipped in tests, which must not commit)."""
+        if not getattr(threading.current_thread(), 'testing', False):
+            self.env.cr.commit()
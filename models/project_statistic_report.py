@@ -0,0 +1,83 @@
+from odoo import models, fields, api
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class ProjectStatisticReport(models.Model):
+    """
+    Read-only portfolio reporting model for the pivot and graph views.
+
+    Backed by the materialized view project_statistic_report: the monthly
+    aggregates (project.statistic.monthly) joined with the project dimensions
+    customer, project manager and company. Grouping it never touches the wide
+    project.project table or the ledger, so portfolio pivots over many
+    projects and months open in milliseconds.
+
+    The view is a snapshot. The cron "Project Statistic: Refresh Reporting
+    View" refreshes it with REFRESH MATERIALIZED VIEW CONCURRENTLY, which does
+    not block readers (a unique index on id makes that possible).
+    """
+    _name = 'project.statistic.report'
+    _description = 'Project Statistic Analysis'
+    _auto = False
+    _order = 'month desc, project_id'
+
+    project_id = fields.Many2one('project.project', string='Project', readonly=True)
+    partner_id = fields.Many2one('res.partner', string='Customer', readonly=True)
+    user_id = fields.Many2one('res.users', string='Project Manager', readonly=True)
+    company_id = fields.Many2one('res.company', string='Company', readonly=True)
+    account_id = fields.Many2one('account.analytic.account', string='Analytic Account', readonly=True)
+    month = fields.Date(string='Month', readonly=True)
+    category = fields.Selection(
+        selection=lambda self: self.env['project.statistic.contribution']._fields['category'].selection,
+        string='Category',
+        readonly=True,
+    )
+    amount_net = fields.Float(string='Amount (NET)', readonly=True)
+    paid_net = fields.Float(string='Paid (NET)', readonly=True)
+    hours = fields.Float(string='Hours', readonly=True)
+    adjusted_hours = fields.Float(string='Hours (Adjusted)', readonly=True)
+    revenue_net = fields.Float(string='Revenue (NET)', readonly=True)
+    costs_net = fields.Float(string='Costs (NET)', readonly=True)
+    profit_loss_net = fields.Float(string='Profit/Loss (NET)', readonly=True)
+
+    def init(self):
+        # Recreated on every module update, so column changes are picked up
+        self.env.cr.execute(f"DROP MATERIALIZED VIEW IF EXISTS {self._table}")
+        self.env.cr.execute(f"""
+            CREATE MATERIALIZED VIEW {self._table} AS (
+                SELECT monthly.id AS id,
+                       monthly.project_id,
+                       project.partner_id,
+                       project.user_id,
+                       project.company_id,
+                       monthly.account_id,
+                       monthly.month,
+                       monthly.category,
+                       monthly.amount_net,
+                       monthly.paid_net,
+                       monthly.hours,
+                       monthly.adjusted_hours,
+                       monthly.revenue_net,
+                       monthly.costs_net,
+                       monthly.profit_loss_net
+                  FROM project_statistic_monthly monthly
+                  JOIN project_project project ON project.id = monthly.project_id
+            )
+        """)
+        # Required by REFRESH ... CONCURRENTLY
+        self.env.cr.execute(f"CREATE UNIQUE INDEX {self._table}_id_idx ON {self._table} (id)")
+        self.env.cr.execute(f"CREATE INDEX {self._table}_month_idx ON {self._table} (month)")
+
+    @api.model
+    def _cron_refresh(self):
+        """
+        Cron: refresh the materialized view without blocking readers of the
+        pivot/graph views.
+        """
+        self.env['project.statistic.monthly'].flush_model()
+        self.env['project.project'].flush_model(['partner_id', 'user_id', 'company_id'])
+        self.env.cr.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {self._table}")
+        self.invalidate_model()
+        _logger.info("Project statistic reporting view refreshed")
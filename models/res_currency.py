@@ -0,0 +1,68 @@
+from odoo import models, api
+
+
+class ResCurrency(models.Model):
+    _inherit = 'res.currency'
+
+    @api.model
+    def _get_project_statistic_rate_table(self, keys):
+        """
+        Load the rates of many (currency, company, date) keys in ONE query.
+
+        res.currency _convert() reads the rates with one query per call, which
+        would make the financial compute grow with every foreign-currency
+        document. The batch helpers collect the keys they need first, load them
+        here once and convert in memory with _project_statistic_convert().
+
+        Same lookup as Odoo's _get_rates(): the latest rate on or before the
+        date, of the root company or shared (no company); the oldest rate if
+        there is none before the date; 1.0 if the currency has no rate at all.
+
+        Args:
+            keys: Iterable of (currency_id, company_id, date) tuples
+
+        Returns:
+            dict: {(currency_id, company_id, date): rate}
+        """
+        keys = list(set(keys))
+        if not keys:
+            return {}
+        self.env['res.currency.rate'].flush_model(['rate', 'name', 'currency_id', 'company_id'])
+        self.env.cr.execute("""
+            SELECT req.currency_id, req.company_id, req.date,
+                   COALESCE(
+                       (SELECT r.rate FROM res_currency_rate r
+                         WHERE r.currency_id = req.currency_id
+                           AND r.name <= req.date
+                           AND (r.company_id IS NULL OR r.company_id = root.id)
+                      ORDER BY r.company_id, r.name DESC
+                         LIMIT 1),
+                       (SELECT r.rate FROM res_currency_rate r
+                         WHERE r.currency_id = req.currency_id
+                           AND (r.company_id IS NULL OR r.company_id = root.id)
+                      ORDER BY r.company_id, r.name ASC
+                         LIMIT 1),
+                       1.0
+                   ) AS rate
+              FROM unnest(%s::int[], %s::int[], %s::date[]) AS req(currency_id, company_id, date)
+              JOIN res_company company ON company.id = req.company_id
+              JOIN res_company root ON root.id = split_part(company.parent_path, '/', 1)::int
+        """, [
+            [currency_id for currency_id, _company_id, _date in keys],
+            [company_id for _currency_id, company_id, _date in keys],
+            [date for _currency_id, _company_id, date in keys],
+        ])
+        return {
+            (currency_id, company_id, date): rate
+            for currency_id, company_id, date, rate in self.env.cr.fetchall()
+        }
+
+    @api.model
+    def _project_statistic_convert(self, amount, from_currency_id, to_currency_id, company_id, date, rate_table):
+        """
+        Convert an amount with a rate table from _get_project_statistic_rate_table()
+        (which must contain both currencies for the company and date).
+        """
+        if from_currency_id == to_currency_id:
+            return amount
+        return amount * rate_table[(to_currency_id, company_id, date)] / rate_table[(from_currency_id, company_id, date)]
@@ -1 +1,3 @@
 from . import test_project_analytics
+from . import test_benchmark
+from . import test_query_counts
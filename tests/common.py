@@ -0,0 +1,261 @@
+import random
+
+from odoo import fields
+from odoo.tools.sql import column_exists
+
+# Dataset sizes of the benchmark suite, selected with PROJECT_STATISTIC_BENCH_SCALE
+SCALES = {
+    'small': {
+        'projects': 20,
+        'employees': 10,
+        'moves': 200,
+        'lines_per_move': 5,
+        'skonto_moves': 20,
+        'timesheets_per_project': 50,
+        'other_costs_per_project': 5,
+        'sale_orders_per_project': 1,
+    },
+    'medium': {
+        'projects': 200,
+        'employees': 50,
+        'moves': 2000,
+        'lines_per_move': 5,
+        'skonto_moves': 200,
+        'timesheets_per_project': 200,
+        'other_costs_per_project': 10,
+        'sale_orders_per_project': 2,
+    },
+    'large': {
+        'projects': 2000,
+        'employees': 300,
+        'moves': 20000,
+        'lines_per_move': 5,
+        'skonto_moves': 2000,
+        'timesheets_per_project': 500,
+        'other_costs_per_project': 20,
+        'sale_orders_per_project': 2,
+    },
+}
+
+# Percentage splits of a multi-account analytic distribution
+DISTRIBUTION_SPLITS = [(100,), (100,), (50, 50), (70, 30), (50, 30, 20)]
+
+
+class SyntheticLedgerGenerator:
+    """
+    Generate a realistic project statistic dataset for benchmarks.
+
+    Invoices, bills and Skonto postings are created in batched ORM calls and
+    posted in one action_post(), BEFORE the projects exist, so the hooks skip
+    them cheaply ('non_project_plan'). Timesheets and manual costs are bulk
+    inserted with one SQL statement each. The ledger and the project figures
+    are then built once for the whole dataset, like on module install.
+    """
+
+    def __init__(self, env, seed=42):
+        self.env = env
+        self.rng = random.Random(seed)
+        self.company = env.company
+
+    def generate(self, projects, employees, moves, lines_per_move, skonto_moves,
+                 timesheets_per_project, other_costs_per_project, sale_orders_per_project):
+        """
+        Create the dataset.
+
+        Returns:
+            dict: Created records ('projects', 'employees', 'moves') and row counts
+        """
+        plan = self.env.ref('analytic.analytic_plan_projects')
+        analytic_accounts = self.env['account.analytic.account'].create([
+            {'name': f'Bench Account {i}', 'plan_id': plan.id} for i in range(projects)
+        ])
+        employee_records = self.env['hr.employee'].create([
+            {
+                'name': f'Bench Employee {i}',
+                'faktor_hfc': self.rng.choice([0.6, 0.8, 1.0, 1.0, 1.2]),
+                'hourly_cost': self.rng.choice([35.0, 45.0, 55.0, 70.0]),
+            }
+            for i in range(employees)
+        ])
+        partner = self.env['res.partner'].create({'name': 'Bench Partner'})
+
+        move_records = self._create_moves(analytic_accounts, partner, moves, lines_per_move)
+        move_records |= self._create_skonto_moves(analytic_accounts, skonto_moves)
+        move_records.action_post()
+
+        project_records = self.env['project.project'].with_context(
+            project_statistic_ledger_synced=True
+        ).create([
+            {'name': f'Bench Project {i}', 'account_id': account.id}
+            for i, account in enumerate(analytic_accounts)
+        ])
+        self._create_sale_orders(project_records, partner, sale_orders_per_project)
+        timesheet_count = self._insert_timesheets(project_records, employee_records, timesheets_per_project)
+        other_cost_count = self._insert_other_costs(analytic_accounts, other_costs_per_project)
+
+        self.env.flush_all()
+        self.env['project.statistic.contribution']._rebuild_all()
+        project_records.with_context(project_statistic_ledger_synced=True)._compute_financial_data()
+        self.env.flush_all()
+
+        return {
+            'projects': project_records,
+            'employees': employee_records,
+            'moves': move_records,
+            'counts': {
+                'projects': len(project_records),
+                'employees': len(employee_records),
+                'moves': len(move_records),
+                'move_lines': len(move_records.line_ids),
+                'timesheets': timesheet_count,
+                'other_costs': other_cost_count,
+                'ledger_rows': self.env['project.statistic.contribution'].search_count([]),
+            },
+        }
+
+    def _get_account(self, account_type=None, code=None):
+        """Existing account of a type or code prefix, created if missing."""
+        Account = self.env['account.account']
+        if code:
+            account = Account.search([('code', '=like', f'{code}%')], limit=1)
+            return account or Account.create({
+                'name': f'Bench {code}',
+                'code': f'{code}99',
+                'account_type': 'expense' if code.startswith('7') else 'income_other',
+            })
+        return Account.search([('account_type', '=', account_type)], limit=1)
+
+    def _get_distribution(self, analytic_accounts):
+        split = self.rng.choice(DISTRIBUTION_SPLITS)
+        accounts = self.rng.sample(analytic_accounts.ids, min(len(split), len(analytic_accounts)))
+        return {str(account_id): percentage for account_id, percentage in zip(accounts, split)}
+
+    def _create_moves(self, analytic_accounts, partner, count, lines_per_move):
+        """Customer invoices/credit notes and vendor bills/refunds with distributed lines."""
+        income = self._get_account('income')
+        expense = self._get_account('expense')
+        vals_list = []
+        for _i in range(count):
+            move_type = self.rng.choice(['out_invoice', 'out_invoice', 'out_refund',
+                                         'in_invoice', 'in_invoice', 'in_refund'])
+            account = income if move_type.startswith('out') else expense
+            vals_list.append({
+                'move_type': move_type,
+                'partner_id': partner.id,
+                'invoice_date': self._random_date(),
+                'invoice_line_ids': [(0, 0, {
+                    'name': f'Bench Line {j}',
+                    'quantity': self.rng.randint(1, 10),
+                    'price_unit': round(self.rng.uniform(10.0, 2000.0), 2),
+                    'account_id': account.id,
+                    'analytic_distribution': self._get_distribution(analytic_accounts),
+                }) for j in range(lines_per_move)],
+            })
+        return self.env['account.move'].create(vals_list)
+
+    def _create_skonto_moves(self, analytic_accounts, count):
+        """Journal entries on customer (7300) and vendor (4730) Skonto accounts."""
+        customer_skonto = self._get_account(code='7300')
+        vendor_skonto = self._get_account(code='4730')
+        counterpart = self._get_account('asset_current')
+        journal = self.env['account.journal'].search([
+            ('type', '=', 'general'), ('company_id', '=', self.company.id)
+        ], limit=1)
+        vals_list = []
+        for i in range(count):
+            amount = round(self.rng.uniform(1.0, 150.0), 2)
+            skonto_account, debit = (customer_skonto, True) if i % 2 else (vendor_skonto, False)
+            vals_list.append({
+                'move_type': 'entry',
+                'journal_id': journal.id,
+                'date': self._random_date(),
+                'line_ids': [
+                    (0, 0, {
+                        'name': 'Bench Skonto',
+                        'account_id': skonto_account.id,
+                        'debit': amount if debit else 0.0,
+                        'credit': 0.0 if debit else amount,
+                        'analytic_distribution': self._get_distribution(analytic_accounts),
+                    }),
+                    (0, 0, {
+                        'name': 'Bench Skonto Counterpart',
+                        'account_id': counterpart.id,
+                        'debit': 0.0 if debit else amount,
+                        'credit': amount if debit else 0.0,
+                    }),
+                ],
+            })
+        return self.env['account.move'].create(vals_list)
+
+    def _create_sale_orders(self, projects, partner, per_project):
+        """Confirmed sales orders linked to the projects."""
+        if not per_project:
+            return self.env['sale.order']
+        product = self.env['product.product'].create({'name': 'Bench Product', 'type': 'consu'})
+        orders = self.env['sale.order'].create([
+            {
+                'partner_id': partner.id,
+                'project_id': project.id,
+                'order_line': [(0, 0, {
+                    'product_id': product.id,
+                    'product_uom_qty': 1,
+                    'price_unit': round(self.rng.uniform(1000.0, 50000.0), 2),
+                })],
+            }
+            for project in projects for _i in range(per_project)
+        ])
+        orders.action_confirm()
+        return orders
+
+    def _insert_timesheets(self, projects, employees, per_project):
+        """Bulk insert timesheets spread over the employees (one statement)."""
+        rows = []
+        for project in projects:
+            for _i in range(per_project):
+                employee = self.rng.choice(employees)
+                hours = self.rng.choice([0.5, 1.0, 2.0, 4.0, 8.0])
+                rows.append((project.id, project.account_id.id, employee.id, hours,
+                             -hours * employee.hourly_cost, self._random_date()))
+        return self._insert_analytic_lines('Bench Timesheet', rows)
+
+    def _insert_other_costs(self, analytic_accounts, per_account):
+        """Bulk insert manual cost entries without journal item (one statement)."""
+        rows = [
+            (None, account_id, None, 0.0, -round(self.rng.uniform(5.0, 500.0), 2), self._random_date())
+            for account_id in analytic_accounts.ids for _i in range(per_account)
+        ]
+        return self._insert_analytic_lines('Bench Cost', rows)
+
+    def _insert_analytic_lines(self, name, rows):
+        """
+        INSERT ... SELECT FROM unnest() of (project_id, account_id, employee_id,
+        unit_amount, amount, date) rows.
+
+        Returns:
+            int: Number of inserted lines
+        """
+        if not rows:
+            return 0
+        AnalyticLine = self.env['account.analytic.line']
+        AnalyticLine.flush_model()
+        has_is_timesheet = column_exists(self.env.cr, AnalyticLine._table, 'is_timesheet')
+        columns = list(zip(*rows))
+        self.env.cr.execute(f"""
+            INSERT INTO account_analytic_line (
+                name, company_id, currency_id, project_id, account_id, employee_id,
+                unit_amount, amount, date, {'is_timesheet, ' if has_is_timesheet else ''}
+                create_uid, write_uid, create_date, write_date
+            )
+            SELECT %s, %s, %s, src.project_id, src.account_id, src.employee_id,
+                   src.unit_amount, src.amount, src.date, {'src.project_id IS NOT NULL, ' if has_is_timesheet else ''}
+                   %s, %s, NOW() AT TIME ZONE 'UTC', NOW() AT TIME ZONE 'UTC'
+              FROM unnest(%s::int[], %s::int[], %s::int[], %s::float[], %s::float[], %s::date[])
+                   AS src(project_id, account_id, employee_id, unit_amount, amount, date)
+        """, [name, self.company.id, self.company.currency_id.id, self.env.uid, self.env.uid]
+            + [list(column) for column in columns])
+        count = self.env.cr.rowcount
+        AnalyticLine.invalidate_model()
+        return count
+
+    def _random_date(self):
+        return fields.Date.subtract(fields.Date.today(), days=self.rng.randint(0, 720))
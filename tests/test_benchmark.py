@@ -0,0 +1,168 @@
+import json
+import logging
+import os
+import tempfile
+import time
+
+from odoo import fields
+from odoo.modules.module import get_manifest
+from odoo.tests import tagged
+from odoo.tests.common import TransactionCase
+
+from .common import SCALES, SyntheticLedgerGenerator
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install', '-standard', 'project_statistic_benchmark')
+class TestProjectStatisticBenchmark(TransactionCase):
+    """
+    Scale benchmarks of the analytics engine.
+
+    Not part of the normal test runs ('-standard'). Run with:
+
+        odoo-bin -d <db> -u project_statistic --test-tags project_statistic_benchmark
+
+    Environment variables:
+        PROJECT_STATISTIC_BENCH_SCALE: small (default), medium or large (see common.SCALES)
+        PROJECT_STATISTIC_BENCH_OUTPUT: JSON result file
+            (default: <tmp>/project_statistic_benchmark_<scale>.json)
+
+    Each operation records its wall time and query count. The JSON file also
+    holds the module version and the dataset size, so runs of different
+    versions can be compared.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.scale = os.environ.get('PROJECT_STATISTIC_BENCH_SCALE', 'small')
+        start = time.perf_counter()
+        cls.dataset = SyntheticLedgerGenerator(cls.env).generate(**SCALES[cls.scale])
+        cls.projects = cls.dataset['projects']
+        cls.results = {
+            'module_version': get_manifest('project_statistic')['version'],
+            'scale': cls.scale,
+            'date': fields.Datetime.to_string(fields.Datetime.now()),
+            'dataset': cls.dataset['counts'],
+            'generation_seconds': round(time.perf_counter() - start, 3),
+            'operations': {},
+        }
+        _logger.info(f"Benchmark dataset '{cls.scale}' generated: {cls.dataset['counts']}")
+
+    @classmethod
+    def tearDownClass(cls):
+        output = os.environ.get('PROJECT_STATISTIC_BENCH_OUTPUT') or os.path.join(
+            tempfile.gettempdir(), f'project_statistic_benchmark_{cls.scale}.json'
+        )
+        with open(output, 'w') as f:
+            json.dump(cls.results, f, indent=2, sort_keys=True)
+        _logger.info(f"Benchmark results written to {output}")
+        super().tearDownClass()
+
+    def _measure(self, name, func):
+        """
+        Run func with a cold cache and record its wall time and query count.
+
+        Returns:
+            The result of func
+        """
+        self.env.flush_all()
+        self.env.invalidate_all()
+        queries = self.env.cr.sql_log_count
+        start = time.perf_counter()
+        result = func()
+        self.env.flush_all()
+        self.env.cr.flush()
+        seconds = time.perf_counter() - start
+        self.results['operations'][name] = {
+            'seconds': round(seconds, 4),
+            'queries': self.env.cr.sql_log_count - queries,
+        }
+        _logger.info(f"Benchmark {name}: {seconds:.3f} s, {self.results['operations'][name]['queries']} queries")
+        return result
+
+    def test_01_compute_full(self):
+        """Full recompute of all projects, including the ledger rebuild"""
+        self._measure('compute_full', lambda: self.projects._compute_financial_data())
+        self.assertTrue(all(status == 'available' for status in self.projects.mapped('data_availability_status')))
+
+    def test_02_compute_ledger_synced(self):
+        """Recompute of all projects from the existing ledger"""
+        self._measure('compute_ledger_synced', lambda: self.projects.with_context(
+            project_statistic_ledger_synced=True
+        )._compute_financial_data())
+
+    def test_03_hook_post_invoices(self):
+        """Posting invoices on project accounts, hooks included"""
+        income = self.env['account.account'].search([('account_type', '=', 'income')], limit=1)
+        partner = self.dataset['moves'][:1].partner_id
+        invoices = self.env['account.move'].create([{
+            'move_type': 'out_invoice',
+            'partner_id': partner.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'name': 'Bench Hook Line',
+                'quantity': 1,
+                'price_unit': 100.0,
+                'account_id': income.id,
+                'analytic_distribution': {str(project.account_id.id): 100},
+            })],
+        } for project in self.projects[:20]])
+        self._measure('hook_post_invoices', invoices.action_post)
+
+    def test_04_hook_edit_distribution(self):
+        """Moving posted journal items to other project accounts, hooks included"""
+        lines = self.dataset['moves'].invoice_line_ids[:100]
+        accounts = self.projects.account_id
+        self._measure('hook_edit_distribution', lambda: [
+            line.write({'analytic_distribution': {str(accounts[i % len(accounts)].id): 100}})
+            for i, line in enumerate(lines)
+        ])
+
+    def test_05_hook_create_timesheets(self):
+        """Creating timesheets, hooks included"""
+        employees = self.dataset['employees']
+        self._measure('hook_create_timesheets', lambda: self.env['account.analytic.line'].create([{
+            'name': 'Bench Hook Timesheet',
+            'project_id': project.id,
+            'employee_id': employees[i % len(employees)].id,
+            'unit_amount': 1.0,
+        } for i, project in enumerate(self.projects[:100])]))
+
+    def test_06_hook_hfc_change(self):
+        """Changing the HFC factor of all employees, hooks included"""
+        self._measure('hook_hfc_change', lambda: self.dataset['employees'].write({'faktor_hfc': 0.9}))
+
+    def test_07_wizard_apply_rates(self):
+        """Refresh wizard in 'Apply Rates Only' mode with a changed hourly rate"""
+        wizard = self.env['refresh.financial.data.wizard'].create({
+            'general_hourly_rate': 77.0,
+            'refresh_mode': 'rates',
+        })
+        self._measure('wizard_apply_rates', wizard.action_refresh_data)
+
+    def test_08_wizard_full_refresh(self):
+        """Refresh wizard in 'Full Recalculation' mode, including the background job run"""
+        wizard = self.env['refresh.financial.data.wizard'].with_context(active_ids=self.projects.ids).create({
+            'refresh_mode': 'full',
+        })
+
+        def run():
+            wizard.action_refresh_data()
+            return self.env['project.statistic.refresh.job']._cron_run_jobs()
+
+        self.assertTrue(self._measure('wizard_full_refresh', run))
+
+    def test_09_drilldown_actions(self):
+        """Drilldown actions of the analytics form, including the search of the returned domain"""
+        projects = self.projects[:20]
+        for method, res_model in [
+            ('action_view_account_moves', 'account.move'),
+            ('action_view_account_analytic_line', 'account.analytic.line'),
+            ('action_view_contributions', 'project.statistic.contribution'),
+        ]:
+            self._measure(f'drilldown_{method}', lambda method=method, res_model=res_model: [
+                self.env[res_model].search_count(getattr(project, method)()['domain'])
+                for project in projects
+            ])
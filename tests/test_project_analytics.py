@@ -1,6 +1,12 @@
+import csv
+import io
+from unittest.mock import patch
+
 from odoo.tests.common import TransactionCase
 from odoo import fields
 
+from odoo.addons.project_statistic.metrics import METRICS
+
 
 class TestProjectAnalytics(TransactionCase):
 
@@ -180,3 +186,820 @@ class TestProjectAnalytics(TransactionCase):
 
         expected_profit = self.project.customer_invoiced_amount_net - self.project.vendor_bills_total_net - self.project.total_costs_net
         self.assertAlmostEqual(self.project.profit_loss_net, expected_profit, places=2)
+
+    def test_07_batch_compute_split_distribution(self):
+        """Test that a batch compute fans one invoice line out to several projects"""
+        other_account = self.AnalyticAccount.create({
+            'name': 'Second Project Analytic',
+            'plan_id': self.env.ref('analytic.analytic_plan_projects').id,
+        })
+        other_project = self.Project.create({
+            'name': 'Second Project',
+            'account_id': other_account.id,
+        })
+
+        invoice = self.Invoice.create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'name': 'Shared Item',
+                'quantity': 1,
+                'price_unit': 1000.0,
+                'account_id': self.income_account.id,
+                'analytic_distribution': {
+                    str(self.analytic_account.id): 60,
+                    str(other_account.id): 40,
+                },
+            })],
+        })
+        invoice.action_post()
+
+        projects = self.project | other_project
+        projects._compute_financial_data()
+
+        self.assertAlmostEqual(self.project.customer_invoiced_amount_net, 600.0, places=2)
+        self.assertAlmostEqual(other_project.customer_invoiced_amount_net, 400.0, places=2)
+
+    def test_08_contribution_ledger_synced_on_post(self):
+        """Test that posting an invoice fills the contribution ledger and updates the project"""
+        invoice = self.Invoice.create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'name': 'Ledger Item',
+                'quantity': 1,
+                'price_unit': 500.0,
+                'account_id': self.income_account.id,
+                'analytic_distribution': {str(self.analytic_account.id): 50},
+            })],
+        })
+        invoice.action_post()
+        self.env.cr.flush()  # runs the precommit ledger sync
+
+        contributions = self.env['project.statistic.contribution'].search([
+            ('account_id', '=', self.analytic_account.id),
+        ])
+        self.assertEqual(contributions.mapped('category'), ['invoice'])
+        self.assertAlmostEqual(contributions.amount_net, 250.0, places=2)
+
+        # No explicit compute: the hooks summed the ledger
+        self.assertAlmostEqual(self.project.customer_invoiced_amount_net, 250.0, places=2)
+
+    def test_09_incremental_delta_matches_full_compute(self):
+        """Test that line edits shift the stored figures exactly like a full recompute"""
+        self.project._compute_financial_data()
+
+        cost_line = self.AnalyticLine.create({
+            'name': 'Material',
+            'account_id': self.analytic_account.id,
+            'amount': -100.0,
+        })
+        self.env.cr.flush()
+        self.assertAlmostEqual(self.project.other_costs_net, 100.0, places=2)
+
+        cost_line.write({'amount': -150.0})
+        self.env.cr.flush()
+        self.assertAlmostEqual(self.project.other_costs_net, 150.0, places=2)
+        self.assertAlmostEqual(self.project.total_costs_net, 150.0, places=2)
+        delta_profit = self.project.current_calculated_profit_loss
+
+        self.project._compute_financial_data()
+        self.assertAlmostEqual(self.project.other_costs_net, 150.0, places=2)
+        self.assertAlmostEqual(self.project.current_calculated_profit_loss, delta_profit, places=2)
+
+        cost_line.unlink()
+        self.env.cr.flush()
+        self.assertAlmostEqual(self.project.other_costs_net, 0.0, places=2)
+
+    def test_10_queued_recompute_mode(self):
+        """Test that queued mode defers the project update to the cron worker"""
+        self.env['ir.config_parameter'].sudo().set_param('project_statistic.recompute_mode', 'queue')
+        self.project._compute_financial_data()
+        Queue = self.env['project.statistic.recompute.queue']
+
+        self.AnalyticLine.create({
+            'name': 'Material',
+            'account_id': self.analytic_account.id,
+            'amount': -80.0,
+        })
+        self.AnalyticLine.create({
+            'name': 'More Material',
+            'account_id': self.analytic_account.id,
+            'amount': -20.0,
+        })
+        self.env.cr.flush()
+
+        # Both changes collapse into one queue entry, the project is not updated yet
+        self.assertEqual(Queue.search_count([('project_id', '=', self.project.id)]), 1)
+        self.assertAlmostEqual(self.project.other_costs_net, 0.0, places=2)
+
+        Queue._cron_process_queue()
+
+        self.assertFalse(Queue.search([('project_id', '=', self.project.id)]))
+        self.assertAlmostEqual(self.project.other_costs_net, 100.0, places=2)
+
+    def test_11_triggers_coalesced_per_transaction(self):
+        """Test that many line writes in one transaction update the project once"""
+        self.project._compute_financial_data()
+        Project = self.env.registry['project.project']
+
+        lines = self.AnalyticLine.create([{
+            'name': f'Material {i}',
+            'account_id': self.analytic_account.id,
+            'amount': -10.0,
+        } for i in range(5)])
+        for line in lines:
+            line.write({'amount': -20.0})
+
+        with patch.object(Project, '_apply_contribution_deltas', autospec=True,
+                          side_effect=Project._apply_contribution_deltas) as apply_deltas:
+            self.env.cr.flush()
+
+        self.assertEqual(apply_deltas.call_count, 1)
+        self.assertAlmostEqual(self.project.other_costs_net, 100.0, places=2)
+
+    def test_12_irrelevant_hook_events_skipped(self):
+        """Test that draft invoices and no-op writes do not touch the ledger"""
+        Ledger = self.env['project.statistic.contribution']
+        before = Ledger.get_skipped_event_counters()
+
+        invoice = self.Invoice.create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'name': 'Draft Item',
+                'quantity': 1,
+                'price_unit': 300.0,
+                'account_id': self.income_account.id,
+                'analytic_distribution': {str(self.analytic_account.id): 100},
+            })],
+        })
+        cost_line = self.AnalyticLine.create({
+            'name': 'Material',
+            'account_id': self.analytic_account.id,
+            'amount': -40.0,
+        })
+        self.env.cr.flush()
+        cost_line.write({'amount': -40.0})
+
+        after = Ledger.get_skipped_event_counters()
+        self.assertGreater(
+            after.get('account.move.line', {}).get('draft', 0),
+            before.get('account.move.line', {}).get('draft', 0),
+        )
+        self.assertEqual(
+            after.get('account.analytic.line', {}).get('unchanged', 0),
+            before.get('account.analytic.line', {}).get('unchanged', 0) + 1,
+        )
+        self.assertFalse(Ledger.search([('move_id', '=', invoice.id)]))
+
+    def test_13_payment_refreshes_paid_figures(self):
+        """Test that registering a payment updates the paid and outstanding figures"""
+        invoice = self.Invoice.create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'name': 'Paid Item',
+                'quantity': 1,
+                'price_unit': 1000.0,
+                'tax_ids': [(6, 0, [])],
+                'account_id': self.income_account.id,
+                'analytic_distribution': {str(self.analytic_account.id): 100},
+            })],
+        })
+        invoice.action_post()
+        self.env.cr.flush()
+        self.assertAlmostEqual(self.project.customer_paid_amount_net, 0.0, places=2)
+
+        self.env['account.payment.register'].with_context(
+            active_model='account.move', active_ids=invoice.ids,
+        ).create({'amount': 400.0})._create_payments()
+        self.env.cr.flush()
+
+        self.assertAlmostEqual(self.project.customer_paid_amount_net, 400.0, places=2)
+        self.assertAlmostEqual(self.project.customer_outstanding_amount_net, 600.0, places=2)
+
+    def test_14_hfc_factor_change_propagates(self):
+        """Test that an HFC factor change updates the adjusted hours of the booked projects"""
+        employee = self.env['hr.employee'].create({
+            'name': 'Test Employee',
+            'faktor_hfc': 1.0,
+        })
+        self.project._compute_financial_data()
+        self.AnalyticLine.create({
+            'name': 'Work',
+            'project_id': self.project.id,
+            'employee_id': employee.id,
+            'unit_amount': 10.0,
+        })
+        self.env.cr.flush()
+        self.assertAlmostEqual(self.project.total_hours_booked_adjusted, 10.0, places=2)
+
+        employee.faktor_hfc = 0.8
+        self.env.cr.flush()
+
+        hourly_rate = float(self.env['ir.config_parameter'].sudo().get_param(
+            'project_statistic.general_hourly_rate', '66.0'
+        ))
+        self.assertAlmostEqual(self.project.total_hours_booked, 10.0, places=2)
+        self.assertAlmostEqual(self.project.total_hours_booked_adjusted, 8.0, places=2)
+        self.assertAlmostEqual(self.project.labor_costs_adjusted, 8.0 * hourly_rate, places=2)
+
+    def test_15_rate_change_rederives_adjusted_fields(self):
+        """Test that changing the hourly rate or surcharge factor re-derives the adjusted fields"""
+        bill = self.Invoice.create({
+            'move_type': 'in_invoice',
+            'partner_id': self.partner.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'name': 'Rate Expense',
+                'quantity': 1,
+                'price_unit': 200.0,
+                'account_id': self.expense_account.id,
+                'analytic_distribution': {str(self.analytic_account.id): 100},
+            })],
+        })
+        bill.action_post()
+        self.project._compute_financial_data()
+        self.env.flush_all()
+
+        ICP = self.env['ir.config_parameter'].sudo()
+        ICP.set_param('project_statistic.vendor_bill_surcharge_factor', '2.0')
+
+        self.assertAlmostEqual(self.project.adjusted_vendor_bill_amount, 400.0, places=2)
+        self.assertAlmostEqual(
+            self.project.current_calculated_profit_loss,
+            self.project.customer_invoiced_amount_net - 400.0
+            - self.project.labor_costs_adjusted - self.project.other_costs_net,
+            places=2,
+        )
+
+    def test_16_refresh_job_resumes_from_checkpoint(self):
+        """Test that a refresh job processes projects in chunks and resumes after its checkpoint"""
+        self.env['ir.config_parameter'].sudo().set_param('project_statistic.refresh_job_chunk_size', '1')
+        other_project = self.Project.create({'name': 'Second Project'})
+        projects = self.project | other_project
+
+        job = self.env['project.statistic.refresh.job']._start(projects)
+
+        # Deadline already passed: exactly one chunk is processed
+        self.assertFalse(job._run(deadline=0))
+        self.assertEqual(job.state, 'running')
+        self.assertEqual(job.done_count, 1)
+        self.assertEqual(job.last_project_id, min(projects.ids))
+
+        self.assertTrue(self.env['project.statistic.refresh.job']._cron_run_jobs())
+        self.assertEqual(job.state, 'done')
+        self.assertEqual(job.done_count, 2)
+        self.assertEqual(job.failed_count, 0)
+        self.assertEqual(other_project.data_availability_status, 'no_analytic_account')
+
+    def test_17_metrics_count_phases_and_lines(self):
+        """Test that a compute records phase timers and line counters in the Prometheus output"""
+        invoice = self.Invoice.create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'name': 'Metrics Service',
+                'quantity': 1,
+                'price_unit': 100.0,
+                'account_id': self.income_account.id,
+                'analytic_distribution': {str(self.analytic_account.id): 100},
+            })],
+        })
+        invoice.action_post()
+        METRICS.reset()
+
+        (self.project | self.Project.create({'name': 'No Account Project'}))._compute_financial_data()
+
+        self.assertEqual(METRICS.get_counter('projects_computed_total'), 1)
+        self.assertEqual(METRICS.get_counter('projects_without_account_total'), 1)
+        self.assertGreaterEqual(METRICS.get_counter('lines_matched_total', source='account.move.line'), 1)
+        output = METRICS.to_prometheus()
+        self.assertIn('project_statistic_phase_seconds_count{phase="ledger_move_lines"} 1', output)
+        self.assertIn('project_statistic_phase_seconds_count{phase="customer"} 1', output)
+
+    def test_18_monthly_aggregates_for_date_range(self):
+        """Test that date-range figures are answered from the monthly aggregates and kept in sync"""
+        self.project._compute_financial_data()
+
+        def create_invoice(invoice_date, amount):
+            invoice = self.Invoice.create({
+                'move_type': 'out_invoice',
+                'partner_id': self.partner.id,
+                'invoice_date': invoice_date,
+                'invoice_line_ids': [(0, 0, {
+                    'name': 'Monthly Service',
+                    'quantity': 1,
+                    'price_unit': amount,
+                    'account_id': self.income_account.id,
+                    'analytic_distribution': {str(self.analytic_account.id): 100},
+                })],
+            })
+            invoice.action_post()
+            return invoice
+
+        create_invoice(fields.Date.to_date('2025-07-15'), 1000.0)
+        september_invoice = create_invoice(fields.Date.to_date('2025-09-03'), 500.0)
+        create_invoice(fields.Date.to_date('2025-10-01'), 250.0)
+        self.env.cr.flush()
+
+        figures = self.project.get_financial_figures_for_period('2025-07-01', '2025-09-30')[self.project.id]
+        self.assertAlmostEqual(figures['customer_invoiced_amount_net'], 1500.0, places=2)
+        self.assertAlmostEqual(figures['profit_loss_net'], 1500.0, places=2)
+
+        lifetime = self.project.get_financial_figures_for_period()[self.project.id]
+        self.assertAlmostEqual(lifetime['customer_invoiced_amount_net'],
+                               self.project.customer_invoiced_amount_net, places=2)
+
+        # Cancelling the September invoice only changes the September bucket
+        september_invoice.button_draft()
+        self.env.cr.flush()
+        figures = self.project.get_financial_figures_for_period('2025-07-01', '2025-09-30')[self.project.id]
+        self.assertAlmostEqual(figures['customer_invoiced_amount_net'], 1000.0, places=2)
+        months = self.env['project.statistic.monthly'].search([('project_id', '=', self.project.id)]).mapped('month')
+        self.assertNotIn(fields.Date.to_date('2025-09-01'), months)
+
+    def test_19_foreign_currency_documents_in_company_currency(self):
+        """Test that foreign-currency invoices and sales orders are converted to the company currency"""
+        company = self.env.company
+        currency = self.env.ref('base.EUR') if company.currency_id != self.env.ref('base.EUR') \
+            else self.env.ref('base.USD')
+        currency.active = True
+        self.env['res.currency.rate'].search([('currency_id', 'in', (currency | company.currency_id).ids)]).unlink()
+        self.env['res.currency.rate'].create({
+            'name': '2025-01-01',
+            'rate': 2.0,
+            'currency_id': currency.id,
+            'company_id': company.id,
+        })
+
+        invoice = self.Invoice.create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner.id,
+            'currency_id': currency.id,
+            'invoice_date': fields.Date.to_date('2025-03-01'),
+            'invoice_line_ids': [(0, 0, {
+                'name': 'Foreign Service',
+                'quantity': 1,
+                'price_unit': 1000.0,
+                'tax_ids': [(5, 0, 0)],
+                'account_id': self.income_account.id,
+                'analytic_distribution': {str(self.analytic_account.id): 100},
+            })],
+        })
+        invoice.action_post()
+
+        pricelist = self.env['product.pricelist'].create({'name': 'Foreign', 'currency_id': currency.id})
+        order = self.env['sale.order'].create({
+            'partner_id': self.partner.id,
+            'pricelist_id': pricelist.id,
+            'project_id': self.project.id,
+            'date_order': '2025-03-01 10:00:00',
+            'order_line': [(0, 0, {
+                'product_id': self.env['product.product'].create({'name': 'Foreign Product', 'type': 'consu'}).id,
+                'product_uom_qty': 1,
+                'price_unit': 3000.0,
+                'tax_id': [(5, 0, 0)],
+            })],
+        })
+        order.action_confirm()
+
+        self.project._compute_financial_data()
+
+        self.assertAlmostEqual(self.project.customer_invoiced_amount_net, 500.0, places=2)
+        self.assertAlmostEqual(self.project.customer_invoiced_amount_gross, 500.0, places=2)
+        self.assertAlmostEqual(self.project.sale_order_amount_net, 1500.0, places=2)
+
+    def test_20_reporting_view_refresh(self):
+        """Test that the reporting view shows the monthly figures with the project dimensions after a refresh"""
+        self.project.partner_id = self.partner
+        invoice = self.Invoice.create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner.id,
+            'invoice_date': fields.Date.to_date('2025-05-10'),
+            'invoice_line_ids': [(0, 0, {
+                'name': 'Report Service',
+                'quantity': 1,
+                'price_unit': 800.0,
+                'account_id': self.income_account.id,
+                'analytic_distribution': {str(self.analytic_account.id): 100},
+            })],
+        })
+        invoice.action_post()
+        self.project._compute_financial_data()
+
+        Report = self.env['project.statistic.report']
+        Report._cron_refresh()
+
+        groups = Report._read_group(
+            [('project_id', '=', self.project.id)], ['partner_id', 'month:month'], ['revenue_net:sum'],
+        )
+        self.assertEqual(len(groups), 1)
+        partner, _month, revenue_net = groups[0]
+        self.assertEqual(partner, self.partner)
+        self.assertAlmostEqual(revenue_net, 800.0, places=2)
+
+    def test_21_account_moves_drilldown_domain(self):
+        """Test that the Account Moves drilldown returns a compact domain matching only posted moves of the account"""
+        other_account = self.env['account.analytic.account'].create({
+            'name': 'Other Drilldown Account',
+            'plan_id': self.analytic_account.plan_id.id,
+        })
+        invoices = self.Invoice.create([{
+            'move_type': 'out_invoice',
+            'partner_id': self.partner.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'name': 'Drilldown Service',
+                'quantity': 1,
+                'price_unit': 100.0,
+                'account_id': self.income_account.id,
+                'analytic_distribution': {str(account.id): 100},
+            })],
+        } for account in (self.analytic_account, self.analytic_account, other_account)])
+        invoices[:1].action_post()
+        invoices[2:].action_post()
+
+        action = self.project.action_view_account_moves()
+
+        self.assertEqual(action['domain'], [('project_statistic_account_id', '=', self.analytic_account.id)])
+        self.assertEqual(self.env['account.move'].search(action['domain']), invoices[:1])
+
+    def test_22_metadata_cache_invalidation(self):
+        """Test that the cached metadata is served without queries and follows parameter and project changes"""
+        Cache = self.env['project.statistic.cache']
+        self.assertEqual(Cache._get_account_project_map()[self.analytic_account.id], (self.project.id,))
+        with self.assertQueryCount(0):
+            Cache._get_settings()
+            Cache._get_project_plan_id()
+            Cache._get_account_project_map()
+
+        self.env['ir.config_parameter'].sudo().set_param('project_statistic.general_hourly_rate', '80.0')
+        self.assertEqual(Cache._get_settings()['general_hourly_rate'], 80.0)
+
+        self.project.active = False
+        self.assertNotIn(self.analytic_account.id, Cache._get_account_project_map())
+        self.assertFalse(self.Project._get_projects_for_analytic_accounts([self.analytic_account.id]))
+
+        self.project.active = True
+        self.analytic_account.plan_id = self.env['account.analytic.plan'].create({'name': 'Other Plan'})
+        self.assertNotIn(self.analytic_account.id, Cache._get_account_project_map())
+
+    def test_23_document_breakdown(self):
+        """Test that the per-document breakdown follows posting and payment of an invoice"""
+        invoice = self.Invoice.create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'name': 'Breakdown Service A',
+                'quantity': 1,
+                'price_unit': 600.0,
+                'tax_ids': [(5, 0, 0)],
+                'account_id': self.income_account.id,
+                'analytic_distribution': {str(self.analytic_account.id): 50},
+            }), (0, 0, {
+                'name': 'Breakdown Service B',
+                'quantity': 1,
+                'price_unit': 400.0,
+                'tax_ids': [(5, 0, 0)],
+                'account_id': self.income_account.id,
+                'analytic_distribution': {str(self.analytic_account.id): 100},
+            })],
+        })
+        invoice.action_post()
+        self.env.cr.flush()
+
+        document = self.project.statistic_document_ids
+        self.assertEqual(len(document), 1)
+        self.assertEqual(document.move_id, invoice)
+        self.assertEqual(document.category, 'invoice')
+        self.assertAlmostEqual(document.amount_net, 700.0, places=2)
+        self.assertAlmostEqual(document.paid_share, 0.0, places=2)
+
+        self.env['account.payment.register'].with_context(
+            active_model='account.move', active_ids=invoice.ids,
+        ).create({})._create_payments()
+        self.env.cr.flush()
+
+        self.project.invalidate_recordset(['statistic_document_ids'])
+        document = self.project.statistic_document_ids
+        self.assertAlmostEqual(document.paid_net, 700.0, places=2)
+        self.assertAlmostEqual(document.paid_share, 1.0, places=2)
+
+        # Contributions without a document are summed into one row per category
+        employee = self.env['hr.employee'].create({'name': 'Breakdown Employee', 'hourly_cost': 50.0})
+        for hours in (2.0, 1.0):
+            self.AnalyticLine.create({
+                'name': 'Work',
+                'project_id': self.project.id,
+                'employee_id': employee.id,
+                'unit_amount': hours,
+            })
+        self.AnalyticLine.create({
+            'name': 'Travel',
+            'account_id': self.analytic_account.id,
+            'amount': -25.0,
+        })
+        self.env.cr.flush()
+
+        self.project.invalidate_recordset(['statistic_document_ids'])
+        documents = self.project.statistic_document_ids
+        self.assertEqual(len(documents), 3)
+        self.assertEqual(documents.filtered('move_id').move_id, invoice)
+        amounts = {document.category: document.amount_net for document in documents if not document.move_id}
+        self.assertEqual(set(amounts), {'timesheet', 'other_cost'})
+        self.assertAlmostEqual(amounts['timesheet'], 150.0, places=2)
+        self.assertAlmostEqual(amounts['other_cost'], 25.0, places=2)
+        self.assertAlmostEqual(sum(documents.mapped('amount_net')), 875.0, places=2)
+
+    def test_24_bulk_export_csv(self):
+        """Test that the bulk export writes one CSV row per matching project, filtered by date range and company"""
+        self.project.write({'date_start': '2025-01-01', 'date': '2025-03-31'})
+        later_project = self.Project.create({
+            'name': 'Later Project',
+            'date_start': '2025-06-01',
+            'company_id': self.env.company.id,
+        })
+        Export = self.env['project.statistic.export']
+
+        fileobj = io.BytesIO()
+        count = Export._export(
+            'csv', fileobj,
+            Export._get_domain('2025-05-01', '2025-12-31', self.env.company.ids),
+            chunk_size=1,
+        )
+
+        rows = list(csv.reader(io.StringIO(fileobj.getvalue().decode('utf-8'))))
+        self.assertEqual(count, len(rows) - 1)
+        self.assertEqual(len(rows[0]), len(Export._get_export_columns()))
+        exported_ids = {int(row[0]) for row in rows[1:]}
+        self.assertIn(later_project.id, exported_ids)
+        self.assertNotIn(self.project.id, exported_ids)
+
+    def test_25_analytic_line_classification(self):
+        """Test the single-scan analytic line classifier against _classify_analytic_line() and exact totals"""
+        Account = self.env['account.account']
+        Cache = self.env['project.statistic.cache']
+        customer_skonto_account = Account.search([('code', '=like', '7300%')], limit=1) or Account.create({
+            'name': 'Gewährte Skonti',
+            'code': '7300',
+            'account_type': 'expense',
+        })
+        vendor_skonto_account = Account.search([('code', '=like', '4730%')], limit=1) or Account.create({
+            'name': 'Erhaltene Skonti',
+            'code': '4730',
+            'account_type': 'income',
+        })
+        customer_skonto_ids, vendor_skonto_ids = Cache._get_skonto_account_ids()
+        self.assertIn(customer_skonto_account.id, customer_skonto_ids)
+        self.assertIn(vendor_skonto_account.id, vendor_skonto_ids)
+
+        distribution = {str(self.analytic_account.id): 100}
+        entry = self.Invoice.create({
+            'move_type': 'entry',
+            'date': fields.Date.today(),
+            'line_ids': [(0, 0, {
+                'name': 'Customer Skonto',
+                'account_id': customer_skonto_account.id,
+                'debit': 50.0,
+                'analytic_distribution': distribution,
+            }), (0, 0, {
+                'name': 'Vendor Skonto',
+                'account_id': vendor_skonto_account.id,
+                'credit': 30.0,
+                'analytic_distribution': distribution,
+            }), (0, 0, {
+                'name': 'Deferral',
+                'account_id': self.expense_account.id,
+                'debit': 40.0,
+                'analytic_distribution': distribution,
+            }), (0, 0, {
+                'name': 'Counterpart',
+                'account_id': self.income_account.id,
+                'credit': 60.0,
+            })],
+        })
+        entry.action_post()
+        employee = self.env['hr.employee'].create({'name': 'Classifier Employee'})
+        other_cost = self.AnalyticLine.create({
+            'name': 'Travel',
+            'account_id': self.analytic_account.id,
+            'amount': -25.0,
+        })
+        timesheet = self.AnalyticLine.create({
+            'name': 'Work',
+            'project_id': self.project.id,
+            'employee_id': employee.id,
+            'unit_amount': 3.0,
+        })
+        self.env.cr.flush()
+
+        lines = self.AnalyticLine.search([('account_id', '=', self.analytic_account.id)])
+        self.assertEqual(len(lines), 5)
+        expected = {
+            customer_skonto_account: 'skonto_customer',
+            vendor_skonto_account: 'skonto_vendor',
+            self.expense_account: False,
+        }
+        Contribution = self.env['project.statistic.contribution']
+        for line in lines:
+            if line == other_cost:
+                expected_category = 'other_cost'
+            elif line == timesheet:
+                expected_category = 'timesheet'
+            else:
+                expected_category = expected[line.move_line_id.account_id]
+            ledger_rows = Contribution.search([('analytic_line_id', '=', line.id)])
+            self.assertEqual(Contribution._classify_analytic_line(line)[0], expected_category, line.name)
+            self.assertEqual(ledger_rows.category or False, expected_category, line.name)
+
+        self.assertAlmostEqual(self.project.customer_skonto_taken, 50.0, places=2)
+        self.assertAlmostEqual(self.project.vendor_skonto_received, 30.0, places=2)
+        self.assertAlmostEqual(self.project.other_costs_net, 25.0, places=2)
+        self.assertAlmostEqual(self.project.total_hours_booked, 3.0, places=2)
+
+    def test_26_move_line_ledger_totals(self):
+        """Test the jsonb_each ledger insert with exact totals per move type over a split distribution"""
+        other_account = self.AnalyticAccount.create({
+            'name': 'Second Project Analytic',
+            'plan_id': self.env.ref('analytic.analytic_plan_projects').id,
+        })
+        self.Project.create({'name': 'Second Project', 'account_id': other_account.id})
+        split = {str(self.analytic_account.id): 60, str(other_account.id): 40}
+
+        moves = self.Invoice
+        for move_type, price_unit, account in [
+            ('out_invoice', 1000.0, self.income_account),
+            ('out_refund', 200.0, self.income_account),
+            ('in_invoice', 500.0, self.expense_account),
+            ('in_refund', 100.0, self.expense_account),
+        ]:
+            moves |= self.Invoice.create({
+                'move_type': move_type,
+                'partner_id': self.partner.id,
+                'invoice_date': fields.Date.today(),
+                'invoice_line_ids': [(0, 0, {
+                    'name': move_type,
+                    'quantity': 1,
+                    'price_unit': price_unit,
+                    'tax_ids': [(5, 0, 0)],
+                    'account_id': account.id,
+                    'analytic_distribution': split,
+                })],
+            })
+        malformed_line = self.InvoiceLine.create({
+            'move_id': moves[0].id,
+            'name': 'Malformed Distribution',
+            'quantity': 1,
+            'price_unit': 100.0,
+            'tax_ids': [(5, 0, 0)],
+            'account_id': self.income_account.id,
+            'analytic_distribution': {str(other_account.id): 100},
+        })
+        moves.action_post()
+        self.env.flush_all()
+
+        # A non-numeric percentage only drops its own key, not the whole line
+        self.env.cr.execute(
+            "UPDATE account_move_line SET analytic_distribution = %s::jsonb WHERE id = %s",
+            [f'{{"{self.analytic_account.id}": "abc", "{other_account.id}": 50}}', malformed_line.id],
+        )
+        self.InvoiceLine.invalidate_model(['analytic_distribution'])
+
+        Contribution = self.env['project.statistic.contribution']
+        account_ids = [self.analytic_account.id, other_account.id]
+        Contribution._rebuild_for_accounts(account_ids)
+        totals = Contribution._get_totals(account_ids, ['invoice', 'credit_note', 'bill', 'refund'])
+
+        expected = {
+            (self.analytic_account.id, 'invoice'): 600.0,
+            (self.analytic_account.id, 'credit_note'): -120.0,
+            (self.analytic_account.id, 'bill'): 300.0,
+            (self.analytic_account.id, 'refund'): -60.0,
+            (other_account.id, 'invoice'): 450.0,
+            (other_account.id, 'credit_note'): -80.0,
+            (other_account.id, 'bill'): 200.0,
+            (other_account.id, 'refund'): -40.0,
+        }
+        self.assertEqual(set(totals), set(expected))
+        for key, amount in expected.items():
+            self.assertAlmostEqual(totals[key]['amount_net'], amount, places=2, msg=key)
+            self.assertAlmostEqual(totals[key]['amount_gross'], amount, places=2, msg=key)
+        self.assertEqual(
+            Contribution.search_count([('move_line_id', '=', malformed_line.id)]), 1,
+        )
+
+    def test_27_sales_order_data_batch(self):
+        """Test the batched sales order figures of two projects with several orders in the company currency"""
+        tax = self.env['account.tax'].create({
+            'name': 'Project Statistic VAT 19%',
+            'amount': 19.0,
+            'amount_type': 'percent',
+            'type_tax_use': 'sale',
+        })
+        product = self.env['product.product'].create({'name': 'Consulting', 'type': 'service'})
+        taxed_project = self.project
+        untaxed_project = self.Project.create({'name': 'Untaxed Project'})
+
+        def create_order(project, price_unit, taxes):
+            order = self.env['sale.order'].create({
+                'partner_id': self.partner.id,
+                'project_id': project.id,
+                'order_line': [(0, 0, {
+                    'product_id': product.id,
+                    'product_uom_qty': 1,
+                    'price_unit': price_unit,
+                    'tax_id': [(6, 0, taxes.ids)],
+                })],
+            })
+            order.action_confirm()
+            return order
+
+        taxed_orders = create_order(taxed_project, 1000.0, tax) | create_order(taxed_project, 500.0, tax)
+        untaxed_orders = (
+            create_order(untaxed_project, 300.0, self.env['account.tax'])
+            | create_order(untaxed_project, 200.0, self.env['account.tax'])
+        )
+        # Draft orders are not counted
+        self.env['sale.order'].create({'partner_id': self.partner.id, 'project_id': untaxed_project.id})
+
+        results = (taxed_project | untaxed_project)._get_sales_order_data_batch()
+
+        self.assertTrue(results[taxed_project.id]['has_sales_orders'])
+        self.assertAlmostEqual(results[taxed_project.id]['amount_net'], 1500.0, places=2)
+        self.assertAlmostEqual(sum(taxed_orders.mapped('amount_total')), 1785.0, places=2)
+        self.assertEqual(results[taxed_project.id]['tax_names'], tax.name)
+
+        self.assertTrue(results[untaxed_project.id]['has_sales_orders'])
+        self.assertAlmostEqual(results[untaxed_project.id]['amount_net'], 500.0, places=2)
+        self.assertAlmostEqual(sum(untaxed_orders.mapped('amount_total')), 500.0, places=2)
+        self.assertEqual(results[untaxed_project.id]['tax_names'], '')
+
+    def test_28_index_report(self):
+        """Test that the index report lists every shipped index with its table"""
+        report = {entry['name']: entry for entry in self.Project.get_analytics_index_report()}
+
+        expected_tables = {}
+        for model_name in ('account.move.line', 'account.analytic.line'):
+            model = self.env[model_name]
+            for index in model._get_project_statistic_indexes():
+                expected_tables[index['name']] = model._table
+        self.assertEqual({name: entry['table'] for name, entry in report.items()}, expected_tables)
+        self.assertEqual(report['project_statistic_aml_analytic_distribution_gin']['table'], 'account_move_line')
+        self.assertEqual(report['project_statistic_aal_account_timesheet_idx']['table'], 'account_analytic_line')
+
+        # The account_move_line columns always exist, so init() created these indexes
+        for name in ('project_statistic_aml_analytic_distribution_gin', 'project_statistic_aml_state_move_idx'):
+            self.assertTrue(report[name]['exists'], name)
+            self.assertTrue(report[name]['valid'], name)
+            self.assertTrue(report[name]['size'], name)
+
+    def test_29_rebuild_chunk(self):
+        """Test the chunking and per-chunk rebuild used by the project-statistic-rebuild command"""
+        shared_project = self.Project.create({'name': 'Shared Project', 'account_id': self.analytic_account.id})
+        chunks = self.Project._get_rebuild_chunks(1)
+        chunk = next(chunk for chunk in chunks if self.project.id in chunk)
+        self.assertIn(shared_project.id, chunk)
+        self.assertEqual(sorted(sum(chunks, [])), sorted(self.Project.with_context(active_test=False).search([]).ids))
+
+        invoice = self.Invoice.create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'name': 'Rebuild Item',
+                'quantity': 1,
+                'price_unit': 800.0,
+                'tax_ids': [(5, 0, 0)],
+                'account_id': self.income_account.id,
+                'analytic_distribution': {str(self.analytic_account.id): 100},
+            })],
+        })
+        invoice.action_post()
+        self.env.cr.flush()
+
+        # Lose the ledger and the stored figures, as after a failed upgrade
+        self.env.cr.execute(
+            "DELETE FROM project_statistic_contribution WHERE account_id = %s", [self.analytic_account.id]
+        )
+        self.env.cr.execute(
+            "UPDATE project_project SET customer_invoiced_amount_net = 0 WHERE id = ANY(%s)",
+            [[self.project.id, shared_project.id]],
+        )
+        self.env.invalidate_all()
+
+        line_count = self.Project.browse(chunk)._rebuild_chunk()
+
+        self.assertEqual(line_count, self.env['project.statistic.contribution'].search_count([
+            ('account_id', '=', self.analytic_account.id),
+        ]))
+        self.assertEqual(line_count, 1)
+        for project in self.project | shared_project:
+            self.assertAlmostEqual(project.customer_invoiced_amount_net, 800.0, places=2)
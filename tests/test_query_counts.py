@@ -0,0 +1,272 @@
+import logging
+from contextlib import ExitStack, contextmanager
+from unittest.mock import patch
+
+from odoo.tests import tagged
+from odoo.tests.common import TransactionCase
+
+from .common import SyntheticLedgerGenerator
+
+_logger = logging.getLogger(__name__)
+
+# Dataset sizes the query counts are compared across (5x more projects and lines)
+QUERY_COUNT_SIZES = [
+    {
+        'projects': 2,
+        'employees': 2,
+        'moves': 4,
+        'lines_per_move': 2,
+        'skonto_moves': 2,
+        'timesheets_per_project': 3,
+        'other_costs_per_project': 1,
+        'sale_orders_per_project': 1,
+    },
+    {
+        'projects': 10,
+        'employees': 5,
+        'moves': 20,
+        'lines_per_move': 2,
+        'skonto_moves': 10,
+        'timesheets_per_project': 3,
+        'other_costs_per_project': 1,
+        'sale_orders_per_project': 1,
+    },
+]
+
+# Allowed difference between the query counts of the smallest and the largest
+# dataset. Any per-project or per-line query adds at least 8 on the larger one.
+QUERY_GROWTH_TOLERANCE = 2
+
+
+@tagged('post_install', '-at_install')
+class TestProjectStatisticQueryCounts(TransactionCase):
+    """
+    Query-count regression guards for the public entry points.
+
+    Every entry point is run on datasets of different sizes. The test fails if
+    it exceeds its query budget on any of them, or if its query count grows
+    with the dataset size (N+1 queries per project or per line).
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.datasets = [
+            SyntheticLedgerGenerator(cls.env, seed=index).generate(**size)
+            for index, size in enumerate(QUERY_COUNT_SIZES)
+        ]
+        cls.env.cr.flush()
+
+    def _count_queries(self, func):
+        """
+        Run func with a cold cache, including the commit-time processing of the
+        hooks (precommit), and return its number of SQL queries.
+        """
+        self.env.flush_all()
+        self.env.invalidate_all()
+        before = self.env.cr.sql_log_count
+        func()
+        self.env.flush_all()
+        self.env.cr.flush()
+        return self.env.cr.sql_log_count - before
+
+    def _assert_query_budget(self, name, func, budget):
+        """
+        Assert that func(dataset) stays within budget queries on every dataset
+        and does not need more queries on larger datasets.
+
+        Args:
+            name: Entry point name for the messages
+            func: Callable taking (index, dataset)
+            budget: Maximum number of queries on any dataset
+        """
+        counts = [
+            self._count_queries(lambda: func(index, dataset))
+            for index, dataset in enumerate(self.datasets)
+        ]
+        _logger.info(f"Query counts of {name}: {counts}")
+        self.assertLessEqual(max(counts), budget, f"{name} exceeds its query budget: {counts}")
+        self.assertLessEqual(
+            counts[-1] - counts[0], QUERY_GROWTH_TOLERANCE,
+            f"{name} needs more queries on larger datasets (per-project or per-line queries): {counts}",
+        )
+
+    @contextmanager
+    def _bypass_hooks(self):
+        """
+        Reduce the journal item and analytic line hooks of this module to their
+        super() call: no snapshot, no filtering, no ledger sync, no precommit.
+        Gives the query count of the bare ORM operation (baseline).
+        """
+        with ExitStack() as stack:
+            for model_name in ('account.move.line', 'account.analytic.line'):
+                model_class = self.registry[model_name]
+                stack.enter_context(patch.object(
+                    model_class, '_get_project_statistic_snapshot', lambda self, field_names: None,
+                ))
+                stack.enter_context(patch.object(
+                    model_class, '_trigger_project_analytics_recompute', lambda self, lines, **kwargs: None,
+                ))
+            yield
+
+    def _assert_hook_query_budget(self, name, func, budget):
+        """
+        Assert the query budget of the module's share of a real ORM operation.
+
+        func(dataset, part) runs the operation on one of two equally sized
+        parts of the dataset: part 0 with the hooks active, part 1 with the
+        hooks bypassed (_bypass_hooks()). The difference of both counts is the
+        cost of the hooks, including the commit-time processing.
+
+        Args:
+            name: Operation name for the messages
+            func: Callable taking (dataset, part)
+            budget: Maximum number of hook queries on any dataset
+        """
+        counts = []
+        for dataset in self.datasets:
+            measured = self._count_queries(lambda: func(dataset, 0))
+            with self._bypass_hooks():
+                baseline = self._count_queries(lambda: func(dataset, 1))
+            counts.append(measured - baseline)
+        _logger.info(f"Hook query counts of {name}: {counts}")
+        self.assertLessEqual(max(counts), budget, f"{name} exceeds its query budget: {counts}")
+        self.assertLessEqual(
+            counts[-1] - counts[0], QUERY_GROWTH_TOLERANCE,
+            f"{name} needs more queries on larger datasets (per-project or per-line queries): {counts}",
+        )
+
+    def _split(self, records, part):
+        """Return one of two equally sized halves of records."""
+        half = len(records) // 2
+        return records[half * part:half * (part + 1)]
+
+    def _get_invoices(self, dataset, part):
+        return self._split(dataset['moves'].filtered(lambda move: move.move_type != 'entry'), part)
+
+    def _get_timesheets(self, dataset, part):
+        timesheets = self.env['account.analytic.line'].search(
+            [('project_id', 'in', dataset['projects'].ids)], order='id',
+        )
+        return self._split(timesheets, part)
+
+    def test_01_compute_financial_data(self):
+        """Test that the full compute needs a constant number of queries per batch"""
+        self._assert_query_budget(
+            '_compute_financial_data',
+            lambda index, dataset: dataset['projects']._compute_financial_data(),
+            80,
+        )
+
+    def test_02_compute_financial_data_ledger_synced(self):
+        """Test that the ledger-synced compute needs a constant number of queries per batch"""
+        self._assert_query_budget(
+            '_compute_financial_data (ledger synced)',
+            lambda index, dataset: dataset['projects'].with_context(
+                project_statistic_ledger_synced=True
+            )._compute_financial_data(),
+            50,
+        )
+
+    def test_03_trigger_recompute_for_analytic_accounts(self):
+        """Test that the shared hook helper needs a constant number of queries"""
+        self._assert_query_budget(
+            'trigger_recompute_for_analytic_accounts',
+            lambda index, dataset: self.env['project.project'].trigger_recompute_for_analytic_accounts(
+                dataset['projects'].account_id.ids
+            ),
+            60,
+        )
+
+    def test_04_move_line_hooks(self):
+        """Test that the journal item create/write/unlink hooks and the posting trigger need a constant number of queries"""
+        income = self.env['account.account'].search([('account_type', '=', 'income')], limit=1)
+
+        def create_and_post(dataset, part):
+            invoices = self.env['account.move'].create([{
+                'move_type': 'out_invoice',
+                'partner_id': dataset['moves'][:1].partner_id.id,
+                'invoice_date': '2025-01-15',
+                'invoice_line_ids': [(0, 0, {
+                    'name': 'Query Count Line',
+                    'quantity': 1,
+                    'price_unit': 100.0,
+                    'account_id': income.id,
+                    'analytic_distribution': {str(project.account_id.id): 100},
+                })],
+            } for project in dataset['projects']])
+            invoices.action_post()
+
+        self._assert_hook_query_budget('account.move.line create hook (post)', create_and_post, 60)
+        self._assert_hook_query_budget(
+            'account.move.line write hook',
+            lambda dataset, part: self._get_invoices(dataset, part).invoice_line_ids.write({
+                'analytic_distribution': {str(dataset['projects'][-1].account_id.id): 100},
+            }),
+            60,
+        )
+        self._assert_hook_query_budget(
+            'account.move write trigger (reset to draft)',
+            lambda dataset, part: self._get_invoices(dataset, part).button_draft(),
+            60,
+        )
+        self._assert_hook_query_budget(
+            'account.move.line unlink hook',
+            lambda dataset, part: self._get_invoices(dataset, part).unlink(),
+            60,
+        )
+
+    def test_05_analytic_line_hooks(self):
+        """Test that the analytic line create/write/unlink hooks need a constant number of queries"""
+        self._assert_hook_query_budget(
+            'account.analytic.line create hook',
+            lambda dataset, part: self.env['account.analytic.line'].create([{
+                'name': 'Query Count Timesheet',
+                'project_id': project.id,
+                'employee_id': dataset['employees'][0].id,
+                'unit_amount': 1.0,
+            } for project in dataset['projects']]),
+            60,
+        )
+        self._assert_hook_query_budget(
+            'account.analytic.line write hook',
+            lambda dataset, part: self._get_timesheets(dataset, part).write({'unit_amount': 3.0}),
+            60,
+        )
+        self._assert_hook_query_budget(
+            'account.analytic.line unlink hook',
+            lambda dataset, part: self._get_timesheets(dataset, part).unlink(),
+            60,
+        )
+
+    def test_06_action_view_account_moves(self):
+        """Test that the Account Moves drilldown needs a constant number of queries"""
+        self._assert_query_budget(
+            'action_view_account_moves',
+            lambda index, dataset: self.env['account.move'].search_count(
+                dataset['projects'][0].action_view_account_moves()['domain']
+            ),
+            20,
+        )
+
+    def test_07_refresh_wizard(self):
+        """Test that both refresh wizard modes need a constant number of queries"""
+        Wizard = self.env['refresh.financial.data.wizard']
+        self._assert_query_budget(
+            'refresh wizard (rates)',
+            lambda index, dataset: Wizard.create({
+                'general_hourly_rate': 70.0 + index,
+                'refresh_mode': 'rates',
+            }).action_refresh_data(),
+            40,
+        )
+        self._assert_query_budget(
+            'refresh wizard (full)',
+            lambda index, dataset: (
+                Wizard.with_context(active_ids=dataset['projects'].ids).create({
+                    'refresh_mode': 'full',
+                }).action_refresh_data(),
+                self.env['project.statistic.refresh.job']._cron_run_jobs(),
+            ),
+            150,
+        )
@@ -131,7 +131,26 @@ except Exception as e:
     print(f"   ERROR: {e}")
     print()
 
-# 6. Recommendations
+# 6. Check project_statistic indexes
+print("6. Checking project_statistic indexes...")
+print("-" * 80)
+index_report = []
+try:
+    index_report = env['project.project'].get_analytics_index_report()
+    for index in index_report:
+        if not index['exists']:
+            print(f"   ✗ MISSING: {index['name']} ({index['table']})")
+        elif not index['valid']:
+            print(f"   ✗ INVALID: {index['name']} ({index['table']}) - rebuild with REINDEX")
+        else:
+            print(f"   ✓ {index['name']} ({index['table']}): {index['scans']} scan(s), "
+                  f"{index['tuples_read']} tuple(s) read, size {index['size']}")
+    print()
+except Exception as e:
+    print(f"   ERROR: {e}")
+    print()
+
+# 7. Recommendations
 print("=" * 80)
 print("RECOMMENDATIONS:")
 print("=" * 80)
@@ -146,6 +165,16 @@ if not hasattr(Project, 'analytic_account_id'):
     print("  → Use 'project.account_id' instead")
     print()
 
+if any(not index['exists'] for index in index_report):
+    print("⚠ Some project_statistic indexes are missing!")
+    print("  → Update the module (-u project_statistic) to create them")
+    print()
+
+if any(index['exists'] and not index['scans'] for index in index_report):
+    print("⚠ Some project_statistic indexes have never been scanned")
+    print("  → Run ANALYZE account_move_line; ANALYZE account_analytic_line; and check again")
+    print()
+
 print("✓ Consider using @api.depends() with proper field dependencies instead of empty depends")
 print("✓ Consider using store=False for most fields and compute them on-demand")
 print()
@@ -1 +1,2 @@
 from . import refresh_financial_data_wizard
+from . import project_statistic_export_wizard
@@ -0,0 +1,58 @@
+from odoo import models, fields, api, _
+from odoo.exceptions import ValidationError
+from urllib.parse import urlencode
+
+
+class ProjectStatisticExportWizard(models.TransientModel):
+    _name = 'project.statistic.export.wizard'
+    _description = 'Export Project Statistics'
+
+    file_format = fields.Selection([
+        ('csv', 'CSV'),
+        ('xlsx', 'Excel (XLSX)'),
+        ('parquet', 'Parquet'),
+    ], string='Format',
+        required=True,
+        default='csv',
+        help="CSV and Excel for spreadsheets, Parquet for data warehouses and BI tools "
+             "(requires the Python package pyarrow on the server)."
+    )
+    date_from = fields.Date(
+        string='From',
+        help="Only projects running on or after this date (projects without end date are always included)."
+    )
+    date_to = fields.Date(
+        string='To',
+        help="Only projects starting on or before this date (projects without start date are always included)."
+    )
+    company_ids = fields.Many2many(
+        'res.company',
+        string='Companies',
+        default=lambda self: self.env.companies,
+        help="Only projects of these companies. Empty: all companies you have access to."
+    )
+
+    @api.constrains('date_from', 'date_to')
+    def _check_dates(self):
+        for wizard in self:
+            if wizard.date_from and wizard.date_to and wizard.date_from > wizard.date_to:
+                raise ValidationError(_("The start date must be before the end date."))
+
+    def action_export(self):
+        """
+        Download the export from the streaming controller
+        (/project_statistic/export/<format>, see project.statistic.export).
+        """
+        self.ensure_one()
+        params = {}
+        if self.date_from:
+            params['date_from'] = fields.Date.to_string(self.date_from)
+        if self.date_to:
+            params['date_to'] = fields.Date.to_string(self.date_to)
+        if self.company_ids:
+            params['company_ids'] = ','.join(str(company_id) for company_id in self.company_ids.ids)
+        return {
+            'type': 'ir.actions.act_url',
+            'url': f'/project_statistic/export/{self.file_format}?{urlencode(params)}',
+            'target': 'download',
+        }
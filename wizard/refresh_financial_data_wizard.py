@@ -8,11 +8,7 @@ class RefreshFinancialDataWizard(models.TransientModel):
     general_hourly_rate = fields.Float(
         string='General Hourly Rate (EUR)',
         required=True,
-        default=lambda self: float(
-            self.env['ir.config_parameter'].sudo().get_param(
-                'project_statistic.general_hourly_rate', default='66.0'
-            )
-        ),
+        default=lambda self: self.env['project.statistic.cache']._get_settings()['general_hourly_rate'],
         help="General hourly rate used to calculate adjusted labor costs. "
              "Formula: Total Hours Booked (Adjusted) × General Hourly Rate = Labor Costs (Adjusted)"
     )
@@ -20,26 +16,48 @@ class RefreshFinancialDataWizard(models.TransientModel):
     vendor_bill_surcharge_factor = fields.Float(
         string='Vendor Bill Surcharge Factor',
         required=True,
-        default=lambda self: float(
-            self.env['ir.config_parameter'].sudo().get_param(
-                'project_statistic.vendor_bill_surcharge_factor', default='1.30'
-            )
-        ),
+        default=lambda self: self.env['project.statistic.cache']._get_settings()['vendor_bill_surcharge_factor'],
         help="Surcharge factor applied to vendor bills. "
              "Formula: Adjusted Vendor Bill Amount = Vendor Bills (NET) × Surcharge Factor. "
              "Default: 1.30 (30% surcharge)"
     )
 
+    recompute_mode = fields.Selection([
+        ('sync', 'Synchronous'),
+        ('queue', 'Queued (Cron)'),
+    ], string='Automatic Update Mode',
+        required=True,
+        default=lambda self: self.env['project.statistic.recompute.queue']._get_recompute_mode(),
+        help="How project figures are updated when invoices, bills or timesheets change. "
+             "Synchronous: immediately, inside the user's transaction. "
+             "Queued: the affected projects are queued and updated by a scheduled action "
+             "every few minutes, which keeps posting and imports fast."
+    )
+
+    refresh_mode = fields.Selection([
+        ('rates', 'Apply Rates Only (fast)'),
+        ('full', 'Full Recalculation'),
+    ], string='Refresh Mode',
+        required=True,
+        default='rates',
+        help="Apply Rates Only: re-derives Adjusted Labor Costs, Adjusted Vendor Bills and "
+             "Current P&L from the stored figures of all projects in seconds. "
+             "Full Recalculation: recalculates all financial data of the selected projects "
+             "from the accounting entries."
+    )
+
     def action_refresh_data(self):
         """
         Update the system parameter with the new hourly rate and refresh financial data.
 
-        This method runs synchronously in the user's request context.
-        Cache invalidation ensures we read the latest data from the database.
+        Saving the parameters re-derives the rate dependent fields right away.
+        A full recalculation is handed over to a background refresh job.
         """
         self.ensure_one()
 
         # Update the system parameters
+        # (a changed rate re-derives the rate dependent fields of all projects,
+        # see ir.config_parameter write())
         self.env['ir.config_parameter'].sudo().set_param(
             'project_statistic.general_hourly_rate',
             str(self.general_hourly_rate)
@@ -48,34 +66,47 @@ class RefreshFinancialDataWizard(models.TransientModel):
             'project_statistic.vendor_bill_surcharge_factor',
             str(self.vendor_bill_surcharge_factor)
         )
+        self.env['ir.config_parameter'].sudo().set_param(
+            'project_statistic.recompute_mode',
+            self.recompute_mode
+        )
+
+        if self.refresh_mode == 'rates':
+            # The parameter write above already re-derived the dependent fields
+            # if a rate changed; otherwise they are up to date
+            count = self.env['project.project'].search_count([('data_availability_status', '=', 'available')])
+            return {
+                'type': 'ir.actions.client',
+                'tag': 'display_notification',
+                'params': {
+                    'title': _('Rates Applied'),
+                    'message': _('Adjusted figures have been updated for %s project(s) with hourly rate %.2f EUR and vendor bill surcharge factor %.2f.') % (
+                        count, self.general_hourly_rate, self.vendor_bill_surcharge_factor
+                    ),
+                    'type': 'success',
+                    'sticky': False,
+                    'next': {'type': 'ir.actions.act_window_close'},
+                }
+            }
 
         # Get the active project IDs from context
         active_ids = self.env.context.get('active_ids', [])
-        if active_ids:
-            projects = self.env['project.project'].browse(active_ids)
-        else:
-            # If no specific projects selected, refresh all
-            projects = self.env['project.project'].search([])
-
-        # CRITICAL: Invalidate cache to ensure fresh data
-        # This forces Odoo to read from DB instead of using cached values
-        projects.invalidate_recordset()
+        projects = self.env['project.project'].browse(active_ids) if active_ids else None
 
-        # Trigger recomputation
-        # This happens within the current transaction and will be committed
-        # when the wizard completes successfully
-        projects._compute_financial_data()
+        # Full recalculation runs in the background in committed chunks
+        # (see project.statistic.refresh.job), so it never hits the worker timeout
+        self.env['project.statistic.refresh.job']._start(projects)
 
-        # Show success notification
         return {
             'type': 'ir.actions.client',
             'tag': 'display_notification',
             'params': {
-                'title': _('Financial Data Refreshed'),
-                'message': _('Financial data has been recalculated for %s project(s) with hourly rate %.2f EUR and vendor bill surcharge factor %.2f.') % (
-                    len(projects), self.general_hourly_rate, self.vendor_bill_surcharge_factor
+                'title': _('Financial Data Refresh Started'),
+                'message': _('%s project(s) are recalculated in the background with hourly rate %.2f EUR and vendor bill surcharge factor %.2f. You will be notified when it is done.') % (
+                    len(projects) if projects is not None else _('All'),
+                    self.general_hourly_rate, self.vendor_bill_surcharge_factor
                 ),
-                'type': 'success',
+                'type': 'info',
                 'sticky': False,
                 'next': {'type': 'ir.actions.act_window_close'},
             }